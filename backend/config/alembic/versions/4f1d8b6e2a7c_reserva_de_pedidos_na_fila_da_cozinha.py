@@ -0,0 +1,73 @@
+"""reserva de pedidos na fila da cozinha
+
+Revision ID: 4f1d8b6e2a7c
+Revises: e3a9c5f0d2b8
+Create Date: 2026-10-18 17:05:48.931274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1d8b6e2a7c'
+down_revision: Union[str, None] = 'e3a9c5f0d2b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'tb_fila_pedidos',
+        sa.Column(
+            'data_criacao',
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("timezone('UTC', now())"),
+        ),
+    )
+    op.add_column('tb_fila_pedidos', sa.Column('estacao', sa.String(), nullable=True))
+    op.add_column('tb_fila_pedidos', sa.Column('reservado_ate', sa.DateTime(), nullable=True))
+    op.add_column(
+        'tb_fila_pedidos',
+        sa.Column('tentativas', sa.Integer(), nullable=False, server_default=sa.text('0')),
+    )
+    op.add_column('tb_fila_pedidos', sa.Column('concluido_em', sa.DateTime(), nullable=True))
+
+    # Entradas existentes: idade do pedido e conclusão para o que já saiu da cozinha
+    op.execute(
+        "UPDATE tb_fila_pedidos f SET data_criacao = p.data_criacao "
+        "FROM tb_pedidos p WHERE p.id = f.id AND p.data_criacao IS NOT NULL"
+    )
+    op.execute(
+        "UPDATE tb_fila_pedidos SET concluido_em = timezone('UTC', now()) "
+        "WHERE status IN ('Pronto', 'Finalizado')"
+    )
+
+    # Deve ser idêntico a PRIORIDADE_FILA/STATUS_RESERVAVEIS (fila_pedidos_model.py)
+    op.create_index(
+        'ix_fila_pedidos_reservaveis',
+        'tb_fila_pedidos',
+        [
+            sa.text(
+                "(CASE status WHEN 'Pronto' THEN 1 WHEN 'Em preparação' THEN 2 "
+                "WHEN 'Recebido' THEN 3 WHEN 'Pago' THEN 4 ELSE 5 END)"
+            ),
+            'data_criacao',
+        ],
+        unique=False,
+        postgresql_where=sa.text(
+            "concluido_em IS NULL AND status IN ('Recebido', 'Pago', 'Em preparação')"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_fila_pedidos_reservaveis', table_name='tb_fila_pedidos')
+    op.drop_column('tb_fila_pedidos', 'concluido_em')
+    op.drop_column('tb_fila_pedidos', 'tentativas')
+    op.drop_column('tb_fila_pedidos', 'reservado_ate')
+    op.drop_column('tb_fila_pedidos', 'estacao')
+    op.drop_column('tb_fila_pedidos', 'data_criacao')
@@ -0,0 +1,39 @@
+"""webhooks de pagamento recebidos
+
+Revision ID: 5b8d3f6c0e92
+Revises: 9c2e7a4b1f35
+Create Date: 2026-10-18 20:21:37.118250
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8d3f6c0e92'
+down_revision: Union[str, None] = '9c2e7a4b1f35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tb_webhooks_pagamento',
+        sa.Column('chave', sa.String(length=255), nullable=False),
+        sa.Column('status', sa.String(length=32), nullable=False),
+        sa.Column('pedido_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column(
+            'recebido_em',
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("timezone('UTC', now())"),
+        ),
+        sa.PrimaryKeyConstraint('chave', 'status'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('tb_webhooks_pagamento')
@@ -0,0 +1,59 @@
+"""caixa de entrada dos webhooks de pagamento
+
+Revision ID: 7a3e9d1c5f24
+Revises: 5b8d3f6c0e92
+Create Date: 2026-10-18 21:04:12.503117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7a3e9d1c5f24'
+down_revision: Union[str, None] = '5b8d3f6c0e92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tb_webhooks_pagamento', sa.Column('payload', sa.Text(), nullable=True))
+    # Linhas existentes já foram aplicadas na própria requisição
+    op.add_column(
+        'tb_webhooks_pagamento',
+        sa.Column('estado', sa.String(length=16), nullable=False, server_default='processado'),
+    )
+    op.alter_column('tb_webhooks_pagamento', 'estado', server_default='pendente')
+    op.add_column(
+        'tb_webhooks_pagamento',
+        sa.Column('tentativas', sa.Integer(), nullable=False, server_default=sa.text('0')),
+    )
+    op.add_column(
+        'tb_webhooks_pagamento',
+        sa.Column(
+            'proxima_tentativa',
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("timezone('UTC', now())"),
+        ),
+    )
+    op.add_column('tb_webhooks_pagamento', sa.Column('erro', sa.Text(), nullable=True))
+    op.add_column('tb_webhooks_pagamento', sa.Column('processado_em', sa.DateTime(), nullable=True))
+    op.create_index(
+        'ix_webhooks_pagamento_pendentes',
+        'tb_webhooks_pagamento',
+        ['proxima_tentativa'],
+        postgresql_where=sa.text("estado = 'pendente'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_webhooks_pagamento_pendentes', table_name='tb_webhooks_pagamento')
+    op.drop_column('tb_webhooks_pagamento', 'processado_em')
+    op.drop_column('tb_webhooks_pagamento', 'erro')
+    op.drop_column('tb_webhooks_pagamento', 'proxima_tentativa')
+    op.drop_column('tb_webhooks_pagamento', 'tentativas')
+    op.drop_column('tb_webhooks_pagamento', 'estado')
+    op.drop_column('tb_webhooks_pagamento', 'payload')
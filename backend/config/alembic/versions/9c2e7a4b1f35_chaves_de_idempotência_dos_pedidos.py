@@ -0,0 +1,42 @@
+"""chaves de idempotência dos pedidos
+
+Revision ID: 9c2e7a4b1f35
+Revises: 4f1d8b6e2a7c
+Create Date: 2026-10-18 19:48:12.406731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c2e7a4b1f35'
+down_revision: Union[str, None] = '4f1d8b6e2a7c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tb_chaves_idempotencia',
+        sa.Column('chave', sa.String(length=255), nullable=False),
+        sa.Column('hash_requisicao', sa.String(length=64), nullable=False),
+        sa.Column('resposta', sa.Text(), nullable=True),
+        sa.Column(
+            'criado_em',
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("timezone('UTC', now())"),
+        ),
+        sa.PrimaryKeyConstraint('chave'),
+    )
+    op.create_index(
+        'ix_chaves_idempotencia_criado_em', 'tb_chaves_idempotencia', ['criado_em'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_chaves_idempotencia_criado_em', table_name='tb_chaves_idempotencia')
+    op.drop_table('tb_chaves_idempotencia')
@@ -0,0 +1,37 @@
+"""retenção dos webhooks processados
+
+Revision ID: a8d3c6f1e9b5
+Revises: f6b2d9e4a7c3
+Create Date: 2026-10-19 00:31:45.217390
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8d3c6f1e9b5'
+down_revision: Union[str, None] = 'f6b2d9e4a7c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Remoção das notificações processadas além de WEBHOOK_RETENCAO_HORAS
+    op.create_index(
+        'ix_webhooks_pagamento_processados',
+        'tb_webhooks_pagamento',
+        ['processado_em'],
+        unique=False,
+        postgresql_where=sa.text("estado = 'processado'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_webhooks_pagamento_processados',
+        table_name='tb_webhooks_pagamento',
+        postgresql_where=sa.text("estado = 'processado'"),
+    )
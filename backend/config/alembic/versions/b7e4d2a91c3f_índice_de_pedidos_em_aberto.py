@@ -0,0 +1,35 @@
+"""índice de pedidos em aberto
+
+Revision ID: b7e4d2a91c3f
+Revises: 6d0212687665
+Create Date: 2026-10-18 09:12:40.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4d2a91c3f'
+down_revision: Union[str, None] = '6d0212687665'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Índice parcial usado pelo painel da cozinha (listar_ordenados): só
+    # indexa pedidos não finalizados, mantendo-se pequeno mesmo com milhões
+    # de pedidos finalizados em tb_pedidos.
+    op.create_index(
+        'ix_pedidos_em_aberto_status_data',
+        'tb_pedidos',
+        ['status', 'data_criacao'],
+        unique=False,
+        postgresql_where=sa.text("status <> 'Finalizado'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pedidos_em_aberto_status_data', table_name='tb_pedidos')
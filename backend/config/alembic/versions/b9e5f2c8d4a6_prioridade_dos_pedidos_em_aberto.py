@@ -0,0 +1,41 @@
+"""prioridade dos pedidos em aberto
+
+Revision ID: b9e5f2c8d4a6
+Revises: a8d3c6f1e9b5
+Create Date: 2026-10-19 09:14:52.630418
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b9e5f2c8d4a6'
+down_revision: Union[str, None] = 'a8d3c6f1e9b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Ordem e keyset do painel (listar_ordenados). Deve ser idêntico a
+    # PRIORIDADE_PEDIDO/PEDIDO_EM_ABERTO (pedido_model.py)
+    op.create_index(
+        'ix_pedidos_em_aberto_prioridade',
+        'tb_pedidos',
+        [
+            sa.text(
+                "(CASE status WHEN 'Pronto' THEN 1 WHEN 'Em preparação' THEN 2 "
+                "WHEN 'Recebido' THEN 3 WHEN 'Pago' THEN 4 ELSE 5 END)"
+            ),
+            'data_criacao',
+            'id',
+        ],
+        unique=False,
+        postgresql_where=sa.text("status <> 'Finalizado'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pedidos_em_aberto_prioridade', table_name='tb_pedidos')
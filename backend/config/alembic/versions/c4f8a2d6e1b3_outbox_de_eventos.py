@@ -0,0 +1,51 @@
+"""outbox de eventos
+
+Revision ID: c4f8a2d6e1b3
+Revises: 7a3e9d1c5f24
+Create Date: 2026-10-18 22:10:45.771902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4f8a2d6e1b3'
+down_revision: Union[str, None] = '7a3e9d1c5f24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'tb_outbox',
+        sa.Column('id', sa.BigInteger(), sa.Identity(always=True), nullable=False),
+        sa.Column('agregado', sa.String(length=32), nullable=False),
+        sa.Column('agregado_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('tipo', sa.String(length=64), nullable=False),
+        sa.Column('dados', sa.Text(), nullable=False),
+        sa.Column(
+            'criado_em',
+            sa.DateTime(),
+            nullable=False,
+            server_default=sa.text("timezone('UTC', now())"),
+        ),
+        sa.Column('publicado_em', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(
+        'ix_outbox_nao_publicados',
+        'tb_outbox',
+        ['id'],
+        postgresql_where=sa.text('publicado_em IS NULL'),
+    )
+    op.create_index('ix_outbox_publicado_em', 'tb_outbox', ['publicado_em'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_publicado_em', table_name='tb_outbox')
+    op.drop_index('ix_outbox_nao_publicados', table_name='tb_outbox')
+    op.drop_table('tb_outbox')
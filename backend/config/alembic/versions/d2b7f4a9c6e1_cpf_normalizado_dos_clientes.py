@@ -0,0 +1,69 @@
+"""cpf normalizado dos clientes
+
+Revision ID: d2b7f4a9c6e1
+Revises: c4f8a2d6e1b3
+Create Date: 2026-10-18 22:41:08.336914
+
+CPFs passam a ser gravados só com os 11 dígitos. Clientes cujo CPF
+normalizado coincide com o de outro (ex.: "123.456.789-00" e "12345678900")
+mantêm o cadastro e os pedidos, mas só um deles fica com o CPF: o que já
+estava sem formatação, ou o de menor id. CPFs sem 11 dígitos são apagados.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b7f4a9c6e1'
+down_revision: Union[str, None] = 'c4f8a2d6e1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        WITH normalizados AS (
+            SELECT id, cpf, regexp_replace(cpf, '[^0-9]', '', 'g') AS digitos
+            FROM tb_clientes
+            WHERE cpf IS NOT NULL
+        ), ordenados AS (
+            SELECT id, digitos,
+                   row_number() OVER (PARTITION BY digitos ORDER BY (cpf = digitos) DESC, id) AS posicao
+            FROM normalizados
+        )
+        UPDATE tb_clientes c
+        SET cpf = NULL
+        FROM ordenados o
+        WHERE c.id = o.id AND (o.posicao > 1 OR length(o.digitos) <> 11)
+        """
+    )
+    op.execute(
+        """
+        UPDATE tb_clientes
+        SET cpf = regexp_replace(cpf, '[^0-9]', '', 'g')
+        WHERE cpf IS NOT NULL AND cpf <> regexp_replace(cpf, '[^0-9]', '', 'g')
+        """
+    )
+    # O índice único (tb_clientes_cpf_key) é reconstruído sobre o novo tipo
+    op.alter_column(
+        'tb_clientes',
+        'cpf',
+        type_=sa.CHAR(length=11),
+        existing_nullable=True,
+        postgresql_using='cpf::char(11)',
+    )
+    op.create_check_constraint('ck_clientes_cpf_digitos', 'tb_clientes', "cpf ~ '^[0-9]{11}$'")
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_clientes_cpf_digitos', 'tb_clientes', type_='check')
+    op.alter_column(
+        'tb_clientes',
+        'cpf',
+        type_=sa.String(),
+        existing_nullable=True,
+        postgresql_using='cpf::varchar',
+    )
@@ -0,0 +1,54 @@
+"""versão de alteração dos pedidos
+
+Revision ID: e3a9c5f0d2b8
+Revises: b7e4d2a91c3f
+Create Date: 2026-10-18 15:40:12.504117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a9c5f0d2b8'
+down_revision: Union[str, None] = 'b7e4d2a91c3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # xid da última transação que alterou o pedido, usado pelo delta
+    # GET /v1/api/admin/pedidos/changes (requer Postgres 13+).
+    op.add_column(
+        'tb_pedidos',
+        sa.Column(
+            'versao',
+            sa.BigInteger(),
+            nullable=False,
+            server_default=sa.text('(pg_current_xact_id()::text::bigint)'),
+        ),
+    )
+    op.create_index('ix_pedidos_versao', 'tb_pedidos', ['versao', 'id'], unique=False)
+
+    op.create_table(
+        'tb_pedidos_removidos',
+        sa.Column('pedido_id', sa.UUID(), nullable=False),
+        sa.Column(
+            'versao',
+            sa.BigInteger(),
+            nullable=False,
+            server_default=sa.text('(pg_current_xact_id()::text::bigint)'),
+        ),
+        sa.Column('removido_em', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('pedido_id'),
+    )
+    op.create_index('ix_pedidos_removidos_versao', 'tb_pedidos_removidos', ['versao'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_pedidos_removidos_versao', table_name='tb_pedidos_removidos')
+    op.drop_table('tb_pedidos_removidos')
+    op.drop_index('ix_pedidos_versao', table_name='tb_pedidos')
+    op.drop_column('tb_pedidos', 'versao')
@@ -0,0 +1,45 @@
+"""versão de publicação do outbox
+
+Revision ID: f6b2d9e4a7c3
+Revises: d2b7f4a9c6e1
+Create Date: 2026-10-18 23:52:17.804215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b2d9e4a7c3'
+down_revision: Union[str, None] = 'd2b7f4a9c6e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # xid da transação do relay que publicou a mensagem, para que quem
+    # consome o NOTIFY recupere o que perdeu sem depender da ordem dos ids
+    # (requer Postgres 13+).
+    op.add_column(
+        'tb_outbox',
+        sa.Column(
+            'versao',
+            sa.BigInteger(),
+            nullable=False,
+            server_default=sa.text('(pg_current_xact_id()::text::bigint)'),
+        ),
+    )
+    op.create_index(
+        'ix_outbox_versao',
+        'tb_outbox',
+        ['versao', 'id'],
+        unique=False,
+        postgresql_where=sa.text('publicado_em IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_versao', table_name='tb_outbox', postgresql_where=sa.text('publicado_em IS NOT NULL'))
+    op.drop_column('tb_outbox', 'versao')
@@ -1,9 +1,13 @@
 from . import cliente_controller
+from . import diagnostico_controller
+from . import fila_controller
 from . import pedido_controller
 from . import produto_controller
 
 __all__ = [
     "cliente_controller",
+    "diagnostico_controller",
+    "fila_controller",
     "pedido_controller", 
     "produto_controller",
 ]
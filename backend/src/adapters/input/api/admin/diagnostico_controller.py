@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends
+
+from src.adapters.input.api.dependencies import metricas_cache_clientes
+from src.adapters.input.api.security.jwt_handler import get_current_admin
+from src.infrastructure.db import session as db_session
+from src.infrastructure.db.pool import pool_status
+
+# Estado interno do processo: só para administradores, fora da documentação
+router = APIRouter(
+    prefix="/internal",
+    tags=["Diagnóstico"],
+    dependencies=[Depends(get_current_admin)],
+    include_in_schema=False,
+)
+
+
+@router.get("/db-pool")
+def db_pool_status():
+    """Ocupação dos pools de conexão deste processo (multiplique pelas réplicas)"""
+    return {
+        "sync": pool_status(db_session.engine),
+        "async": pool_status(db_session.async_engine),
+    }
+
+
+@router.get("/cache-clientes")
+def cache_clientes_status():
+    """Acertos e faltas do cache de clientes deste processo"""
+    return metricas_cache_clientes.snapshot()
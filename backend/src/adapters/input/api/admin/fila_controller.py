@@ -0,0 +1,67 @@
+from datetime import timedelta
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Response
+
+from src.adapters.input.api.dependencies import get_db_executor, get_pedido_service
+from src.adapters.input.dto.pedido_dto import (
+    EstacaoFilaDTO,
+    PedidoReservadoResponse,
+    PedidoResponse,
+    RenovarReservaDTO,
+    ReservarPedidosDTO,
+)
+from src.application.services.pedido_service import PedidoService
+from src.infrastructure.db.session import DatabaseExecutor
+from src.adapters.input.api.security.jwt_handler import get_current_admin
+
+router = APIRouter(prefix="/v1/api/admin/fila", tags=["Fila da cozinha"], dependencies=[Depends(get_current_admin)])
+
+@router.post("/reservar", response_model=list[PedidoReservadoResponse], summary="Reservar próximos pedidos")
+async def reservar_pedidos(
+    dto: ReservarPedidosDTO,
+    service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
+):
+    """Reserva até ``quantidade`` pedidos para a estação, por prioridade e idade.
+
+    A lista vem vazia quando não há trabalho livre. Renove a reserva antes de
+    ``reservado_ate`` ou o pedido volta para a fila.
+    """
+    return await db.run(
+        service.reservar_pedidos, dto.estacao, dto.quantidade, timedelta(seconds=dto.duracao_segundos)
+    )
+
+@router.post("/{pedido_id}/renovar", summary="Renovar reserva do pedido")
+async def renovar_reserva(
+    pedido_id: UUID,
+    dto: RenovarReservaDTO,
+    service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
+):
+    """Estende a reserva da estação; 409 se ela já foi tomada por outra"""
+    reservado_ate = await db.run(
+        service.renovar_reserva, pedido_id, dto.estacao, timedelta(seconds=dto.duracao_segundos)
+    )
+    return {"pedido_id": pedido_id, "reservado_ate": reservado_ate}
+
+@router.post("/{pedido_id}/liberar", status_code=204, summary="Devolver pedido à fila")
+async def liberar_reserva(
+    pedido_id: UUID,
+    dto: EstacaoFilaDTO,
+    service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
+):
+    """Libera a reserva para outra estação"""
+    await db.run(service.liberar_reserva, pedido_id, dto.estacao)
+    return Response(status_code=204)
+
+@router.post("/{pedido_id}/concluir", response_model=PedidoResponse, summary="Concluir pedido reservado")
+async def concluir_pedido(
+    pedido_id: UUID,
+    dto: EstacaoFilaDTO,
+    service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
+):
+    """Confirma o preparo: o pedido sai da fila e fica "Pronto" """
+    return await db.run(service.concluir_pedido_reservado, pedido_id, dto.estacao)
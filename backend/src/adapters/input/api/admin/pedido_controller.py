@@ -1,51 +1,68 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends
-
-from src.adapters.input.api.dependencies import (
-    get_fila_repository,
-    get_pedido_repository,
-    get_pedido_service,
-)
-from src.adapters.input.dto.pedido_dto import AtualizarStatusPedidoDTO, PedidoResponse
+from fastapi import APIRouter, Depends, Query
+
+from src.adapters.input.api.dependencies import get_db_executor, get_pedido_service
+from src.adapters.input.dto.pedido_dto import AlteracoesPedidosResponse, AtualizarStatusPedidoDTO, PaginaPedidosResponse, PedidoResponse
 from src.application.services.pedido_service import PedidoService
-from src.ports.repositories.fila_pedidos_repository_port import (
-    FilaPedidosRepositoryPort,
-)
-from src.ports.repositories.pedido_repository_port import PedidoRepositoryPort
+from src.constants import Defaults
+from src.infrastructure.db.session import DatabaseExecutor
 from src.adapters.input.api.security.jwt_handler import get_current_admin 
 
 router = APIRouter(prefix="/v1/api/admin/pedidos", tags=["Painel administrativo de Pedidos"], dependencies=[Depends(get_current_admin)])
 
-@router.get("/", response_model=list[PedidoResponse], summary="Listar todos os pedidos ordenados")
-def listar_pedidos_ordenados(service: PedidoService = Depends(get_pedido_service)):
-    """Lista pedidos ordenados por: Pronto > Em Preparação > Recebido, e por data (mais antigos primeiro)"""
-    return service.listar_pedidos_ordenados()
+@router.get("/", response_model=PaginaPedidosResponse, summary="Listar todos os pedidos ordenados")
+async def listar_pedidos_ordenados(
+    limite: int = Query(Defaults.DEFAULT_PAGE_SIZE, ge=1, le=Defaults.MAX_PAGE_SIZE),
+    cursor: str | None = Query(None, description="Cursor da próxima página"),
+    service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
+):
+    """Lista pedidos ordenados por: Pronto > Em Preparação > Recebido, e por data (mais antigos primeiro).
+
+    A resposta é paginada por cursor: repita a chamada com ``proximo_cursor``
+    até que ele venha nulo.
+    """
+    return await db.run(service.listar_pedidos_ordenados_paginado, limite, cursor)
+
+@router.get("/changes", response_model=AlteracoesPedidosResponse, summary="Pedidos alterados desde um cursor")
+async def listar_alteracoes(
+    since: str | None = Query(None, description="proximo_cursor da chamada anterior; vazio na carga inicial"),
+    limite: int = Query(Defaults.MAX_PAGE_SIZE, ge=1, le=Defaults.MAX_PAGE_SIZE),
+    service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
+):
+    """Delta do painel: só os pedidos criados/alterados e os removidos após ``since``.
+
+    Guarde ``proximo_cursor`` para a próxima chamada; se ``tem_mais`` vier
+    verdadeiro, chame de novo imediatamente. Um pedido pode reaparecer em
+    chamadas seguidas: aplique como atualização.
+    """
+    return await db.run(service.listar_alteracoes, limite, since)
 
 @router.get("/em-aberto", response_model=list[PedidoResponse], summary="Listar pedidos em aberto")
-def listar_pedidos_em_aberto(
-    fila_repo: FilaPedidosRepositoryPort = Depends(get_fila_repository),
-    pedido_repo: PedidoRepositoryPort = Depends(get_pedido_repository),
+async def listar_pedidos_em_aberto(
+    service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
 ):
     """Lista pedidos em aberto (não finalizados)"""
-    fila = fila_repo.listar_em_aberto()
-    pedidos = []
-    for f in fila:
-        pedido = pedido_repo.buscar_por_id(f.id)
-        if pedido:
-            pedidos.append(pedido)
-    return pedidos
+    return await db.run(service.listar_pedidos_em_aberto)
 
 @router.patch("/{pedido_id}/status", response_model=PedidoResponse, summary="Atualizar status do pedido")
-def atualizar_status_pedido(
+async def atualizar_status_pedido(
     pedido_id: UUID,
     dto: AtualizarStatusPedidoDTO,
     service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
 ):
     """Atualiza o status do pedido para a cozinha"""
-    return service.atualizar_status_pedido(pedido_id, dto.status)
+    return await db.run(service.atualizar_status_pedido, pedido_id, dto.status)
 
 @router.delete("/{pedido_id}", status_code=204, summary="Deletar pedido")
-def deletar_pedido(pedido_id: UUID, service: PedidoService = Depends(get_pedido_service)):
+async def deletar_pedido(
+    pedido_id: UUID,
+    service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
+):
     """Deleta um pedido específico"""
-    service.deletar_pedido(pedido_id)
+    await db.run(service.deletar_pedido, pedido_id)
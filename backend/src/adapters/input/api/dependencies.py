@@ -1,79 +1,167 @@
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
+from src.adapters.output.repositories.chave_idempotencia_repository import ChaveIdempotenciaRepository
 from src.adapters.output.repositories.cliente_repository import ClienteRepository
+from src.adapters.output.repositories.cliente_repository_cache import ClienteRepositoryCache
 from src.adapters.output.repositories.fila_pedidos_repository import FilaPedidosRepository
+from src.adapters.output.repositories.outbox_repository import OutboxRepository
 from src.adapters.output.repositories.pagamento_repository import PagamentoRepository
 from src.adapters.output.repositories.pedido_repository import PedidoRepository
 from src.adapters.output.repositories.produto_repository import ProdutoRepository
+from src.adapters.output.repositories.unit_of_work import UnitOfWork
+from src.adapters.output.repositories.webhook_pagamento_repository import WebhookPagamentoRepository
 
 from src.application.services.cliente_service import ClienteService
 from src.application.services.pagamento_service import PagamentoService
 from src.application.services.pedido_service import PedidoService
 from src.application.services.produto_service import ProdutoService
 
-from src.infrastructure.db.session import get_db
+from src.config import settings
+from src.constants import Defaults
+from src.domain.models.chave_idempotencia import ChaveIdempotencia
+from src.domain.models.cliente import Cliente
+from src.infrastructure.cache.catalogo_cache import catalogo_cache
+from src.infrastructure.cache.escritas_pendentes import EscritasPendentes
+from src.infrastructure.cache.lru import CacheLRU
+from src.infrastructure.cache.metricas import MetricasCache
+from src.infrastructure.cache.painel_pedidos import painel_pedidos
+from src.infrastructure.eventos.barramento import BarramentoEventos, barramento_eventos
+from src.infrastructure.eventos.notificacao import PgNotifyPublicador
+from src.infrastructure.db.session import DatabaseExecutor, get_async_db, get_db
 
 from src.ports.repositories.cliente_repository_port import ClienteRepositoryPort
 from src.ports.repositories.fila_pedidos_repository_port import FilaPedidosRepositoryPort
 from src.ports.repositories.pagamento_repository_port import PagamentoRepositoryPort
 from src.ports.repositories.pedido_repository_port import PedidoRepositoryPort
 from src.ports.repositories.produto_repository_port import ProdutoRepositoryPort
+from src.ports.repositories.unit_of_work_port import UnitOfWorkPort
 from src.ports.services.cliente_service_port import ClienteServicePort
 from src.ports.services.pagamento_service_port import PagamentoServicePort
 from src.ports.services.produto_service_port import ProdutoServicePort
 
+# Respostas de Idempotency-Key recentes deste processo (a tabela é a fonte)
+respostas_idempotentes: CacheLRU[ChaveIdempotencia] = CacheLRU(
+    settings.IDEMPOTENCIA_CACHE_TAMANHO, Defaults.IDEMPOTENCIA_VALIDADE_HORAS * 3600
+)
+
+# Clientes já buscados neste processo, e buscas sem resultado
+clientes_encontrados: CacheLRU[Cliente] = CacheLRU(settings.CLIENTE_CACHE_TAMANHO, settings.CLIENTE_CACHE_TTL)
+clientes_ausentes: CacheLRU[bool] = CacheLRU(settings.CLIENTE_CACHE_TAMANHO, settings.CLIENTE_CACHE_TTL_AUSENTE)
+metricas_cache_clientes = MetricasCache()
+escritas_clientes = EscritasPendentes()
+
 
 def get_db_session() -> Session:
     return Depends(get_db)
 
 
-def get_cliente_repository(db: Session = Depends(get_db)) -> ClienteRepositoryPort:
-    return ClienteRepository(db)
+async def _get_async_db_executor(async_db=Depends(get_async_db)) -> DatabaseExecutor:
+    return DatabaseExecutor(async_db.sync_session, async_db)
+
+
+async def _get_sync_db_executor(db: Session = Depends(get_db)) -> DatabaseExecutor:
+    return DatabaseExecutor(db)
+
+
+# Os controllers executam os casos de uso por meio deste executor; o modo
+# (threadpool ou AsyncEngine) é escolhido por DATABASE_ASYNC.
+get_db_executor = _get_async_db_executor if settings.DATABASE_ASYNC else _get_sync_db_executor
+
+
+async def get_session(executor: DatabaseExecutor = Depends(get_db_executor)) -> Session:
+    return executor.session
+
+
+def _cliente_repository(db: Session, unit_of_work: UnitOfWorkPort) -> ClienteRepositoryPort:
+    if settings.CLIENTE_CACHE_TAMANHO <= 0:
+        return ClienteRepository(db)
+    return ClienteRepositoryCache(
+        ClienteRepository(db),
+        clientes_encontrados,
+        clientes_ausentes,
+        metricas_cache_clientes,
+        escritas_clientes,
+        unit_of_work,
+    )
+
+
+async def get_cliente_repository(db: Session = Depends(get_session)) -> ClienteRepositoryPort:
+    return _cliente_repository(db, _unit_of_work(db))
 
 
-def get_produto_repository(db: Session = Depends(get_db)) -> ProdutoRepositoryPort:
+async def get_produto_repository(db: Session = Depends(get_session)) -> ProdutoRepositoryPort:
     return ProdutoRepository(db)
 
 
-def get_pagamento_repository(db: Session = Depends(get_db)) -> PagamentoRepositoryPort:
+async def get_pagamento_repository(db: Session = Depends(get_session)) -> PagamentoRepositoryPort:
     return PagamentoRepository(db)
 
 
-def get_pedido_repository(db: Session = Depends(get_db)) -> PedidoRepositoryPort:
+async def get_pedido_repository(db: Session = Depends(get_session)) -> PedidoRepositoryPort:
     return PedidoRepository(db)
 
 
-def get_fila_repository(db: Session = Depends(get_db)) -> FilaPedidosRepositoryPort:
+async def get_fila_repository(db: Session = Depends(get_session)) -> FilaPedidosRepositoryPort:
     return FilaPedidosRepository(db)
 
 
-def get_cliente_service(db: Session = Depends(get_db)) -> ClienteServicePort:
-    cliente_repository = ClienteRepository(db)
-    return ClienteService(cliente_repository)
+def get_barramento_eventos() -> BarramentoEventos:
+    return barramento_eventos
+
+
+def _unit_of_work(db: Session) -> UnitOfWork:
+    return UnitOfWork(db, PgNotifyPublicador(db), OutboxRepository(db))
+
+
+async def get_unit_of_work(db: Session = Depends(get_session)) -> UnitOfWorkPort:
+    return _unit_of_work(db)
+
 
+# Os serviços abaixo recebem repositórios e unit of work construídos sobre a
+# mesma sessão, de modo que todas as escritas de um caso de uso compartilham
+# uma única transação, confirmada uma vez pelo próprio serviço.
 
-def get_produto_service(db: Session = Depends(get_db)) -> ProdutoServicePort:
+async def get_cliente_service(db: Session = Depends(get_session)) -> ClienteServicePort:
+    unit_of_work = _unit_of_work(db)
+    cliente_repository = _cliente_repository(db, unit_of_work)
+    return ClienteService(cliente_repository, unit_of_work)
+
+
+async def get_produto_service(db: Session = Depends(get_session)) -> ProdutoServicePort:
     produto_repository = ProdutoRepository(db)
-    return ProdutoService(produto_repository)
+    return ProdutoService(produto_repository, _unit_of_work(db), catalogo_cache)
 
 
-def get_pagamento_service(db: Session = Depends(get_db)) -> PagamentoServicePort:
-    pedido_repository = PedidoRepository(db)
-    pagamento_repository = PagamentoRepository(db)
-    return PagamentoService(pedido_repository, pagamento_repository)
+def criar_pagamento_service(db: Session) -> PagamentoService:
+    """Também usado fora de requisições (processadores de webhooks)."""
+    return PagamentoService(
+        PedidoRepository(db),
+        PagamentoRepository(db),
+        _unit_of_work(db),
+        WebhookPagamentoRepository(db),
+    )
+
+
+async def get_pagamento_service(db: Session = Depends(get_session)) -> PagamentoServicePort:
+    return criar_pagamento_service(db)
 
 
-def get_pedido_service(db: Session = Depends(get_db)) -> PedidoService:
+async def get_pedido_service(db: Session = Depends(get_session)) -> PedidoService:
     pedido_repository = PedidoRepository(db)
     fila_repository = FilaPedidosRepository(db)
     produto_repository = ProdutoRepository(db)
-    cliente_repository = ClienteRepository(db)
+    unit_of_work = _unit_of_work(db)
+    cliente_repository = _cliente_repository(db, unit_of_work)
     
     return PedidoService(
         pedido_repository, 
         fila_repository, 
         produto_repository, 
-        cliente_repository
+        cliente_repository,
+        unit_of_work,
+        painel_pedidos,
+        ChaveIdempotenciaRepository(db),
+        respostas_idempotentes,
     )
 
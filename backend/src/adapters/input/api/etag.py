@@ -0,0 +1,40 @@
+import hashlib
+
+from fastapi import Request, Response
+
+
+def calcular_etag(*partes) -> str:
+    """ETag forte derivada das partes que definem a representação."""
+    digest = hashlib.sha256("|".join(str(p) for p in partes).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_corresponde(request: Request, etag: str) -> bool:
+    """Compara com If-None-Match (comparação fraca, como pede a RFC 9110)."""
+    cabecalho = request.headers.get("if-none-match")
+    if not cabecalho:
+        return False
+    if cabecalho.strip() == "*":
+        return True
+    candidatos = (c.strip().removeprefix("W/") for c in cabecalho.split(","))
+    return etag in candidatos
+
+
+def aplicar_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    # Sem max-age: o cliente pode guardar a resposta, mas revalida sempre
+    response.headers["Cache-Control"] = "no-cache"
+
+
+def nao_modificado(etag: str) -> Response:
+    response = Response(status_code=304)
+    aplicar_etag(response, etag)
+    return response
+
+
+def aceita_gzip(request: Request) -> bool:
+    for codificacao in request.headers.get("accept-encoding", "").split(","):
+        nome, _, parametros = codificacao.strip().partition(";")
+        if nome.strip().lower() in ("gzip", "*"):
+            return parametros.replace(" ", "").lower() not in ("q=0", "q=0.0", "q=0.00", "q=0.000")
+    return False
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends
 
-from src.adapters.input.api.dependencies import get_cliente_service
+from src.adapters.input.api.dependencies import get_cliente_service, get_db_executor
 from src.adapters.input.dto.cliente_dto import ClienteCreate, ClienteResponse
+from src.infrastructure.db.session import DatabaseExecutor
 from src.ports.services.cliente_service_port import ClienteServicePort
 
 router = APIRouter(
@@ -10,16 +11,18 @@ router = APIRouter(
 )
 
 @router.post("/", response_model=ClienteResponse, summary="Criar ou obter cliente")
-def criar_ou_obter_cliente(
+async def criar_ou_obter_cliente(
     dto: ClienteCreate,
-    service: ClienteServicePort = Depends(get_cliente_service)
+    service: ClienteServicePort = Depends(get_cliente_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
 ):
-    return service.criar_ou_obter_cliente(dto)
+    return await db.run(service.criar_ou_obter_cliente, dto)
 
 @router.get("/cpf/{cpf}", response_model=ClienteResponse, summary="Buscar cliente por CPF")
-def buscar_cliente_por_cpf(
+async def buscar_cliente_por_cpf(
     cpf: str,
-    service: ClienteServicePort = Depends(get_cliente_service)
+    service: ClienteServicePort = Depends(get_cliente_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
 ):
     """Busca um cliente pelo CPF"""
-    return service.buscar_cliente_por_cpf(cpf)
+    return await db.run(service.buscar_cliente_por_cpf, cpf)
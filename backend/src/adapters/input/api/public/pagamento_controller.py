@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from uuid import UUID
 
-from src.adapters.input.api.dependencies import get_pagamento_service
+from src.adapters.input.api.dependencies import get_db_executor, get_pagamento_service
+from src.adapters.input.api.etag import aplicar_etag, calcular_etag, etag_corresponde, nao_modificado
 from src.adapters.input.dto.pagamento_dto import PagamentoQRCodeResponse, WebhookPagamentoDTO
 from src.application.services.pagamento_service import PagamentoService
+from src.infrastructure.db.session import DatabaseExecutor
 
 router = APIRouter(prefix="/v1/api/public/pagamento", tags=["Painel de Pagamento"])
 
@@ -15,23 +17,40 @@ def gerar_qrcode(
     return service.gerar_qrcode()
 
 @router.get("/status/{pedido_id}", summary="Consultar status de pagamento do pedido")
-def consultar_status_pagamento(
+async def consultar_status_pagamento(
     pedido_id: UUID,
-    service: PagamentoService = Depends(get_pagamento_service)
+    request: Request,
+    response: Response,
+    service: PagamentoService = Depends(get_pagamento_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
 ):
-    """Consulta o status de pagamento de um pedido específico"""
+    """Consulta o status de pagamento de um pedido específico (ETag por pedido + status)"""
+    if request.headers.get("if-none-match"):
+        status = await db.run(service.buscar_status_pagamento, pedido_id)
+        if status is not None:
+            etag = calcular_etag("pagamento", pedido_id, status)
+            if etag_corresponde(request, etag):
+                return nao_modificado(etag)
+
     try:
-        return service.consultar_status_pagamento(pedido_id)
+        pagamento = await db.run(service.consultar_status_pagamento, pedido_id)
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
+    aplicar_etag(response, calcular_etag("pagamento", pedido_id, pagamento.status))
+    return pagamento
 
-@router.post("/webhook", summary="Webhook para confirmação de pagamento")
-def webhook_pagamento(
+@router.post("/webhook", status_code=202, summary="Webhook para confirmação de pagamento")
+async def webhook_pagamento(
     webhook_data: WebhookPagamentoDTO,
-    service: PagamentoService = Depends(get_pagamento_service)
+    service: PagamentoService = Depends(get_pagamento_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
 ):
-    """Webhook para receber confirmação de pagamento aprovado ou recusado"""
+    """Recebe a confirmação de pagamento aprovado ou recusado.
+
+    Responde 202 assim que a notificação é gravada; pagamento e pedido são
+    atualizados em seguida, em segundo plano.
+    """
     try:
-        return service.processar_webhook(webhook_data)
+        return await db.run(service.receber_webhook, webhook_data)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
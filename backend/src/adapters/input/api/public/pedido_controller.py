@@ -1,17 +1,53 @@
+import json
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
-from src.adapters.input.api.dependencies import get_pedido_service
-from src.adapters.input.dto.pedido_dto import PedidoCreate, PedidoResponse, CheckoutPedidoDTO
+from src.adapters.input.api.dependencies import get_barramento_eventos, get_db_executor, get_pedido_service
+from src.adapters.input.api.etag import aplicar_etag, calcular_etag, etag_corresponde, nao_modificado
+from src.adapters.input.dto.pedido_dto import PaginaPedidosResponse, PedidoCreate, PedidoResponse, CheckoutPedidoDTO
 from src.application.services.pedido_service import PedidoService
+from src.constants import Defaults
+from src.domain.models.evento_pedido import EventoPedido
+from src.infrastructure.db.session import DatabaseExecutor
+from src.infrastructure.eventos.barramento import BarramentoEventos
 
 router = APIRouter(prefix="/v1/api/public/pedidos", tags=["Painel de Pedidos"])
 
+# Comentário SSE periódico: mantém a conexão viva em proxies e detecta queda
+INTERVALO_HEARTBEAT = 15.0
+
+
+def _idempotency_key(
+    idempotency_key: str | None = Header(
+        None,
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=Defaults.MAX_IDEMPOTENCY_KEY_LENGTH,
+        description="Identificador único da tentativa; reenvios com o mesmo valor não duplicam o pedido",
+    ),
+) -> str | None:
+    return idempotency_key
+
+
+def _evento_sse(evento: str, dados: dict) -> str:
+    return f"event: {evento}\ndata: {json.dumps(dados)}\n\n"
+
+
+def _dados_evento(evento: EventoPedido) -> dict:
+    return {
+        "pedido_id": str(evento.pedido_id),
+        "status": evento.status.value,
+        "ocorrido_em": evento.ocorrido_em.isoformat(),
+    }
+
 @router.post("/checkout", response_model=PedidoResponse, summary="Checkout do pedido")
-def checkout_pedido(
+async def checkout_pedido(
     checkout_data: CheckoutPedidoDTO,
+    idempotency_key: str | None = Depends(_idempotency_key),
     service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
 ):
     """Endpoint de checkout que recebe os produtos solicitados e retorna a identificação do pedido"""
     # Verificar se cliente_id foi fornecido
@@ -23,28 +59,89 @@ def checkout_pedido(
         cliente_id=checkout_data.cliente_id,
         itens=checkout_data.itens
     )
-    return service.criar_pedido(pedido_create)
+    return await db.run(service.criar_pedido, pedido_create, idempotency_key)
 
 @router.post("/", response_model=PedidoResponse, summary="Cliente cria um pedido")
-def criar_pedido(
+async def criar_pedido(
     pedido: PedidoCreate,
+    idempotency_key: str | None = Depends(_idempotency_key),
     service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
 ):
-    """Cria um novo pedido"""
-    return service.criar_pedido(pedido)
+    """Cria um novo pedido (aceita o cabeçalho ``Idempotency-Key``)"""
+    return await db.run(service.criar_pedido, pedido, idempotency_key)
 
-@router.get("/", response_model=list[PedidoResponse], summary="Listar pedidos públicos")
-def listar_pedidos_publicos(service: PedidoService = Depends(get_pedido_service)):
-    """Lista pedidos para o painel público"""
+@router.get("/", response_model=PaginaPedidosResponse, summary="Listar pedidos públicos")
+async def listar_pedidos_publicos(
+    limite: int = Query(Defaults.DEFAULT_PAGE_SIZE, ge=1, le=Defaults.MAX_PAGE_SIZE),
+    cursor: str | None = Query(None, description="Cursor da próxima página"),
+    service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
+):
+    """Lista pedidos para o painel público, paginados por cursor"""
     try:
-        return service.listar_pedidos_ordenados()
+        return await db.run(service.listar_pedidos_ordenados_paginado, limite, cursor)
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Erro ao listar pedidos públicos: {e}")
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Erro interno do servidor: {str(e)}")
 
+@router.get("/stream", summary="Stream (SSE) de mudanças de status dos pedidos")
+async def stream_pedidos(
+    request: Request,
+    pedido_id: UUID | None = Query(None, description="Acompanhar só este pedido; sem ele, o painel inteiro"),
+    barramento: BarramentoEventos = Depends(get_barramento_eventos),
+):
+    """Envia `status` a cada criação ou transição confirmada e `removido` quando
+    o pedido é apagado. Após `pronto`, o cliente carrega o estado atual;
+    `resync` pede nova carga completa (eventos perdidos)."""
+    assinatura = barramento.assinar(pedido_id)
+
+    async def eventos():
+        try:
+            yield _evento_sse("pronto", {"pedido_id": str(pedido_id) if pedido_id else None})
+            while not await request.is_disconnected():
+                if assinatura.atrasada:
+                    assinatura.descartar_pendentes()
+                    yield _evento_sse("resync", {})
+                    continue
+                evento = await assinatura.proximo(INTERVALO_HEARTBEAT)
+                if evento is not None:
+                    yield _evento_sse("removido" if evento.removido else "status", _dados_evento(evento))
+                elif not assinatura.atrasada:
+                    yield ": ping\n\n"
+        finally:
+            barramento.cancelar(assinatura)
+
+    return StreamingResponse(
+        eventos(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 @router.get("/{pedido_id}", response_model=PedidoResponse, summary="Cliente acompanha status do pedido")
-def buscar_pedido(pedido_id: UUID, service: PedidoService = Depends(get_pedido_service)):
-    """Consulta o status de um pedido específico"""
-    return service.buscar_pedido_por_id(pedido_id)
+async def buscar_pedido(
+    pedido_id: UUID,
+    request: Request,
+    response: Response,
+    service: PedidoService = Depends(get_pedido_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
+):
+    """Consulta o status de um pedido específico (ETag por id + versão).
+
+    A versão muda a cada alteração do pedido, inclusive só nos itens.
+    """
+    if request.headers.get("if-none-match"):
+        versao = await db.run(service.buscar_versao_pedido, pedido_id)
+        if versao is not None:
+            etag = calcular_etag("pedido", pedido_id, versao)
+            if etag_corresponde(request, etag):
+                return nao_modificado(etag)
+
+    pedido, versao = await db.run(service.buscar_pedido_versionado, pedido_id)
+    if versao is not None:
+        aplicar_etag(response, calcular_etag("pedido", pedido_id, versao))
+    return pedido
@@ -1,13 +1,34 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
-from src.adapters.input.api.dependencies import get_produto_service
+from src.adapters.input.api.dependencies import get_db_executor, get_produto_service
+from src.adapters.input.api.etag import aceita_gzip, aplicar_etag, calcular_etag, etag_corresponde, nao_modificado
 from src.adapters.input.dto.produto_dto import ProdutoResponse
+from src.infrastructure.db.session import DatabaseExecutor
 from src.ports.services.produto_service_port import ProdutoServicePort
 
 router = APIRouter(prefix="/v1/api/public/produtos", tags=["Painel de Produtos"])
 
 @router.get("/", response_model=list[ProdutoResponse], summary="Listar produtos disponíveis")
 @router.head("/", summary="Verificar disponibilidade dos produtos")
-def listar_produtos(service: ProdutoServicePort = Depends(get_produto_service)):
-    produtos = service.listar_produtos()
-    return produtos or []
+async def listar_produtos(
+    request: Request,
+    service: ProdutoServicePort = Depends(get_produto_service),
+    db: DatabaseExecutor = Depends(get_db_executor),
+):
+    # O catálogo já vem codificado do cache; nada é validado ou serializado aqui
+    catalogo = await db.run(service.catalogo_serializado)
+    gzip = aceita_gzip(request)
+    # ETag forte por representação: a variante gzip tem a sua
+    etag = calcular_etag("catalogo", catalogo.versao, "gzip" if gzip else "identity")
+    if etag_corresponde(request, etag):
+        return nao_modificado(etag)
+
+    resposta = Response(
+        content=catalogo.json_gzip if gzip else catalogo.json,
+        media_type="application/json",
+    )
+    if gzip:
+        resposta.headers["Content-Encoding"] = "gzip"
+    resposta.headers["Vary"] = "Accept-Encoding"
+    aplicar_etag(resposta, etag)
+    return resposta
@@ -1,8 +1,9 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from src.constants import Defaults
 from src.domain.models.pedido import StatusPedido
 
 
@@ -30,5 +31,42 @@ class PedidoResponse(BaseModel):
     itens: list[ItemPedidoDTO]
 
 
+class PaginaPedidosResponse(BaseModel):
+    itens: list[PedidoResponse]
+    proximo_cursor: str | None = None
+
+
+class AlteracoesPedidosResponse(BaseModel):
+    itens: list[PedidoResponse]
+    removidos: list[UUID]
+    proximo_cursor: str
+    tem_mais: bool = False
+
+
 class AtualizarStatusPedidoDTO(BaseModel):
     status: StatusPedido
+
+
+class ReservarPedidosDTO(BaseModel):
+    estacao: str = Field(..., min_length=1)
+    quantidade: int = Field(1, ge=1, le=Defaults.MAX_FILA_RESERVA_QUANTIDADE)
+    duracao_segundos: int = Field(
+        Defaults.FILA_RESERVA_SEGUNDOS, ge=1, le=Defaults.MAX_FILA_RESERVA_SEGUNDOS
+    )
+
+
+class EstacaoFilaDTO(BaseModel):
+    estacao: str = Field(..., min_length=1)
+
+
+class RenovarReservaDTO(EstacaoFilaDTO):
+    duracao_segundos: int = Field(
+        Defaults.FILA_RESERVA_SEGUNDOS, ge=1, le=Defaults.MAX_FILA_RESERVA_SEGUNDOS
+    )
+
+
+class PedidoReservadoResponse(BaseModel):
+    pedido: PedidoResponse
+    estacao: str
+    reservado_ate: datetime
+    tentativas: int
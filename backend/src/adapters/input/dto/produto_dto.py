@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from decimal import Decimal
 from uuid import UUID
 
@@ -14,3 +15,11 @@ class ProdutoCreate(ProdutoBase):
 
 class ProdutoResponse(ProdutoBase):
     id: UUID
+
+
+@dataclass(frozen=True)
+class CatalogoSerializado:
+    """Catálogo já codificado em JSON (e em gzip), pronto para ir ao cliente."""
+    versao: str
+    json: bytes
+    json_gzip: bytes
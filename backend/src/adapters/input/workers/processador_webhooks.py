@@ -0,0 +1,153 @@
+import logging
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from src.adapters.input.api.dependencies import criar_pagamento_service
+from src.adapters.input.dto.pagamento_dto import WebhookPagamentoDTO
+from src.adapters.output.repositories.webhook_pagamento_repository import WebhookPagamentoRepository
+from src.domain.models.webhook_pagamento import WebhookPagamento
+
+logger = logging.getLogger(__name__)
+
+# Tempo para processar uma notificação reservada antes que outro processador a pegue
+DURACAO_RESERVA = timedelta(seconds=60)
+ESPERA_INICIAL = 2.0
+ESPERA_MAXIMA = 300.0
+# Intervalo, em segundos, da remoção de notificações processadas além da retenção
+INTERVALO_LIMPEZA = 3600
+
+
+class ProcessadorWebhooks:
+    """Threads que esvaziam a caixa de entrada de webhooks de pagamento.
+
+    Cada thread reserva uma notificação por vez (``FOR UPDATE SKIP LOCKED``),
+    logo antes de processá-la numa transação própria via ``PagamentoService``,
+    até ``lote`` por rodada. Uma falha agenda nova tentativa com espera
+    exponencial; após ``max_tentativas`` a notificação fica como ``falhou``
+    (dead-letter). ``acordar`` é chamado pelo NOTIFY de cada nova
+    notificação; sem ele, a caixa é consultada a cada ``intervalo`` segundos.
+    Notificações processadas há mais de ``retencao`` são removidas.
+    """
+
+    def __init__(
+        self,
+        criar_sessao: Callable[[], Session],
+        workers: int,
+        lote: int,
+        max_tentativas: int,
+        retencao: timedelta,
+        intervalo: float = 5.0,
+    ):
+        self.criar_sessao = criar_sessao
+        self.workers = workers
+        self.lote = lote
+        self.max_tentativas = max_tentativas
+        self.retencao = retencao
+        self.intervalo = intervalo
+        self._acordar = threading.Condition()
+        self._sinais = 0
+        self._parar = threading.Event()
+        self._threads: list[threading.Thread] = []
+        self._trava_limpeza = threading.Lock()
+        self._ultima_limpeza = 0.0
+
+    def iniciar(self) -> None:
+        if self._threads:
+            return
+        self._parar.clear()
+        for numero in range(self.workers):
+            thread = threading.Thread(
+                target=self._executar, name=f"webhooks-pagamento-{numero}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def parar(self) -> None:
+        self._parar.set()
+        self.acordar()
+        for thread in self._threads:
+            thread.join(timeout=10)
+        self._threads = []
+
+    def acordar(self) -> None:
+        with self._acordar:
+            self._sinais += 1
+            self._acordar.notify_all()
+
+    def _executar(self) -> None:
+        while not self._parar.is_set():
+            with self._acordar:
+                sinais = self._sinais
+            try:
+                processados = self._processar_lote()
+            except Exception:
+                logger.exception("Falha ao reservar webhooks de pagamento")
+                processados = 0
+            try:
+                self._limpar()
+            except Exception:
+                logger.exception("Falha ao remover webhooks de pagamento processados")
+            if processados < self.lote:
+                # Lote incompleto: a caixa esvaziou; espera aviso ou o intervalo
+                with self._acordar:
+                    if self._sinais == sinais and not self._parar.is_set():
+                        self._acordar.wait(self.intervalo)
+
+    def _processar_lote(self) -> int:
+        # Uma reserva por notificação: reservar o lote de uma vez faria a
+        # reserva das últimas vencer (e contar outra tentativa) antes de o
+        # processamento chegar a elas
+        processados = 0
+        while processados < self.lote and not self._parar.is_set():
+            with self.criar_sessao() as db:
+                webhook = WebhookPagamentoRepository(db).reservar_proxima(DURACAO_RESERVA)
+                db.commit()
+            if webhook is None:
+                break
+            self._processar(webhook)
+            processados += 1
+        return processados
+
+    def _limpar(self) -> None:
+        with self._trava_limpeza:
+            if time.monotonic() - self._ultima_limpeza < INTERVALO_LIMPEZA:
+                return
+            self._ultima_limpeza = time.monotonic()
+        with self.criar_sessao() as db:
+            removidos = WebhookPagamentoRepository(db).remover_processados(datetime.now(UTC) - self.retencao)
+            db.commit()
+        if removidos:
+            logger.info("%d webhook(s) de pagamento processado(s) removido(s)", removidos)
+
+    def _processar(self, webhook: WebhookPagamento) -> None:
+        with self.criar_sessao() as db:
+            try:
+                criar_pagamento_service(db).processar_webhook(
+                    WebhookPagamentoDTO.model_validate_json(webhook.payload)
+                )
+                return
+            except Exception as e:
+                db.rollback()
+                erro = str(e) or type(e).__name__
+
+            if webhook.tentativas >= self.max_tentativas:
+                logger.error(
+                    "Webhook de pagamento %s (%s) falhou %d vezes: %s",
+                    webhook.chave, webhook.status, webhook.tentativas, erro,
+                )
+                nova_tentativa_em = None
+            else:
+                espera = min(ESPERA_INICIAL * 2 ** (webhook.tentativas - 1), ESPERA_MAXIMA)
+                logger.warning(
+                    "Webhook de pagamento %s (%s) falhou; nova tentativa em %.0fs: %s",
+                    webhook.chave, webhook.status, espera, erro,
+                )
+                nova_tentativa_em = timedelta(seconds=espera)
+            WebhookPagamentoRepository(db).registrar_falha(
+                webhook.chave, webhook.status, erro[:1000], nova_tentativa_em
+            )
+            db.commit()
@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from src.adapters.output.repositories.outbox_repository import OutboxRepository
+from src.ports.eventos.destino_outbox_port import DestinoOutboxPort
+
+logger = logging.getLogger(__name__)
+
+# Intervalo, em segundos, da remoção de mensagens publicadas além da retenção
+INTERVALO_LIMPEZA = 3600
+
+
+class RelayOutbox:
+    """Thread que publica as mensagens de ``tb_outbox`` nos destinos.
+
+    Cada lote é lido, entregue a todos os destinos e marcado como publicado
+    numa só transação, sob uma trava que deixa um relay por vez publicando
+    (os demais processos esperam). Se um destino falhar, nada é marcado e o
+    lote é reenviado após ``intervalo`` segundos: entrega "pelo menos uma
+    vez", em ordem de id. ``acordar`` é chamado pelo NOTIFY de cada commit
+    com mensagens novas.
+    """
+
+    def __init__(
+        self,
+        criar_sessao: Callable[[], Session],
+        destinos: list[DestinoOutboxPort],
+        lote: int,
+        retencao: timedelta,
+        intervalo: float = 5.0,
+    ):
+        self.criar_sessao = criar_sessao
+        self.destinos = destinos
+        self.lote = lote
+        self.retencao = retencao
+        self.intervalo = intervalo
+        self._acordar = threading.Condition()
+        self._sinais = 0
+        self._parar = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._ultima_limpeza = 0.0
+
+    def iniciar(self) -> None:
+        if self._thread is not None or not self.destinos:
+            return
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._executar, name="relay-outbox", daemon=True)
+        self._thread.start()
+
+    def parar(self) -> None:
+        self._parar.set()
+        self.acordar()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def acordar(self) -> None:
+        with self._acordar:
+            self._sinais += 1
+            self._acordar.notify_all()
+
+    def _executar(self) -> None:
+        while not self._parar.is_set():
+            with self._acordar:
+                sinais = self._sinais
+            try:
+                publicadas = self._publicar_lote()
+                self._limpar()
+            except Exception:
+                logger.exception("Falha ao publicar mensagens do outbox")
+                self._parar.wait(self.intervalo)
+                continue
+            if publicadas < self.lote:
+                with self._acordar:
+                    if self._sinais == sinais and not self._parar.is_set():
+                        self._acordar.wait(self.intervalo)
+
+    def _publicar_lote(self) -> int:
+        with self.criar_sessao() as db:
+            outbox = OutboxRepository(db)
+            mensagens = outbox.reservar_nao_publicadas(self.lote)
+            if not mensagens:
+                db.rollback()
+                return 0
+            for destino in self.destinos:
+                destino.publicar(mensagens)
+            outbox.marcar_publicadas([mensagem.id for mensagem in mensagens])
+            db.commit()
+        return len(mensagens)
+
+    def _limpar(self) -> None:
+        if time.monotonic() - self._ultima_limpeza < INTERVALO_LIMPEZA:
+            return
+        self._ultima_limpeza = time.monotonic()
+        with self.criar_sessao() as db:
+            removidas = OutboxRepository(db).remover_publicadas(datetime.now(UTC) - self.retencao)
+            db.commit()
+        if removidas:
+            logger.info("%d mensagem(ns) publicada(s) removida(s) do outbox", removidas)
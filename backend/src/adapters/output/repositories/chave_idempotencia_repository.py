@@ -0,0 +1,66 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.domain.models.chave_idempotencia import ChaveIdempotencia
+from src.infrastructure.db.models.chave_idempotencia_model import ChaveIdempotenciaModel
+from src.infrastructure.db.types import AGORA_UTC
+from src.ports.repositories.chave_idempotencia_repository_port import (
+    ChaveIdempotenciaRepositoryPort,
+)
+
+
+class ChaveIdempotenciaRepository(ChaveIdempotenciaRepositoryPort):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def buscar(self, chave: str, criada_desde: datetime) -> ChaveIdempotencia | None:
+        linha = self.db.execute(
+            select(
+                ChaveIdempotenciaModel.chave,
+                ChaveIdempotenciaModel.hash_requisicao,
+                ChaveIdempotenciaModel.resposta,
+                ChaveIdempotenciaModel.criado_em,
+            ).where(
+                ChaveIdempotenciaModel.chave == chave,
+                ChaveIdempotenciaModel.criado_em >= criada_desde,
+            )
+        ).first()
+        if linha is None:
+            return None
+        return ChaveIdempotencia(
+            linha.chave, linha.hash_requisicao, linha.criado_em.replace(tzinfo=UTC), linha.resposta
+        )
+
+    def reservar(self, chave: str, hash_requisicao: str, criada_desde: datetime) -> bool:
+        """Grava a chave na transação atual; False se ela já estiver em uso.
+
+        Uma requisição concorrente com a mesma chave espera no índice único
+        até esta transação terminar, e então recebe False (commit) ou a chave
+        (rollback). Uma chave expirada é reaproveitada.
+        """
+        comando = insert(ChaveIdempotenciaModel).values(chave=chave, hash_requisicao=hash_requisicao)
+        comando = comando.on_conflict_do_update(
+            index_elements=[ChaveIdempotenciaModel.chave],
+            set_={"hash_requisicao": hash_requisicao, "resposta": None, "criado_em": AGORA_UTC},
+            where=ChaveIdempotenciaModel.criado_em < criada_desde,
+        ).returning(ChaveIdempotenciaModel.chave)
+        return self.db.execute(comando).first() is not None
+
+    def registrar_resposta(self, chave: str, resposta: str) -> None:
+        self.db.execute(
+            update(ChaveIdempotenciaModel)
+            .where(ChaveIdempotenciaModel.chave == chave)
+            .values(resposta=resposta)
+            .execution_options(synchronize_session=False)
+        )
+
+    def remover_expiradas(self, criadas_antes: datetime) -> int:
+        resultado = self.db.execute(
+            delete(ChaveIdempotenciaModel)
+            .where(ChaveIdempotenciaModel.criado_em < criadas_antes)
+            .execution_options(synchronize_session=False)
+        )
+        return resultado.rowcount
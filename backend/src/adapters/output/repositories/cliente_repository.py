@@ -1,7 +1,11 @@
 from uuid import UUID
+
+from sqlalchemy import CHAR, String, exists, literal, select, union_all
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, insert
 from sqlalchemy.orm import Session
+
 from src.domain.models.cliente import Cliente
-from src.infrastructure.db.models.cliente_model import ClienteModel
+from src.infrastructure.db.models.cliente_model import CPF_DIGITOS, ClienteModel
 from src.ports.repositories.cliente_repository_port import ClienteRepositoryPort
 
 
@@ -17,9 +21,68 @@ class ClienteRepository(ClienteRepositoryPort):
             email=cliente.email
         )
         self.db.add(cliente_model)
-        self.db.commit()
+        self.db.flush()
+
+    def obter_ou_criar(self, cpf: str | None, email: str | None, novo: Cliente | None) -> Cliente | None:
+        """Cliente com o CPF (ou, na falta dele, o email) dado; se nenhum
+        existir, grava ``novo`` (quando houver). Uma ida ao banco.
+
+        Busca e inserção vão num único comando; ``ON CONFLICT DO NOTHING``
+        cobre as duas chaves únicas. Se outra transação gravar o mesmo CPF ou
+        email no meio do caminho, o comando não enxerga a linha dela e não
+        devolve nada; a segunda execução (novo snapshot) a encontra. None se
+        a disputa se repetir ou se não houver cliente nem ``novo``.
+        """
+        cpf = Cliente.normalizar_cpf(cpf)
+        if cpf is not None and len(cpf) != CPF_DIGITOS:
+            cpf = None  # não corresponde a nenhum CPF gravado
+        if cpf is None and not email and novo is None:
+            return None
+        for _ in range(2 if novo is not None else 1):
+            linha = self.db.execute(self._comando_obter_ou_criar(cpf, email, novo)).first()
+            if linha is not None:
+                return Cliente(id=linha.id, nome=linha.nome, cpf=linha.cpf, email=linha.email)
+        return None
+
+    def _comando_obter_ou_criar(self, cpf: str | None, email: str | None, novo: Cliente | None):
+        tabela = ClienteModel.__table__
+        colunas = (tabela.c.id, tabela.c.nome, tabela.c.cpf, tabela.c.email)
+
+        # Ordem de preferência: CPF, email, recém-criado
+        buscas = []
+        if cpf:
+            buscas.append(select(*colunas, literal(0).label("ordem")).where(tabela.c.cpf == cpf))
+        if email:
+            buscas.append(select(*colunas, literal(1).label("ordem")).where(tabela.c.email == email))
+        if novo is None:
+            candidatos = union_all(*buscas).subquery()
+            return select(candidatos).order_by(candidatos.c.ordem).limit(1)
+
+        valores = select(
+            literal(novo.id, PG_UUID(as_uuid=True)),
+            literal(novo.nome, String),
+            literal(novo.cpf, CHAR(CPF_DIGITOS)),
+            literal(novo.email, String),
+        )
+        if buscas:
+            existentes = union_all(*buscas).cte("existentes")
+            valores = valores.where(~exists(select(existentes.c.id)))
+            buscas = [select(existentes)]
+        inserido = (
+            insert(tabela)
+            .from_select(["id", "nome", "cpf", "email"], valores)
+            .on_conflict_do_nothing()
+            .returning(*colunas, literal(2).label("ordem"))
+            .cte("inserido")
+        )
+        candidatos = union_all(*buscas, select(inserido)).subquery()
+        return select(candidatos).order_by(candidatos.c.ordem).limit(1)
 
     def buscar_por_cpf(self, cpf: str) -> Cliente | None:
+        # Qualquer formatação ("123.456.789-00") vira uma busca no índice único
+        cpf = Cliente.normalizar_cpf(cpf)
+        if cpf is None or len(cpf) != CPF_DIGITOS:
+            return None
         model = self.db.query(ClienteModel).filter_by(cpf=cpf).first()
         return self._to_domain(model) if model else None
 
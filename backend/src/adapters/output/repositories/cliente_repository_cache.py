@@ -0,0 +1,116 @@
+import copy
+from typing import Callable, Hashable
+from uuid import UUID
+
+from src.domain.models.cliente import Cliente
+from src.infrastructure.cache.escritas_pendentes import EscritasPendentes
+from src.infrastructure.cache.metricas import MetricasCache
+from src.ports.cache.cache_lru_port import CacheLRUPort
+from src.ports.repositories.cliente_repository_port import ClienteRepositoryPort
+from src.ports.repositories.unit_of_work_port import UnitOfWorkPort
+
+# Marca de "não existe" guardada no cache de ausentes
+AUSENTE = True
+
+
+class ClienteRepositoryCache(ClienteRepositoryPort):
+    """Buscas de cliente por id, CPF e email servidas de caches do processo.
+
+    Decora o repositório do banco: um cliente encontrado vai para
+    ``encontrados``; uma busca sem resultado vai para ``ausentes`` (TTL
+    curto, pois o cliente pode ser cadastrado por outro processo). Gravações
+    descartam as chaves do cliente nos dois caches antes e de novo depois do
+    fim da transação, sem repovoá-los; enquanto ela está aberta, buscas de
+    outras requisições não guardam o que leram (ainda é o estado anterior).
+    """
+
+    def __init__(
+        self,
+        repositorio: ClienteRepositoryPort,
+        encontrados: CacheLRUPort[Cliente],
+        ausentes: CacheLRUPort[bool],
+        metricas: MetricasCache,
+        escritas: EscritasPendentes,
+        unit_of_work: UnitOfWorkPort,
+    ):
+        self.repositorio = repositorio
+        self.encontrados = encontrados
+        self.ausentes = ausentes
+        self.metricas = metricas
+        self.escritas = escritas
+        self.unit_of_work = unit_of_work
+
+    def buscar_por_id(self, cliente_id: UUID) -> Cliente | None:
+        return self._buscar(("id", cliente_id), lambda: self.repositorio.buscar_por_id(cliente_id))
+
+    def buscar_por_cpf(self, cpf: str) -> Cliente | None:
+        chave = ("cpf", Cliente.normalizar_cpf(cpf))
+        return self._buscar(chave, lambda: self.repositorio.buscar_por_cpf(cpf))
+
+    def buscar_por_email(self, email: str) -> Cliente | None:
+        return self._buscar(("email", email), lambda: self.repositorio.buscar_por_email(email))
+
+    def obter_ou_criar(self, cpf: str | None, email: str | None, novo: Cliente | None) -> Cliente | None:
+        if novo is not None:
+            self._iniciar_escrita(self._chaves(novo))
+        encontrado = self.repositorio.obter_ou_criar(cpf, email, novo)
+        if encontrado is not None:
+            chaves = self._chaves(encontrado)
+            self._descartar(chaves)
+            self.unit_of_work.ao_encerrar(lambda: self._descartar(chaves))
+        return encontrado
+
+    def salvar(self, cliente: Cliente) -> Cliente:
+        self._iniciar_escrita(self._chaves(cliente))
+        return self.repositorio.salvar(cliente)
+
+    def listar(self) -> list[Cliente]:
+        return self.repositorio.listar()
+
+    def _buscar(self, chave: Hashable, carregar: Callable[[], Cliente | None]) -> Cliente | None:
+        cliente = self.encontrados.obter(chave)
+        if cliente is not None:
+            self.metricas.registrar_acerto()
+            # Cópia: o Cliente em cache é compartilhado entre requisições
+            return copy.copy(cliente)
+        if self.ausentes.obter(chave) is not None:
+            self.metricas.registrar_acerto(negativo=True)
+            return None
+
+        self.metricas.registrar_falta()
+        geracao = self.escritas.geracao()
+        cliente = carregar()
+        if cliente is None:
+            if self.escritas.pode_guardar([chave], geracao):
+                self.ausentes.guardar(chave, AUSENTE)
+            return None
+        chaves = self._chaves(cliente)
+        if self.escritas.pode_guardar(chaves, geracao):
+            for chave_cliente in chaves:
+                self.encontrados.guardar(chave_cliente, copy.copy(cliente))
+        return cliente
+
+    def _iniciar_escrita(self, chaves: list[tuple]) -> None:
+        self.metricas.registrar_invalidacao()
+        self.escritas.iniciar(chaves)
+        self._descartar(chaves)
+
+        def encerrar() -> None:
+            self._descartar(chaves)
+            self.escritas.encerrar(chaves)
+
+        self.unit_of_work.ao_encerrar(encerrar)
+
+    def _descartar(self, chaves: list[tuple]) -> None:
+        for chave in chaves:
+            self.encontrados.descartar(chave)
+            self.ausentes.descartar(chave)
+
+    @staticmethod
+    def _chaves(cliente: Cliente) -> list[tuple]:
+        chaves: list[tuple] = [("id", cliente.id)]
+        if cliente.cpf:
+            chaves.append(("cpf", cliente.cpf))
+        if cliente.email:
+            chaves.append(("email", cliente.email))
+        return chaves
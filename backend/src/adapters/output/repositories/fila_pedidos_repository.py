@@ -1,10 +1,18 @@
+from datetime import datetime, timedelta
 from uuid import UUID
 
+from sqlalchemy import case, or_, select, update
 from sqlalchemy.orm import Session
 
 from src.domain.models.fila_pedidos import FilaPedidos
 from src.domain.models.status_pedido import StatusPedido
-from src.infrastructure.db.models.fila_pedidos_model import FilaPedidosModel
+from src.infrastructure.db.models.fila_pedidos_model import (
+    PRIORIDADE_FILA,
+    STATUS_RESERVAVEIS,
+    FilaPedidosModel,
+)
+from src.infrastructure.db.models.pedido_model import PedidoModel
+from src.infrastructure.db.types import AGORA_UTC
 from src.ports.repositories.fila_pedidos_repository_port import (
     FilaPedidosRepositoryPort,
 )
@@ -17,16 +25,138 @@ class FilaPedidosRepository(FilaPedidosRepositoryPort):
     def enfileirar(self, pedido_id: UUID, payload: str | None = None) -> None:
         fila = FilaPedidosModel(id=pedido_id, status=StatusPedido.RECEBIDO.value, payload=payload)
         self.db.add(fila)
-        self.db.commit()
+        self.db.flush()
 
     def atualizar_status(self, pedido_id: UUID, status: str) -> None:
         fila = self.db.query(FilaPedidosModel).filter_by(id=pedido_id).first()
         if fila:
             fila.status = status
-            self.db.commit()
+            self.db.flush()
 
     def listar_em_aberto(self) -> list[FilaPedidos]:
         registros = self.db.query(FilaPedidosModel).filter(
             FilaPedidosModel.status != StatusPedido.FINALIZADO.value
         ).all()
         return [FilaPedidos(id=r.id, status=StatusPedido(r.status), payload=r.payload) for r in registros]
+
+    def reservar(
+        self,
+        estacao: str,
+        quantidade: int,
+        duracao: timedelta,
+        status_preparo: StatusPedido,
+        status_origem: list[StatusPedido],
+    ) -> list[tuple[FilaPedidos, bool]]:
+        """Reserva para ``estacao`` os próximos pedidos por prioridade e idade.
+
+        Um único comando: a CTE escolhe as linhas com ``FOR UPDATE SKIP
+        LOCKED``, então estações concorrentes pegam pedidos diferentes sem
+        esperar umas pelas outras, e reservas vencidas voltam a ser elegíveis.
+        Pedidos em ``status_origem`` passam a ``status_preparo`` no mesmo
+        comando, na fila e em ``tb_pedidos`` (UPDATE condicional, como em
+        ``PedidoRepository.transicionar_status``). Devolve cada reserva, com
+        o status já atualizado, e se o pedido mudou de status.
+        """
+        fila = FilaPedidosModel.__table__
+        pedidos = PedidoModel.__table__
+        origem = [s.value for s in status_origem]
+        disponiveis = (
+            select(fila.c.id, fila.c.status)
+            .where(
+                fila.c.concluido_em.is_(None),
+                fila.c.status.in_([s.value for s in STATUS_RESERVAVEIS]),
+                or_(fila.c.reservado_ate.is_(None), fila.c.reservado_ate < AGORA_UTC),
+            )
+            .order_by(PRIORIDADE_FILA, fila.c.data_criacao)
+            .limit(quantidade)
+            .with_for_update(skip_locked=True)
+            .cte("disponiveis")
+        )
+        preparar = disponiveis.c.status.in_(origem)
+        reservadas = (
+            update(fila)
+            .where(fila.c.id == disponiveis.c.id)
+            .values(
+                estacao=estacao,
+                reservado_ate=AGORA_UTC + duracao,
+                tentativas=fila.c.tentativas + 1,
+                status=case((preparar, status_preparo.value), else_=disponiveis.c.status),
+            )
+            .returning(
+                fila.c.id,
+                fila.c.status,
+                fila.c.estacao,
+                fila.c.reservado_ate,
+                fila.c.tentativas,
+                preparar.label("preparar"),
+            )
+            .cte("reservadas")
+        )
+        preparados = (
+            update(pedidos)
+            .where(
+                pedidos.c.id == reservadas.c.id,
+                reservadas.c.preparar,
+                pedidos.c.status.in_(origem),
+            )
+            .values(status=status_preparo.value)
+            .returning(pedidos.c.id)
+            .cte("preparados")
+        )
+        consulta = select(
+            reservadas.c.id,
+            reservadas.c.status,
+            reservadas.c.estacao,
+            reservadas.c.reservado_ate,
+            reservadas.c.tentativas,
+            preparados.c.id.is_not(None).label("preparado"),
+        ).outerjoin(preparados, preparados.c.id == reservadas.c.id)
+        return [
+            (
+                FilaPedidos(
+                    id=linha.id,
+                    status=StatusPedido(linha.status),
+                    estacao=linha.estacao,
+                    reservado_ate=linha.reservado_ate,
+                    tentativas=linha.tentativas,
+                ),
+                linha.preparado,
+            )
+            for linha in self.db.execute(consulta)
+        ]
+
+    def renovar_reserva(self, pedido_id: UUID, estacao: str, duracao: timedelta) -> datetime | None:
+        return self.db.execute(
+            self._da_estacao(pedido_id, estacao)
+            .values(reservado_ate=AGORA_UTC + duracao)
+            .returning(FilaPedidosModel.reservado_ate)
+        ).scalar_one_or_none()
+
+    def liberar(self, pedido_id: UUID, estacao: str) -> bool:
+        linha = self.db.execute(
+            self._da_estacao(pedido_id, estacao)
+            .values(estacao=None, reservado_ate=None)
+            .returning(FilaPedidosModel.id)
+        ).first()
+        return linha is not None
+
+    def concluir(self, pedido_id: UUID, estacao: str) -> bool:
+        linha = self.db.execute(
+            self._da_estacao(pedido_id, estacao)
+            .values(estacao=None, reservado_ate=None, concluido_em=AGORA_UTC)
+            .returning(FilaPedidosModel.id)
+        ).first()
+        return linha is not None
+
+    def _da_estacao(self, pedido_id: UUID, estacao: str):
+        # Vale mesmo com a reserva vencida, desde que outra estação ainda não
+        # tenha reservado o pedido
+        return (
+            update(FilaPedidosModel)
+            .where(
+                FilaPedidosModel.id == pedido_id,
+                FilaPedidosModel.estacao == estacao,
+                FilaPedidosModel.concluido_em.is_(None),
+            )
+            .execution_options(synchronize_session=False)
+        )
@@ -0,0 +1,94 @@
+import json
+from datetime import datetime
+
+from sqlalchemy import Text, cast, delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from src.domain.models.mensagem_outbox import MensagemOutbox
+from src.infrastructure.db.models.outbox_model import OutboxModel
+from src.infrastructure.db.types import AGORA_UTC, XID_ATUAL
+from src.ports.repositories.outbox_repository_port import OutboxRepositoryPort
+
+# Canal do LISTEN/NOTIFY que acorda o relay quando há mensagens novas
+CANAL_OUTBOX = "outbox"
+
+# pg_advisory_xact_lock: um relay por vez publica, mantendo a ordem dos ids
+TRAVA_RELAY_OUTBOX = 0x0B7B0C5
+
+
+class OutboxRepository(OutboxRepositoryPort):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def adicionar(self, mensagens: list[MensagemOutbox]) -> None:
+        """Grava as mensagens na transação atual e avisa o relay.
+
+        Um único comando: o INSERT de várias linhas e o NOTIFY (entregue só
+        no commit) com o maior id gravado.
+        """
+        if not mensagens:
+            return
+        inseridas = (
+            insert(OutboxModel)
+            .values([
+                {
+                    "agregado": mensagem.agregado,
+                    "agregado_id": mensagem.agregado_id,
+                    "tipo": mensagem.tipo,
+                    "dados": json.dumps(mensagem.dados, separators=(",", ":")),
+                }
+                for mensagem in mensagens
+            ])
+            .returning(OutboxModel.id)
+            .cte("inseridas")
+        )
+        self.db.execute(select(func.pg_notify(CANAL_OUTBOX, cast(func.max(inseridas.c.id), Text))))
+
+    def reservar_nao_publicadas(self, quantidade: int) -> list[MensagemOutbox]:
+        """Próximas mensagens a publicar, em ordem de id.
+
+        Vazio se outro relay estiver publicando: a trava vale até o fim da
+        transação, que deve marcar as mensagens como publicadas.
+        """
+        if not self.db.execute(select(func.pg_try_advisory_xact_lock(TRAVA_RELAY_OUTBOX))).scalar():
+            return []
+        linhas = self.db.execute(
+            select(
+                OutboxModel.id,
+                OutboxModel.agregado,
+                OutboxModel.agregado_id,
+                OutboxModel.tipo,
+                OutboxModel.dados,
+                OutboxModel.criado_em,
+            )
+            .where(OutboxModel.publicado_em.is_(None))
+            .order_by(OutboxModel.id)
+            .limit(quantidade)
+        )
+        return [
+            MensagemOutbox(
+                agregado=linha.agregado,
+                agregado_id=linha.agregado_id,
+                tipo=linha.tipo,
+                dados=json.loads(linha.dados),
+                id=linha.id,
+                criado_em=linha.criado_em,
+            )
+            for linha in linhas
+        ]
+
+    def marcar_publicadas(self, ids: list[int]) -> None:
+        self.db.execute(
+            update(OutboxModel)
+            .where(OutboxModel.id.in_(ids))
+            .values(publicado_em=AGORA_UTC, versao=XID_ATUAL)
+            .execution_options(synchronize_session=False)
+        )
+
+    def remover_publicadas(self, publicadas_antes: datetime) -> int:
+        resultado = self.db.execute(
+            delete(OutboxModel)
+            .where(OutboxModel.publicado_em < publicadas_antes)
+            .execution_options(synchronize_session=False)
+        )
+        return resultado.rowcount
@@ -1,9 +1,11 @@
 from uuid import UUID
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
-from src.domain.models.pagamento import Pagamento
+from src.domain.models.pagamento import STATUS_APROVADO, Pagamento
 from src.infrastructure.db.models.pagamento_model import PagamentoModel
+from src.infrastructure.db.types import AGORA_UTC
 from src.ports.repositories.pagamento_repository_port import PagamentoRepositoryPort
 
 
@@ -27,8 +29,7 @@ class PagamentoRepository(PagamentoRepositoryPort):
             pagamento_model.status = pagamento.status
             pagamento_model.data_confirmacao = pagamento.data_confirmacao
 
-        self.db.commit()
-        self.db.refresh(pagamento_model)
+        self.db.flush()
         return self._converter_para_entidade(pagamento_model)
 
     def buscar_por_pedido_id(self, pedido_id: UUID) -> Pagamento | None:
@@ -37,6 +38,29 @@ class PagamentoRepository(PagamentoRepositoryPort):
             return self._converter_para_entidade(model)
         return None
 
+    def buscar_status_por_pedido_id(self, pedido_id: UUID) -> str | None:
+        return self.db.query(PagamentoModel.status).filter_by(pedido_id=pedido_id).limit(1).scalar()
+
+    def atualizar_status_por_pedido_id(self, pedido_id: UUID, status: str) -> bool:
+        """Atualiza o pagamento do pedido num UPDATE condicional, sem carregá-lo.
+
+        Um pagamento aprovado não muda mais. Retorna False se não houver
+        pagamento a atualizar.
+        """
+        valores = {"status": status}
+        if status == STATUS_APROVADO:
+            valores["data_confirmacao"] = AGORA_UTC
+        resultado = self.db.execute(
+            update(PagamentoModel)
+            .where(
+                PagamentoModel.pedido_id == pedido_id,
+                PagamentoModel.status != STATUS_APROVADO,
+            )
+            .values(**valores)
+            .execution_options(synchronize_session=False)
+        )
+        return resultado.rowcount > 0
+
     def buscar_por_id(self, pagamento_id: UUID) -> Pagamento | None:
         model = self.db.query(PagamentoModel).filter_by(id=pagamento_id).first()
         if model:
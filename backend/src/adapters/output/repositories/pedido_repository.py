@@ -1,12 +1,16 @@
+from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import asc, delete, inspect, select, tuple_, update
 
 from src.domain.models.pedido import ItemPedido, Pedido
 from src.domain.models.status_pedido import StatusPedido
+from src.infrastructure.db.models.fila_pedidos_model import FilaPedidosModel
 from src.infrastructure.db.models.item_pedido_model import ItemPedidoModel
-from src.infrastructure.db.models.pedido_model import PedidoModel
+from src.infrastructure.db.models.pedido_model import PEDIDO_EM_ABERTO, PRIORIDADE_PEDIDO, PedidoModel
+from src.infrastructure.db.models.pedido_removido_model import PedidoRemovidoModel
+from src.infrastructure.db.types import MENOR_XID_EM_ANDAMENTO, XID_ATUAL
 from src.ports.repositories.pedido_repository_port import PedidoRepositoryPort
 
 
@@ -15,7 +19,7 @@ class PedidoRepository(PedidoRepositoryPort):
         self.db = db
 
     def salvar(self, pedido: Pedido) -> Pedido:
-        pedido_model = self.db.query(PedidoModel).filter_by(id=pedido.id).first()
+        pedido_model = self._consultar_pedidos().filter_by(id=pedido.id).first()
 
         if not pedido_model:
             pedido_model = PedidoModel(
@@ -23,75 +27,167 @@ class PedidoRepository(PedidoRepositoryPort):
                 cliente_id=pedido.cliente_id,
                 status=pedido.status,
                 data_criacao=pedido.data_criacao,
+                itens=[
+                    ItemPedidoModel(produto_id=item.produto_id, quantidade=item.quantidade)
+                    for item in pedido.itens
+                ],
             )
             self.db.add(pedido_model)
         else:
-            pedido_model.status = pedido.status
-
-        self.db.query(ItemPedidoModel).filter_by(pedido_id=pedido.id).delete()
-        for item in pedido.itens:
-            item_model = ItemPedidoModel(
-                pedido_id=pedido.id,
-                produto_id=item.produto_id,
-                quantidade=item.quantidade,
-            )
-            self.db.add(item_model)
+            status = StatusPedido(pedido.status).value
+            if pedido_model.status != status:
+                pedido_model.status = status
+            if self._sincronizar_itens(pedido_model, pedido.itens) and pedido_model.status == status:
+                # Só os itens mudaram: o UPDATE de tb_pedidos (e o onupdate de
+                # versao) não aconteceria sozinho
+                pedido_model.versao = XID_ATUAL
 
-        self.db.commit()
-        self.db.refresh(pedido_model)
+        self.db.flush()
         return self._converter_para_entidade(pedido_model)
 
+    def _sincronizar_itens(self, pedido_model: PedidoModel, itens: list[ItemPedido]) -> bool:
+        """Aplica nos itens persistidos apenas a diferença para os itens do pedido.
+
+        Itens inalterados não geram SQL; quantidades alteradas viram UPDATE,
+        itens removidos viram DELETE e os novos são inseridos em lote no flush.
+        Retorna se algum item mudou.
+        """
+        alterou = False
+        desejados = {item.produto_id: item.quantidade for item in itens}
+        for item_model in list(pedido_model.itens):
+            quantidade = desejados.pop(item_model.produto_id, None)
+            if quantidade is None:
+                pedido_model.itens.remove(item_model)
+                alterou = True
+            elif item_model.quantidade != quantidade:
+                item_model.quantidade = quantidade
+                alterou = True
+        pedido_model.itens.extend(
+            ItemPedidoModel(produto_id=produto_id, quantidade=quantidade)
+            for produto_id, quantidade in desejados.items()
+        )
+        return alterou or bool(desejados)
+
     def listar(self) -> list[Pedido]:
-        pedidos_model = self.db.query(PedidoModel).all()
+        pedidos_model = self._consultar_pedidos().all()
         return [self._converter_para_entidade(p) for p in pedidos_model]
 
-    def listar_ordenados(self) -> list[Pedido]:
+    def listar_ordenados(
+        self,
+        limite: int | None = None,
+        apos: tuple[int, datetime, UUID] | None = None,
+    ) -> list[Pedido]:
         """Lista pedidos ordenados conforme regras da Fase 2:
         1. Pronto > Em Preparação > Recebido
         2. Pedidos mais antigos primeiro
         3. Pedidos com status Finalizado não aparecem
+
+        Para paginação por keyset, ``apos`` recebe a posição
+        (prioridade, data_criacao, id) do último pedido da página anterior.
+        """
+        query = (
+            self._consultar_pedidos()
+            .filter(PEDIDO_EM_ABERTO)
+        )
+        if apos is not None:
+            query = query.filter(
+                tuple_(PRIORIDADE_PEDIDO, PedidoModel.data_criacao, PedidoModel.id)
+                > tuple_(*apos)
+            )
+        # Mesma expressão e colunas do índice ix_pedidos_em_aberto_prioridade
+        query = query.order_by(
+            PRIORIDADE_PEDIDO, asc(PedidoModel.data_criacao), asc(PedidoModel.id)
+        )
+        if limite is not None:
+            query = query.limit(limite)
+        return [self._converter_para_entidade(p) for p in query.all()]
+
+    def listar_em_aberto(self) -> list[Pedido]:
+        """Lista os pedidos com entrada em aberto na fila da cozinha.
+
+        Pedido e fila são lidos num único JOIN e os itens em um segundo
+        SELECT em lote, independentemente do tamanho da fila.
         """
-        # Mapeamento de prioridade para ordenação
-        status_priority = {
-            StatusPedido.PRONTO.value: 1,
-            StatusPedido.PREPARANDO.value: 2,
-            StatusPedido.RECEBIDO.value: 3,
-            StatusPedido.PAGO.value: 4,
-        }
-        
-        # Buscar pedidos não finalizados
         pedidos_model = (
-            self.db.query(PedidoModel)
-            .filter(PedidoModel.status != StatusPedido.FINALIZADO.value)
+            self._consultar_pedidos()
+            .join(FilaPedidosModel, FilaPedidosModel.id == PedidoModel.id)
+            .filter(FilaPedidosModel.status != StatusPedido.FINALIZADO.value)
             .order_by(asc(PedidoModel.data_criacao))
             .all()
         )
-        
-        # Converter para entidades
-        pedidos = [self._converter_para_entidade(p) for p in pedidos_model]
-        
-        # Ordenar por prioridade de status e depois por data
-        pedidos.sort(key=lambda x: (status_priority.get(x.status, 999), x.data_criacao))
-        
-        return pedidos
+        return [self._converter_para_entidade(p) for p in pedidos_model]
 
     def buscar_por_id(self, pedido_id: UUID) -> Pedido | None:
-        model = self.db.query(PedidoModel).filter_by(id=pedido_id).first()
+        model = self._consultar_pedidos().filter_by(id=pedido_id).first()
         if model:
             return self._converter_para_entidade(model)
         return None
 
+    def buscar_por_ids(self, pedido_ids: list[UUID]) -> list[Pedido]:
+        if not pedido_ids:
+            return []
+        pedidos_model = self._consultar_pedidos().filter(PedidoModel.id.in_(pedido_ids)).all()
+        return [self._converter_para_entidade(p) for p in pedidos_model]
+
+    def buscar_versao(self, pedido_id: UUID) -> int | None:
+        return self.db.query(PedidoModel.versao).filter_by(id=pedido_id).scalar()
+
     def deletar(self, pedido_id: UUID) -> None:
         self.db.query(ItemPedidoModel).filter_by(pedido_id=pedido_id).delete()
-        self.db.query(PedidoModel).filter_by(id=pedido_id).delete()
-        self.db.commit()
+        if self.db.query(PedidoModel).filter_by(id=pedido_id).delete():
+            # Marca de remoção para o delta de alterações (listar_removidos)
+            self.db.add(PedidoRemovidoModel(pedido_id=pedido_id, removido_em=datetime.now(UTC)))
+        self.db.flush()
+
+    def menor_versao_em_andamento(self) -> int:
+        return self.db.execute(select(MENOR_XID_EM_ANDAMENTO)).scalar_one()
+
+    def listar_alterados(self, desde: int, apos_id: UUID | None, limite: int) -> list[Pedido]:
+        query = self._consultar_pedidos()
+        if apos_id is None:
+            query = query.filter(PedidoModel.versao >= desde)
+        else:
+            query = query.filter(tuple_(PedidoModel.versao, PedidoModel.id) > tuple_(desde, apos_id))
+        models = query.order_by(PedidoModel.versao, PedidoModel.id).limit(limite).all()
+        return [self._converter_para_entidade(model) for model in models]
+
+    def listar_removidos(self, desde: int, apos_id: UUID | None, limite: int) -> list[tuple[int, UUID]]:
+        """(versao, pedido_id) das marcas de remoção, na mesma ordem do delta."""
+        consulta = select(PedidoRemovidoModel.versao, PedidoRemovidoModel.pedido_id)
+        if apos_id is None:
+            consulta = consulta.where(PedidoRemovidoModel.versao >= desde)
+        else:
+            consulta = consulta.where(
+                tuple_(PedidoRemovidoModel.versao, PedidoRemovidoModel.pedido_id) > tuple_(desde, apos_id)
+            )
+        linhas = self.db.execute(
+            consulta.order_by(PedidoRemovidoModel.versao, PedidoRemovidoModel.pedido_id).limit(limite)
+        )
+        return [(linha.versao, linha.pedido_id) for linha in linhas]
+
+    def remover_marcas_de_remocao(self, removidos_antes: datetime) -> int:
+        resultado = self.db.execute(
+            delete(PedidoRemovidoModel)
+            .where(PedidoRemovidoModel.removido_em < removidos_antes)
+            .execution_options(synchronize_session=False)
+        )
+        return resultado.rowcount
 
     def buscar_por_cliente(self, cliente_id: UUID) -> list[Pedido]:
         pedidos_model = (
-            self.db.query(PedidoModel).filter_by(cliente_id=cliente_id).all()
+            self._consultar_pedidos().filter_by(cliente_id=cliente_id).all()
         )
         return [self._converter_para_entidade(p) for p in pedidos_model]
 
+    def _consultar_pedidos(self):
+        """Consulta base de pedidos com os itens carregados em lote.
+
+        O ``selectinload`` busca os itens de todos os pedidos retornados em um
+        único ``SELECT ... WHERE pedido_id IN (...)``, evitando uma consulta
+        por pedido ao percorrer ``model.itens``.
+        """
+        return self.db.query(PedidoModel).options(selectinload(PedidoModel.itens))
+
     def _converter_para_entidade(self, model: PedidoModel) -> Pedido:
         itens = [
             ItemPedido(produto_id=i.produto_id, quantidade=i.quantidade)
@@ -103,6 +199,9 @@ class PedidoRepository(PedidoRepositoryPort):
             status=StatusPedido(model.status),
             data_criacao=model.data_criacao,
             itens=itens,
+            # Só se já carregada: após um flush, versao é uma expressão SQL
+            # cujo valor custaria outro SELECT
+            versao=inspect(model).dict.get("versao"),
         )
 
     def atualizar_status(self, pedido_id: UUID, status: str) -> None:
@@ -110,4 +209,66 @@ class PedidoRepository(PedidoRepositoryPort):
         if not pedido_model:
             raise ValueError("Pedido não encontrado")
         pedido_model.status = status
-        self.db.commit()
+        self.db.flush()
+
+    def transicionar_status(
+        self,
+        pedido_id: UUID,
+        novo_status: StatusPedido,
+        status_origem: list[StatusPedido],
+    ) -> Pedido | None:
+        """Muda o status do pedido e da fila atomicamente, em um único comando.
+
+        O UPDATE só acontece se o status atual estiver em ``status_origem``,
+        então duas mudanças concorrentes não sobrescrevem uma à outra. Pedido
+        e fila são atualizados por CTEs do mesmo comando, que também devolve
+        os itens. Retorna None se o pedido não existir ou se a transição não
+        for permitida a partir do status atual.
+        """
+        pedidos = PedidoModel.__table__
+        pedido_atualizado = (
+            update(pedidos)
+            .where(
+                pedidos.c.id == pedido_id,
+                pedidos.c.status.in_([s.value for s in status_origem]),
+            )
+            .values(status=novo_status.value)
+            .returning(
+                pedidos.c.id, pedidos.c.cliente_id, pedidos.c.status, pedidos.c.data_criacao
+            )
+            .cte("pedido_atualizado")
+        )
+        fila = FilaPedidosModel.__table__
+        fila_atualizada = (
+            update(fila)
+            .where(fila.c.id.in_(select(pedido_atualizado.c.id)))
+            .values(status=novo_status.value)
+            .cte("fila_atualizada")
+        )
+        itens = ItemPedidoModel.__table__
+        consulta = (
+            select(pedido_atualizado, itens.c.produto_id, itens.c.quantidade)
+            .outerjoin(itens, itens.c.pedido_id == pedido_atualizado.c.id)
+            .add_cte(fila_atualizada)
+        )
+        linhas = self.db.execute(consulta).all()
+        if not linhas:
+            return None
+
+        # Instância já carregada nesta sessão ficaria com o status antigo
+        em_memoria = self.db.identity_map.get(self.db.identity_key(PedidoModel, pedido_id))
+        if em_memoria is not None:
+            self.db.expire(em_memoria)
+
+        primeira = linhas[0]
+        return Pedido(
+            id=primeira.id,
+            cliente_id=primeira.cliente_id,
+            status=StatusPedido(primeira.status),
+            data_criacao=primeira.data_criacao,
+            itens=[
+                ItemPedido(produto_id=linha.produto_id, quantidade=linha.quantidade)
+                for linha in linhas
+                if linha.produto_id is not None
+            ],
+        )
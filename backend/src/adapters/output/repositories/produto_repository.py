@@ -1,10 +1,13 @@
 from decimal import Decimal
 import logging
 from typing import Optional
+from uuid import UUID
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from src.domain.models.produto import Produto
+from src.infrastructure.cache.catalogo_cache import CANAL_CATALOGO
 from src.infrastructure.db.models.produto_model import ProdutoModel
 from src.ports.repositories.produto_repository_port import ProdutoRepositoryPort
 
@@ -23,16 +26,25 @@ class ProdutoRepository(ProdutoRepositoryPort):
             logger.error(f"Erro ao buscar produto por ID {produto_id}: {e}")
             raise
 
+    def buscar_por_ids(self, produto_ids: list[UUID]) -> list[Produto]:
+        if not produto_ids:
+            return []
+        try:
+            models = (
+                self.db.query(ProdutoModel)
+                .filter(ProdutoModel.id.in_(set(produto_ids)))
+                .all()
+            )
+            return [self._to_domain(m) for m in models]
+        except Exception as e:
+            logger.error(f"Erro ao buscar produtos por IDs {produto_ids}: {e}")
+            raise
+
     def listar(self) -> list[Produto]:
         try:
-            logger.info("Iniciando listagem de produtos...")
             models = self.db.query(ProdutoModel).all()
-            logger.info(f"Produtos encontrados no banco: {len(models)}")
-            
-            produtos = [self._to_domain(m) for m in models]
-            logger.info(f"Produtos convertidos para domínio: {len(produtos)}")
-            
-            return produtos
+            logger.debug(f"Produtos encontrados no banco: {len(models)}")
+            return [self._to_domain(m) for m in models]
         except Exception as e:
             logger.error(f"Erro ao listar produtos: {e}")
             raise
@@ -45,13 +57,12 @@ class ProdutoRepository(ProdutoRepositoryPort):
                 preco=float(produto.preco),
             )
             self.db.add(model)
-            self.db.commit()
-            self.db.refresh(model)
+            self.db.flush()
+            self._notificar_alteracao()
             produto.id = model.id
             return self._to_domain(model)
         except Exception as e:
             logger.error(f"Erro ao salvar produto: {e}")
-            self.db.rollback()
             raise
 
     def deletar(self, produto_id: int) -> None:
@@ -60,10 +71,10 @@ class ProdutoRepository(ProdutoRepositoryPort):
             if not model:
                 raise ValueError("Produto não encontrado")
             self.db.delete(model)
-            self.db.commit()
+            self.db.flush()
+            self._notificar_alteracao()
         except Exception as e:
             logger.error(f"Erro ao deletar produto {produto_id}: {e}")
-            self.db.rollback()
             raise
 
     def buscar_por_categoria(self, categoria: str) -> list[Produto]:
@@ -74,6 +85,12 @@ class ProdutoRepository(ProdutoRepositoryPort):
             logger.error(f"Erro ao buscar produtos por categoria {categoria}: {e}")
             raise
 
+    def _notificar_alteracao(self) -> None:
+        # O Postgres só entrega o NOTIFY no commit (e o descarta no rollback),
+        # então os outros processos invalidam o cache apenas após a alteração
+        # estar visível.
+        self.db.execute(select(func.pg_notify(CANAL_CATALOGO, "")))
+
     def _to_domain(self, model: ProdutoModel) -> Produto:
         try:
             return Produto(
@@ -0,0 +1,52 @@
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+from src.domain.models.evento_pagamento import EventoPagamento
+from src.domain.models.evento_pedido import EventoPedido
+from src.domain.models.mensagem_outbox import MensagemOutbox
+from src.ports.eventos.publicador_eventos_port import PublicadorEventosPort
+from src.ports.repositories.outbox_repository_port import OutboxRepositoryPort
+from src.ports.repositories.unit_of_work_port import UnitOfWorkPort
+
+
+class UnitOfWork(UnitOfWorkPort):
+    def __init__(
+        self,
+        db: Session,
+        publicador: PublicadorEventosPort | None = None,
+        outbox: OutboxRepositoryPort | None = None,
+    ):
+        self.db = db
+        self.publicador = publicador
+        self.outbox = outbox
+        self._eventos: list[EventoPedido | EventoPagamento] = []
+        self._ao_encerrar: list[Callable[[], None]] = []
+
+    def commit(self) -> None:
+        # Publicados dentro da transação: o publicador (NOTIFY) só entrega
+        # o que for de fato confirmado pelo commit logo abaixo, e o outbox
+        # grava as mensagens junto com as alterações que as produziram
+        eventos, self._eventos = self._eventos, []
+        if self.outbox is not None and eventos:
+            self.outbox.adicionar([MensagemOutbox.de_evento(evento) for evento in eventos])
+        if self.publicador is not None:
+            self.publicador.publicar_lote([evento for evento in eventos if isinstance(evento, EventoPedido)])
+        self.db.commit()
+        self._encerrar()
+
+    def rollback(self) -> None:
+        self._eventos.clear()
+        self.db.rollback()
+        self._encerrar()
+
+    def registrar_evento(self, evento: EventoPedido | EventoPagamento) -> None:
+        self._eventos.append(evento)
+
+    def ao_encerrar(self, acao: Callable[[], None]) -> None:
+        self._ao_encerrar.append(acao)
+
+    def _encerrar(self) -> None:
+        acoes, self._ao_encerrar = self._ao_encerrar, []
+        for acao in acoes:
+            acao()
@@ -0,0 +1,130 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import delete, func, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.domain.models.webhook_pagamento import (
+    ESTADO_FALHOU,
+    ESTADO_PENDENTE,
+    ESTADO_PROCESSADO,
+    WebhookPagamento,
+)
+from src.infrastructure.db.models.webhook_pagamento_model import WebhookPagamentoModel
+from src.infrastructure.db.types import AGORA_UTC
+from src.ports.repositories.webhook_pagamento_repository_port import (
+    WebhookPagamentoRepositoryPort,
+)
+
+# Canal do LISTEN/NOTIFY que acorda os processadores quando chega notificação
+CANAL_WEBHOOKS_PAGAMENTO = "webhooks_pagamento"
+
+
+class WebhookPagamentoRepository(WebhookPagamentoRepositoryPort):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def registrar(self, chave: str, status: str, pedido_id: UUID, payload: str) -> bool:
+        """Guarda a notificação na caixa de entrada; False se já recebida.
+
+        Inserção e aviso aos processadores vão num único comando (o NOTIFY só
+        sai se a linha for nova, e só é entregue no commit).
+        """
+        inserida = (
+            insert(WebhookPagamentoModel)
+            .values(chave=chave, status=status, pedido_id=pedido_id, payload=payload)
+            .on_conflict_do_nothing(index_elements=["chave", "status"])
+            .returning(WebhookPagamentoModel.chave)
+            .cte("inserida")
+        )
+        comando = select(func.pg_notify(CANAL_WEBHOOKS_PAGAMENTO, literal(""))).select_from(inserida)
+        return self.db.execute(comando).first() is not None
+
+    def reservar_proxima(self, duracao: timedelta) -> WebhookPagamento | None:
+        """Reserva a próxima notificação vencida por ``duracao``.
+
+        ``FOR UPDATE SKIP LOCKED`` separa a notificação de cada processador;
+        se o processador cair, ela volta a ficar disponível quando a reserva
+        vencer. Cada reserva conta como uma tentativa: o processador só
+        reserva a notificação que vai processar em seguida.
+        """
+        webhooks = WebhookPagamentoModel.__table__
+        disponivel = (
+            select(webhooks.c.chave, webhooks.c.status)
+            .where(
+                webhooks.c.estado == ESTADO_PENDENTE,
+                webhooks.c.proxima_tentativa <= AGORA_UTC,
+            )
+            .order_by(webhooks.c.proxima_tentativa)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .cte("disponivel")
+        )
+        reserva = (
+            update(webhooks)
+            .where(
+                webhooks.c.chave == disponivel.c.chave,
+                webhooks.c.status == disponivel.c.status,
+            )
+            .values(
+                tentativas=webhooks.c.tentativas + 1,
+                proxima_tentativa=AGORA_UTC + duracao,
+            )
+            .returning(webhooks.c.chave, webhooks.c.status, webhooks.c.payload, webhooks.c.tentativas)
+        )
+        linha = self.db.execute(reserva).first()
+        if linha is None:
+            return None
+        return WebhookPagamento(linha.chave, linha.status, linha.payload, linha.tentativas)
+
+    def marcar_processado(self, chave: str, status: str) -> bool:
+        """Fecha a notificação na transação do processamento.
+
+        A linha fica travada até o commit, então um segundo processador (após
+        reserva vencida) espera e recebe False.
+        """
+        resultado = self.db.execute(
+            update(WebhookPagamentoModel)
+            .where(
+                WebhookPagamentoModel.chave == chave,
+                WebhookPagamentoModel.status == status,
+                WebhookPagamentoModel.estado == ESTADO_PENDENTE,
+            )
+            .values(estado=ESTADO_PROCESSADO, processado_em=AGORA_UTC, erro=None)
+            .execution_options(synchronize_session=False)
+        )
+        return resultado.rowcount > 0
+
+    def registrar_falha(self, chave: str, status: str, erro: str, nova_tentativa_em: timedelta | None) -> None:
+        """Agenda nova tentativa, ou move para ``falhou`` se ``nova_tentativa_em`` for None."""
+        if nova_tentativa_em is None:
+            valores = {"estado": ESTADO_FALHOU, "erro": erro}
+        else:
+            valores = {"erro": erro, "proxima_tentativa": AGORA_UTC + nova_tentativa_em}
+        self.db.execute(
+            update(WebhookPagamentoModel)
+            .where(
+                WebhookPagamentoModel.chave == chave,
+                WebhookPagamentoModel.status == status,
+                WebhookPagamentoModel.estado == ESTADO_PENDENTE,
+            )
+            .values(**valores)
+            .execution_options(synchronize_session=False)
+        )
+
+    def remover_processados(self, processados_antes: datetime) -> int:
+        """Apaga notificações processadas antes da data (as que falharam ficam).
+
+        A reentrega de uma notificação já apagada é aplicada de novo, mas os
+        UPDATEs condicionais do pagamento não repetem uma transição já feita.
+        """
+        resultado = self.db.execute(
+            delete(WebhookPagamentoModel)
+            .where(
+                WebhookPagamentoModel.estado == ESTADO_PROCESSADO,
+                WebhookPagamentoModel.processado_em < processados_antes,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return resultado.rowcount
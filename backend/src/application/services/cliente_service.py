@@ -1,34 +1,41 @@
 from uuid import uuid4
 
+from fastapi import HTTPException
+
 from src.adapters.input.dto.cliente_dto import ClienteCreate, ClienteResponse
 from src.domain.models.cliente import Cliente
 from src.ports.repositories.cliente_repository_port import ClienteRepositoryPort
+from src.ports.repositories.unit_of_work_port import UnitOfWorkPort
 from src.ports.services.cliente_service_port import ClienteServicePort
 
 
 class ClienteService(ClienteServicePort):
-    def __init__(self, cliente_repository: ClienteRepositoryPort):
+    def __init__(self, cliente_repository: ClienteRepositoryPort, unit_of_work: UnitOfWorkPort):
         self.cliente_repository = cliente_repository
+        self.unit_of_work = unit_of_work
 
     def criar_ou_obter_cliente(self, cliente_create: ClienteCreate) -> ClienteResponse:
-        if cliente_create.cpf:
-            cliente = self.cliente_repository.buscar_por_cpf(cliente_create.cpf)
-            if cliente:
-                return ClienteResponse(**cliente.__dict__)
-
-        if cliente_create.email:
-            cliente = self.cliente_repository.buscar_por_email(cliente_create.email)
-            if cliente:
-                return ClienteResponse(**cliente.__dict__)
-
-        # Cria cliente novo (ou anônimo)
-        cliente = Cliente(
-            id=uuid4(),
-            nome=cliente_create.nome,
-            cpf=cliente_create.cpf,
-            email=cliente_create.email,
-        )
-        self.cliente_repository.salvar(cliente)
+        """Cliente existente pelo CPF ou email, ou um novo (também anônimo).
+
+        Busca e criação são um único comando no repositório, seguro para
+        identificações simultâneas nos totens. Sem dados válidos para um
+        cadastro (ex.: só o CPF, sem nome), o cliente ainda é identificado;
+        o erro de validação só vale se ele não existir.
+        """
+        cpf = Cliente.normalizar_cpf(cliente_create.cpf)
+        try:
+            novo = Cliente(id=uuid4(), nome=cliente_create.nome, cpf=cliente_create.cpf, email=cliente_create.email)
+            erro = None
+        except ValueError as e:
+            novo, erro = None, e
+
+        with self.unit_of_work:
+            cliente = self.cliente_repository.obter_ou_criar(cpf, cliente_create.email, novo)
+            if cliente is None:
+                if erro is not None:
+                    raise HTTPException(status_code=422, detail=str(erro))
+                raise HTTPException(status_code=409, detail="Cliente em cadastro simultâneo; tente novamente")
+            self.unit_of_work.commit()
         return ClienteResponse(**cliente.__dict__)
 
     def buscar_cliente_por_cpf(self, cpf: str) -> ClienteResponse | None:
@@ -1,10 +1,14 @@
 from uuid import UUID, uuid4
-from datetime import UTC, datetime
 
 from src.adapters.input.dto.pagamento_dto import PagamentoQRCodeResponse, StatusPagamentoResponse, WebhookPagamentoDTO
-from src.domain.models.pedido import StatusPedido
+from src.domain.models.evento_pagamento import EventoPagamento
+from src.domain.models.evento_pedido import EventoPedido
+from src.domain.models.pagamento import STATUS_APROVADO
+from src.domain.models.pedido import Pedido, StatusPedido
 from src.ports.repositories.pedido_repository_port import PedidoRepositoryPort
 from src.ports.repositories.pagamento_repository_port import PagamentoRepositoryPort
+from src.ports.repositories.webhook_pagamento_repository_port import WebhookPagamentoRepositoryPort
+from src.ports.repositories.unit_of_work_port import UnitOfWorkPort
 from src.ports.services.pagamento_service_port import PagamentoServicePort
 
 
@@ -12,10 +16,14 @@ class PagamentoService(PagamentoServicePort):
     def __init__(
         self,
         pedido_repository: PedidoRepositoryPort,
-        pagamento_repository: PagamentoRepositoryPort
+        pagamento_repository: PagamentoRepositoryPort,
+        unit_of_work: UnitOfWorkPort,
+        webhook_repository: WebhookPagamentoRepositoryPort,
     ):
         self.pedido_repository = pedido_repository
         self.pagamento_repository = pagamento_repository
+        self.unit_of_work = unit_of_work
+        self.webhook_repository = webhook_repository
 
     def gerar_qrcode(self) -> PagamentoQRCodeResponse:
         """Gera QRCode para pagamento (mock do Mercado Pago)"""
@@ -39,32 +47,87 @@ class PagamentoService(PagamentoServicePort):
             data_confirmacao=pagamento.data_confirmacao
         )
 
+    def buscar_status_pagamento(self, pedido_id: UUID) -> str | None:
+        """Só o status do pagamento, para validar ETags sem montar a resposta"""
+        return self.pagamento_repository.buscar_status_por_pedido_id(pedido_id)
+
+    def receber_webhook(self, webhook_data: WebhookPagamentoDTO) -> dict:
+        """Guarda a notificação para processamento assíncrono.
+
+        O provedor recebe a confirmação após um único INSERT, mesmo com o
+        banco lento; pagamento e pedido são atualizados depois pelos
+        processadores da caixa de entrada. Reentregas da mesma notificação
+        são reconhecidas pela chave e descartadas.
+        """
+        with self.unit_of_work:
+            nova = self.webhook_repository.registrar(
+                self._chave_webhook(webhook_data),
+                webhook_data.status,
+                webhook_data.pedido_id,
+                webhook_data.model_dump_json(),
+            )
+            self.unit_of_work.commit()
+
+        return {
+            "status": "accepted",
+            "message": f"Pagamento {webhook_data.status} recebido",
+            "pedido_id": str(webhook_data.pedido_id),
+            "duplicado": not nova,
+        }
+
     def processar_webhook(self, webhook_data: WebhookPagamentoDTO) -> dict:
-        """Processa webhook de confirmação de pagamento"""
-        # Buscar pagamento existente ou criar novo
-        pagamento = self.pagamento_repository.buscar_por_pedido_id(webhook_data.pedido_id)
-        
-        if not pagamento:
-            raise Exception("Pedido não encontrado")
-        
-        # Atualizar status do pagamento
-        pagamento.status = webhook_data.status
-        if webhook_data.status == "approved":
-            pagamento.data_confirmacao = datetime.now(UTC)
-            # Atualizar status do pedido para "Em preparação"
-            pedido = self.pedido_repository.buscar_por_id(webhook_data.pedido_id)
-            if pedido:
-                pedido.status = StatusPedido.PREPARANDO
-                self.pedido_repository.salvar(pedido)
-        
-        self.pagamento_repository.salvar(pagamento)
-        
+        """Aplica uma notificação da caixa de entrada.
+
+        Fechar a notificação, atualizar o pagamento e o pedido acontecem na
+        mesma transação, por UPDATEs condicionais; uma notificação já
+        processada não é aplicada de novo.
+        """
+        with self.unit_of_work:
+            if not self.webhook_repository.marcar_processado(
+                self._chave_webhook(webhook_data), webhook_data.status
+            ):
+                self.unit_of_work.rollback()
+                return {
+                    "status": "success",
+                    "message": f"Pagamento {webhook_data.status} já processado",
+                    "pedido_id": str(webhook_data.pedido_id),
+                    "duplicado": True,
+                }
+
+            atualizado = self.pagamento_repository.atualizar_status_por_pedido_id(
+                webhook_data.pedido_id, webhook_data.status
+            )
+            if not atualizado and self.pagamento_repository.buscar_status_por_pedido_id(webhook_data.pedido_id) is None:
+                raise Exception("Pedido não encontrado")
+
+            if atualizado:
+                self.unit_of_work.registrar_evento(EventoPagamento(webhook_data.pedido_id, webhook_data.status))
+
+            if atualizado and webhook_data.status == STATUS_APROVADO:
+                # Pedido vai para "Em preparação" só a partir de Recebido/Pago
+                pedido = self.pedido_repository.transicionar_status(
+                    webhook_data.pedido_id,
+                    StatusPedido.PREPARANDO,
+                    Pedido.status_de_origem(StatusPedido.PREPARANDO),
+                )
+                if pedido is not None:
+                    self.unit_of_work.registrar_evento(EventoPedido(pedido.id, pedido.status))
+
+            self.unit_of_work.commit()
+
         return {
             "status": "success",
             "message": f"Pagamento {webhook_data.status} processado com sucesso",
             "pedido_id": str(webhook_data.pedido_id)
         }
 
+    def _chave_webhook(self, webhook_data: WebhookPagamentoDTO) -> str:
+        if webhook_data.payment_id:
+            return f"payment:{webhook_data.payment_id}"
+        if webhook_data.external_reference:
+            return f"ref:{webhook_data.external_reference}"
+        return f"pedido:{webhook_data.pedido_id}"
+
     def confirmar_pagamento(self, pedido_id: UUID):
         """Confirma pagamento manualmente (para testes)"""
         pedido = self.pedido_repository.buscar_por_id(pedido_id)
@@ -72,5 +135,8 @@ class PagamentoService(PagamentoServicePort):
             raise Exception("Pedido não encontrado")
 
         pedido.status = StatusPedido.PAGO
-        self.pedido_repository.salvar(pedido)
+        with self.unit_of_work:
+            self.pedido_repository.salvar(pedido)
+            self.unit_of_work.registrar_evento(EventoPedido(pedido.id, pedido.status))
+            self.unit_of_work.commit()
         return pedido
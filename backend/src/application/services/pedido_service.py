@@ -1,20 +1,50 @@
+import hashlib
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime, timedelta
+from typing import NamedTuple, NoReturn
 from uuid import UUID
 
 from fastapi import HTTPException
 
 from src.adapters.input.dto.pedido_dto import (
+    AlteracoesPedidosResponse,
     ItemPedidoDTO,
+    PaginaPedidosResponse,
     PedidoCreate,
+    PedidoReservadoResponse,
     PedidoResponse,
 )
-from src.domain.models.pedido import ItemPedido, Pedido, StatusPedido
+from src.constants import Defaults
+from src.domain.models.chave_idempotencia import ChaveIdempotencia
+from src.domain.models.evento_pedido import EventoPedido
+from src.domain.models.pedido import STATUS_CANCELAVEIS, ItemPedido, Pedido, StatusPedido
+from src.domain.models.produto import Produto
+from src.domain.models.status_pedido import PRIORIDADE_STATUS
+from src.ports.cache.cache_lru_port import CacheLRUPort
+from src.ports.cache.painel_pedidos_port import PainelPedidosPort
+from src.ports.repositories.chave_idempotencia_repository_port import (
+    ChaveIdempotenciaRepositoryPort,
+)
 from src.ports.repositories.fila_pedidos_repository_port import (
     FilaPedidosRepositoryPort,
 )
 from src.ports.repositories.pedido_repository_port import PedidoRepositoryPort
 from src.ports.repositories.produto_repository_port import ProdutoRepositoryPort
 from src.ports.repositories.cliente_repository_port import ClienteRepositoryPort
+from src.ports.repositories.unit_of_work_port import UnitOfWorkPort
 from src.ports.services.pedido_service_port import PedidoServicePort
+from src.utils import decode_cursor, encode_cursor
+
+
+class _PosicaoAlteracoes(NamedTuple):
+    """Onde parou a leitura do delta: pedidos e marcas de remoção avançam
+    cada um pelo seu keyset (versao, id) dentro da mesma rodada."""
+    desde: int
+    apos_id: UUID | None
+    desde_removidos: int
+    apos_removido: UUID | None
+    piso: int | None
+    iniciada_em: int | None
 
 
 class PedidoService(PedidoServicePort):
@@ -24,14 +54,67 @@ class PedidoService(PedidoServicePort):
         fila_repository: FilaPedidosRepositoryPort,
         produto_repository: ProdutoRepositoryPort,
         cliente_repository: ClienteRepositoryPort,
+        unit_of_work: UnitOfWorkPort,
+        painel: PainelPedidosPort | None = None,
+        idempotencia_repository: ChaveIdempotenciaRepositoryPort | None = None,
+        respostas_idempotentes: CacheLRUPort[ChaveIdempotencia] | None = None,
     ):
         self.repository = repository
         self.fila_repository = fila_repository
         self.produto_repository = produto_repository
         self.cliente_repository = cliente_repository
+        self.unit_of_work = unit_of_work
+        self.painel = painel
+        self.idempotencia_repository = idempotencia_repository
+        self.respostas_idempotentes = respostas_idempotentes
+
+    def criar_pedido(
+        self, pedido_create: PedidoCreate, chave_idempotencia: str | None = None
+    ) -> PedidoResponse:
+        """Cria um novo pedido com validações de domínio.
+
+        Com ``chave_idempotencia``, repetições da mesma requisição (ex.: o
+        quiosque reenviando após falha de rede) recebem a resposta da primeira
+        sem criar outro pedido. A resposta é gravada na mesma transação do
+        pedido; um reenvio custa uma consulta pela chave, ou nenhuma se ela
+        estiver no cache do processo.
+        """
+        if chave_idempotencia is None or self.idempotencia_repository is None:
+            return self._criar_pedido(pedido_create)
+
+        hash_requisicao = hashlib.sha256(pedido_create.model_dump_json().encode()).hexdigest()
+        resposta = self._resposta_idempotente(chave_idempotencia, hash_requisicao)
+        if resposta is not None:
+            return resposta
 
-    def criar_pedido(self, pedido_create: PedidoCreate) -> PedidoResponse:
-        """Cria um novo pedido com validações de domínio"""
+        with self.unit_of_work:
+            # Um reenvio simultâneo espera aqui até esta transação terminar
+            reservada = self.idempotencia_repository.reservar(
+                chave_idempotencia, hash_requisicao, self._chaves_validas_desde()
+            )
+            if reservada:
+                resposta = self._criar_pedido(pedido_create, chave_idempotencia)
+                if self.respostas_idempotentes is not None:
+                    self.respostas_idempotentes.guardar(
+                        chave_idempotencia,
+                        ChaveIdempotencia(
+                            chave_idempotencia, hash_requisicao, datetime.now(UTC), resposta.model_dump_json()
+                        ),
+                    )
+                return resposta
+            self.unit_of_work.rollback()
+
+        resposta = self._resposta_idempotente(chave_idempotencia, hash_requisicao)
+        if resposta is None:
+            raise HTTPException(
+                status_code=409,
+                detail="Requisição com esta Idempotency-Key ainda em processamento",
+            )
+        return resposta
+
+    def _criar_pedido(
+        self, pedido_create: PedidoCreate, chave_idempotencia: str | None = None
+    ) -> PedidoResponse:
         # Validar cliente
         if pedido_create.cliente_id:
             cliente = self.cliente_repository.buscar_por_id(pedido_create.cliente_id)
@@ -40,10 +123,11 @@ class PedidoService(PedidoServicePort):
             if not cliente.pode_fazer_pedido():
                 raise HTTPException(status_code=403, detail="Cliente inativo")
 
-        # Validar produtos e estoque
+        # Validar produtos e estoque (todos os produtos em uma única consulta)
+        produtos = self._buscar_produtos(item.produto_id for item in pedido_create.itens)
         itens_validados = []
         for item_dto in pedido_create.itens:
-            produto = self.produto_repository.buscar_por_id(item_dto.produto_id)
+            produto = produtos.get(item_dto.produto_id)
             if not produto:
                 raise HTTPException(
                     status_code=404, 
@@ -74,18 +158,23 @@ class PedidoService(PedidoServicePort):
                 itens=itens_validados
             )
             
-            # Salvar pedido
-            pedido = self.repository.salvar(pedido)
-            self.fila_repository.enfileirar(pedido.id)
+            # Salvar pedido e enfileirar na mesma transação
+            with self.unit_of_work:
+                pedido = self.repository.salvar(pedido)
+                self.fila_repository.enfileirar(pedido.id)
+                self.unit_of_work.registrar_evento(EventoPedido(pedido.id, pedido.status))
+                resposta = self._to_response(pedido)
+                if chave_idempotencia is not None:
+                    self.idempotencia_repository.registrar_resposta(
+                        chave_idempotencia, resposta.model_dump_json()
+                    )
+                self.unit_of_work.commit()
 
-            return self._to_response(pedido)
+            return resposta
             
         except ValueError as e:
             # Liberar estoque em caso de erro
-            for item in itens_validados:
-                produto = self.produto_repository.buscar_por_id(item.produto_id)
-                if produto:
-                    produto.liberar_estoque(item.quantidade)
+            self._liberar_estoque(itens_validados, produtos)
             raise HTTPException(status_code=422, detail=str(e))
 
     def buscar_pedido_por_id(self, pedido_id: UUID) -> PedidoResponse:
@@ -94,6 +183,17 @@ class PedidoService(PedidoServicePort):
             raise HTTPException(status_code=404, detail="Pedido não encontrado")
         return self._to_response(pedido)
 
+    def buscar_pedido_versionado(self, pedido_id: UUID) -> tuple[PedidoResponse, int | None]:
+        """O pedido e a versão lida junto com ele, para o ETag da resposta"""
+        pedido = self.repository.buscar_por_id(pedido_id)
+        if not pedido:
+            raise HTTPException(status_code=404, detail="Pedido não encontrado")
+        return self._to_response(pedido), pedido.versao
+
+    def buscar_versao_pedido(self, pedido_id: UUID) -> int | None:
+        """Só a versão, para validar ETags sem carregar o pedido e os itens"""
+        return self.repository.buscar_versao(pedido_id)
+
     def listar_pedidos(self) -> list[PedidoResponse]:
         pedidos = self.repository.listar()
         return [self._to_response(p) for p in pedidos]
@@ -104,21 +204,97 @@ class PedidoService(PedidoServicePort):
         2. Pedidos mais antigos primeiro
         3. Pedidos com status Finalizado não aparecem
         """
-        pedidos = self.repository.listar_ordenados()
+        pedidos = self._listar_ordenados()
+        return [self._to_response(p) for p in pedidos]
+
+    def listar_pedidos_ordenados_paginado(
+        self, limite: int, cursor: str | None = None
+    ) -> PaginaPedidosResponse:
+        """Página da listagem ordenada, navegada por cursor (keyset).
+
+        O cursor é opaco para o cliente e guarda a posição
+        (prioridade, data_criacao, id) do último pedido entregue.
+        """
+        apos = self._decodificar_cursor(cursor) if cursor else None
+        # Busca um pedido a mais apenas para saber se existe próxima página
+        pedidos = self._listar_ordenados(limite=limite + 1, apos=apos)
+        proximo_cursor = None
+        if len(pedidos) > limite:
+            pedidos = pedidos[:limite]
+            proximo_cursor = self._codificar_cursor(pedidos[-1])
+        return PaginaPedidosResponse(
+            itens=[self._to_response(p) for p in pedidos],
+            proximo_cursor=proximo_cursor,
+        )
+
+    def listar_pedidos_em_aberto(self) -> list[PedidoResponse]:
+        """Lista pedidos com entrada em aberto na fila da cozinha"""
+        pedidos = self.repository.listar_em_aberto()
         return [self._to_response(p) for p in pedidos]
 
+    def listar_alteracoes(self, limite: int, cursor: str | None = None) -> AlteracoesPedidosResponse:
+        """Pedidos criados/alterados e removidos desde o cursor (delta).
+
+        Sem cursor, devolve todos os pedidos (carga inicial) e nenhuma
+        remoção: o retrato completo já as implica. O cursor final é a menor
+        versão ainda em andamento lida *antes* da consulta, então uma
+        transação que confirmar depois desta leitura ainda será entregue na
+        próxima; o custo é poder repetir alguns pedidos, o que o cliente trata
+        como atualização. Pedidos e remoções são paginados por ``limite``; com
+        ``tem_mais``, o cliente chama de novo em seguida. Marcas de remoção
+        expiram (``PEDIDOS_REMOVIDOS_RETENCAO_HORAS``): um cursor mais antigo
+        recebe 410 e o cliente recomeça pela carga inicial.
+        """
+        if cursor:
+            posicao = self._decodificar_cursor_alteracoes(cursor)
+        else:
+            posicao = _PosicaoAlteracoes(0, None, 0, None, None, None)
+        piso, iniciada_em = posicao.piso, posicao.iniciada_em
+        if piso is None:
+            piso = self.repository.menor_versao_em_andamento()
+            iniciada_em = int(datetime.now(UTC).timestamp())
+
+        pedidos = self.repository.listar_alterados(posicao.desde, posicao.apos_id, limite + 1)
+        if cursor:
+            removidos = self.repository.listar_removidos(
+                posicao.desde_removidos, posicao.apos_removido, limite + 1
+            )
+        else:
+            removidos = []
+        mais_pedidos = len(pedidos) > limite
+        mais_removidos = len(removidos) > limite
+        pedidos, removidos = pedidos[:limite], removidos[:limite]
+
+        if mais_pedidos or mais_removidos:
+            # Rodada em andamento: o que já se esgotou (e as remoções da carga
+            # inicial) segue a partir do piso
+            proximo = {"v": piso, "rv": piso, "x": piso, "t": iniciada_em}
+            if mais_pedidos:
+                proximo.update(v=pedidos[-1].versao, id=str(pedidos[-1].id))
+            if mais_removidos:
+                proximo.update(rv=removidos[-1][0], rid=str(removidos[-1][1]))
+        else:
+            proximo = {"v": piso, "t": iniciada_em}
+
+        return AlteracoesPedidosResponse(
+            itens=[self._to_response(p) for p in pedidos],
+            removidos=[pedido_id for _, pedido_id in removidos],
+            proximo_cursor=encode_cursor(proximo),
+            tem_mais=mais_pedidos or mais_removidos,
+        )
+
     def deletar_pedido(self, pedido_id: UUID) -> None:
         pedido = self.repository.buscar_por_id(pedido_id)
         if not pedido:
             raise HTTPException(status_code=404, detail="Pedido não encontrado")
         
         # Liberar estoque
-        for item in pedido.itens:
-            produto = self.produto_repository.buscar_por_id(item.produto_id)
-            if produto:
-                produto.liberar_estoque(item.quantidade)
+        self._liberar_estoque(pedido.itens)
         
-        self.repository.deletar(pedido_id)
+        with self.unit_of_work:
+            self.repository.deletar(pedido_id)
+            self.unit_of_work.registrar_evento(EventoPedido(pedido.id, pedido.status, removido=True))
+            self.unit_of_work.commit()
 
     def buscar_pedidos_por_cliente(self, cliente_id: UUID) -> list[PedidoResponse]:
         cliente = self.cliente_repository.buscar_por_id(cliente_id)
@@ -129,47 +305,35 @@ class PedidoService(PedidoServicePort):
         return [self._to_response(p) for p in pedidos]
 
     def atualizar_status_pedido(self, pedido_id: UUID, novo_status: StatusPedido) -> PedidoResponse:
-        pedido = self.repository.buscar_por_id(pedido_id)
-        if not pedido:
-            raise HTTPException(status_code=404, detail="Pedido não encontrado")
-        
-        try:
-            # Atualizar status com validações de domínio
-            pedido.atualizar_status(novo_status)
-            pedido = self.repository.salvar(pedido)
-            
-            # Atualizar fila de pedidos
-            self.fila_repository.atualizar_status(pedido_id, novo_status.value)
-            
-            return self._to_response(pedido)
-            
-        except ValueError as e:
-            raise HTTPException(status_code=422, detail=str(e))
+        # A transição é validada e aplicada pelo próprio UPDATE condicional,
+        # sem ler o pedido antes: uma ida ao banco e sem corrida entre leituras.
+        with self.unit_of_work:
+            pedido = self.repository.transicionar_status(
+                pedido_id, novo_status, Pedido.status_de_origem(novo_status)
+            )
+            if pedido is not None:
+                self.unit_of_work.registrar_evento(EventoPedido(pedido.id, pedido.status))
+                self.unit_of_work.commit()
+
+        if pedido is None:
+            self._recusar_transicao(pedido_id, lambda p: p.atualizar_status(novo_status))
+        return self._to_response(pedido)
 
     def cancelar_pedido(self, pedido_id: UUID) -> PedidoResponse:
         """Cancela um pedido com validações"""
-        pedido = self.repository.buscar_por_id(pedido_id)
-        if not pedido:
-            raise HTTPException(status_code=404, detail="Pedido não encontrado")
-        
-        try:
-            # Cancelar pedido com validações de domínio
-            pedido.cancelar()
-            pedido = self.repository.salvar(pedido)
-            
-            # Liberar estoque
-            for item in pedido.itens:
-                produto = self.produto_repository.buscar_por_id(item.produto_id)
-                if produto:
-                    produto.liberar_estoque(item.quantidade)
-            
-            # Atualizar fila
-            self.fila_repository.atualizar_status(pedido_id, StatusPedido.FINALIZADO.value)
-            
-            return self._to_response(pedido)
-            
-        except ValueError as e:
-            raise HTTPException(status_code=422, detail=str(e))
+        with self.unit_of_work:
+            pedido = self.repository.transicionar_status(
+                pedido_id, StatusPedido.FINALIZADO, STATUS_CANCELAVEIS
+            )
+            if pedido is not None:
+                # Liberar estoque
+                self._liberar_estoque(pedido.itens)
+                self.unit_of_work.registrar_evento(EventoPedido(pedido.id, pedido.status))
+                self.unit_of_work.commit()
+
+        if pedido is None:
+            self._recusar_transicao(pedido_id, lambda p: p.cancelar())
+        return self._to_response(pedido)
 
     def adicionar_item_ao_pedido(self, pedido_id: UUID, item: ItemPedidoDTO) -> PedidoResponse:
         """Adiciona um item a um pedido existente"""
@@ -178,7 +342,7 @@ class PedidoService(PedidoServicePort):
             raise HTTPException(status_code=404, detail="Pedido não encontrado")
         
         # Validar produto
-        produto = self.produto_repository.buscar_por_id(item.produto_id)
+        produto = self._buscar_produtos([item.produto_id]).get(item.produto_id)
         if not produto:
             raise HTTPException(status_code=404, detail="Produto não encontrado")
         
@@ -193,12 +357,202 @@ class PedidoService(PedidoServicePort):
             # Reservar estoque
             produto.reservar_estoque(item.quantidade)
             
-            pedido = self.repository.salvar(pedido)
+            with self.unit_of_work:
+                pedido = self.repository.salvar(pedido)
+                self.unit_of_work.registrar_evento(EventoPedido(pedido.id, pedido.status))
+                self.unit_of_work.commit()
             return self._to_response(pedido)
             
         except ValueError as e:
             raise HTTPException(status_code=422, detail=str(e))
 
+    def reservar_pedidos(
+        self, estacao: str, quantidade: int, duracao: timedelta
+    ) -> list[PedidoReservadoResponse]:
+        """Reserva para a estação os próximos pedidos da cozinha.
+
+        Estações concorrentes nunca recebem o mesmo pedido. A reserva vence
+        após ``duracao`` se não for renovada, concluída ou liberada, e o pedido
+        volta para a fila. Pedidos recebidos ou pagos passam a "Em preparação".
+        """
+        with self.unit_of_work:
+            reservas = self.fila_repository.reservar(
+                estacao,
+                quantidade,
+                duracao,
+                StatusPedido.PREPARANDO,
+                Pedido.status_de_origem(StatusPedido.PREPARANDO),
+            )
+            pedidos = {
+                pedido.id: pedido
+                for pedido in self.repository.buscar_por_ids([reserva.id for reserva, _ in reservas])
+            }
+            resultado = []
+            for reserva, preparado in reservas:
+                pedido = pedidos.get(reserva.id)
+                if pedido is None:
+                    continue
+                if preparado:
+                    self.unit_of_work.registrar_evento(EventoPedido(pedido.id, pedido.status))
+                resultado.append(
+                    PedidoReservadoResponse(
+                        pedido=self._to_response(pedido),
+                        estacao=reserva.estacao,
+                        reservado_ate=reserva.reservado_ate,
+                        tentativas=reserva.tentativas,
+                    )
+                )
+            self.unit_of_work.commit()
+        return resultado
+
+    def renovar_reserva(self, pedido_id: UUID, estacao: str, duracao: timedelta) -> datetime:
+        with self.unit_of_work:
+            reservado_ate = self.fila_repository.renovar_reserva(pedido_id, estacao, duracao)
+            if reservado_ate is None:
+                self._reserva_nao_encontrada()
+            self.unit_of_work.commit()
+        return reservado_ate
+
+    def liberar_reserva(self, pedido_id: UUID, estacao: str) -> None:
+        """Devolve o pedido à fila para outra estação (mantém o status)"""
+        with self.unit_of_work:
+            if not self.fila_repository.liberar(pedido_id, estacao):
+                self._reserva_nao_encontrada()
+            self.unit_of_work.commit()
+
+    def concluir_pedido_reservado(self, pedido_id: UUID, estacao: str) -> PedidoResponse:
+        """Conclui o trabalho da estação: sai da fila e o pedido fica "Pronto"."""
+        with self.unit_of_work:
+            if not self.fila_repository.concluir(pedido_id, estacao):
+                self._reserva_nao_encontrada()
+            pedido = self.repository.transicionar_status(
+                pedido_id, StatusPedido.PRONTO, Pedido.status_de_origem(StatusPedido.PRONTO)
+            )
+            if pedido is not None:
+                self.unit_of_work.registrar_evento(EventoPedido(pedido.id, pedido.status))
+            else:
+                pedido = self.repository.buscar_por_id(pedido_id)
+            self.unit_of_work.commit()
+
+        if pedido is None:
+            raise HTTPException(status_code=404, detail="Pedido não encontrado")
+        return self._to_response(pedido)
+
+    def _reserva_nao_encontrada(self) -> NoReturn:
+        raise HTTPException(
+            status_code=409,
+            detail="Pedido não está reservado por esta estação",
+        )
+
+    def _recusar_transicao(self, pedido_id: UUID, transicao: Callable[[Pedido], None]) -> NoReturn:
+        """Explica por que uma transição condicional não alterou nenhum pedido"""
+        pedido = self.repository.buscar_por_id(pedido_id)
+        if not pedido:
+            raise HTTPException(status_code=404, detail="Pedido não encontrado")
+        try:
+            # Reaplica a regra de domínio para obter a mensagem de erro
+            transicao(pedido)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        # A transição seria válida agora: o status mudou entre as duas leituras
+        raise HTTPException(
+            status_code=409,
+            detail="Pedido alterado por outra operação, tente novamente",
+        )
+
+    def _resposta_idempotente(self, chave: str, hash_requisicao: str) -> PedidoResponse | None:
+        armazenada = None
+        validas_desde = self._chaves_validas_desde()
+        if self.respostas_idempotentes is not None:
+            armazenada = self.respostas_idempotentes.obter(chave)
+            # O TTL do cache conta de quando a entrada foi guardada; a chave
+            # vence pela data em que foi criada, como na tabela
+            if armazenada is not None and armazenada.criado_em < validas_desde:
+                self.respostas_idempotentes.descartar(chave)
+                armazenada = None
+        if armazenada is None:
+            armazenada = self.idempotencia_repository.buscar(chave, validas_desde)
+            if armazenada is None or armazenada.resposta is None:
+                return None
+            if self.respostas_idempotentes is not None:
+                self.respostas_idempotentes.guardar(chave, armazenada)
+        if armazenada.hash_requisicao != hash_requisicao:
+            raise HTTPException(
+                status_code=422,
+                detail="Idempotency-Key já utilizada com outra requisição",
+            )
+        return PedidoResponse.model_validate_json(armazenada.resposta)
+
+    def _chaves_validas_desde(self) -> datetime:
+        return datetime.now(UTC) - timedelta(hours=Defaults.IDEMPOTENCIA_VALIDADE_HORAS)
+
+    def _listar_ordenados(
+        self,
+        limite: int | None = None,
+        apos: tuple[int, datetime, UUID] | None = None,
+    ) -> list[Pedido]:
+        # Projeção em memória quando disponível; o banco enquanto ela carrega
+        if self.painel is not None:
+            pedidos = self.painel.listar(limite, apos)
+            if pedidos is not None:
+                return pedidos
+        return self.repository.listar_ordenados(limite=limite, apos=apos)
+
+    def _buscar_produtos(self, produto_ids: Iterable[UUID]) -> dict[UUID, Produto]:
+        """Carrega os produtos informados em uma única consulta, indexados por ID"""
+        produtos = self.produto_repository.buscar_por_ids(list(produto_ids))
+        return {produto.id: produto for produto in produtos}
+
+    def _liberar_estoque(
+        self, itens: list[ItemPedido], produtos: dict[UUID, Produto] | None = None
+    ) -> None:
+        if produtos is None:
+            produtos = self._buscar_produtos(item.produto_id for item in itens)
+        for item in itens:
+            produto = produtos.get(item.produto_id)
+            if produto:
+                produto.liberar_estoque(item.quantidade)
+
+    def _codificar_cursor(self, pedido: Pedido) -> str:
+        return encode_cursor({
+            "p": PRIORIDADE_STATUS[pedido.status],
+            "d": pedido.data_criacao.isoformat(),
+            "id": str(pedido.id),
+        })
+
+    def _decodificar_cursor(self, cursor: str) -> tuple[int, datetime, UUID]:
+        try:
+            dados = decode_cursor(cursor)
+            return int(dados["p"]), datetime.fromisoformat(dados["d"]), UUID(dados["id"])
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Cursor inválido")
+
+    def _decodificar_cursor_alteracoes(self, cursor: str) -> _PosicaoAlteracoes:
+        try:
+            dados = decode_cursor(cursor)
+            desde = int(dados["v"])
+            posicao = _PosicaoAlteracoes(
+                desde=desde,
+                apos_id=UUID(dados["id"]) if "id" in dados else None,
+                desde_removidos=int(dados.get("rv", desde)),
+                apos_removido=UUID(dados["rid"]) if "rid" in dados else None,
+                piso=int(dados["x"]) if "x" in dados else None,
+                iniciada_em=int(dados["t"]) if "t" in dados else None,
+            )
+        except (ValueError, KeyError, TypeError):
+            raise HTTPException(status_code=400, detail="Cursor inválido")
+        # Margem de uma hora para transações longas entre a leitura do piso
+        # e a gravação das marcas de remoção
+        validade = timedelta(hours=Defaults.PEDIDOS_REMOVIDOS_RETENCAO_HORAS - 1)
+        if posicao.iniciada_em is not None and (
+            datetime.fromtimestamp(posicao.iniciada_em, UTC) < datetime.now(UTC) - validade
+        ):
+            raise HTTPException(status_code=410, detail="Cursor expirado; recomece pela carga inicial")
+        # Sem "x" o cursor abre uma nova rodada, que lê o próprio piso
+        if posicao.piso is None:
+            posicao = posicao._replace(iniciada_em=None)
+        return posicao
+
     def _to_response(self, pedido: Pedido) -> PedidoResponse:
         return PedidoResponse(
             id=pedido.id,
@@ -1,17 +1,32 @@
 from uuid import uuid4
+import gzip
+import hashlib
 import logging
 
-from src.adapters.input.dto.produto_dto import ProdutoCreate, ProdutoResponse
+from pydantic import TypeAdapter
+
+from src.adapters.input.dto.produto_dto import CatalogoSerializado, ProdutoCreate, ProdutoResponse
 from src.domain.models.produto import Produto
+from src.ports.cache.catalogo_cache_port import CatalogoCachePort
 from src.ports.repositories.produto_repository_port import ProdutoRepositoryPort
+from src.ports.repositories.unit_of_work_port import UnitOfWorkPort
 from src.ports.services.produto_service_port import ProdutoServicePort
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+_LISTA_PRODUTOS = TypeAdapter(list[ProdutoResponse])
+
 class ProdutoService(ProdutoServicePort):
-    def __init__(self, produto_repository: ProdutoRepositoryPort):
+    def __init__(
+        self,
+        produto_repository: ProdutoRepositoryPort,
+        unit_of_work: UnitOfWorkPort,
+        catalogo_cache: CatalogoCachePort,
+    ):
         self.produto_repository = produto_repository
+        self.unit_of_work = unit_of_work
+        self.catalogo_cache = catalogo_cache
 
     def criar_produto(self, produto_create: ProdutoCreate) -> ProdutoResponse:
         try:
@@ -21,7 +36,10 @@ class ProdutoService(ProdutoServicePort):
                 categoria=produto_create.categoria,
                 preco=produto_create.preco
             )
-            self.produto_repository.salvar(produto)
+            with self.unit_of_work:
+                self.produto_repository.salvar(produto)
+                self.unit_of_work.commit()
+            self.catalogo_cache.invalidar()
             return ProdutoResponse(**produto.__dict__)
         except Exception as e:
             logger.error(f"Erro ao criar produto: {e}")
@@ -29,18 +47,15 @@ class ProdutoService(ProdutoServicePort):
 
     def listar_produtos(self) -> list[ProdutoResponse]:
         try:
-            logger.info("Service: Iniciando listagem de produtos...")
-            produtos = self.produto_repository.listar()
-            logger.info(f"Service: Produtos obtidos do repository: {len(produtos)}")
-            
-            response_list = [ProdutoResponse(**p.__dict__) for p in produtos]
-            logger.info(f"Service: Produtos convertidos para response: {len(response_list)}")
-            
-            return response_list
+            return list(self.catalogo_cache.obter_ou_carregar("todos", self._carregar_produtos))
         except Exception as e:
             logger.error(f"Erro ao listar produtos no service: {e}")
             raise
 
+    def catalogo_serializado(self) -> CatalogoSerializado:
+        """Catálogo completo pré-codificado, refeito só quando o cache é invalidado"""
+        return self.catalogo_cache.obter_ou_carregar("serializado", self._serializar_catalogo)
+
     def buscar_produto(self, produto_id: str) -> ProdutoResponse | None:
         try:
             produto = self.produto_repository.buscar_por_id(produto_id)
@@ -53,15 +68,33 @@ class ProdutoService(ProdutoServicePort):
 
     def buscar_por_categoria(self, categoria: str) -> list[ProdutoResponse]:
         try:
-            produtos = self.produto_repository.buscar_por_categoria(categoria)
-            return [ProdutoResponse(**p.__dict__) for p in produtos]
+            return list(self.catalogo_cache.obter_ou_carregar(
+                f"categoria:{categoria}",
+                lambda: [ProdutoResponse(**p.__dict__) for p in self.produto_repository.buscar_por_categoria(categoria)],
+            ))
         except Exception as e:
             logger.error(f"Erro ao buscar produtos por categoria {categoria}: {e}")
             raise
 
     def deletar_produto(self, produto_id: str) -> None:
         try:
-            self.produto_repository.deletar(produto_id)
+            with self.unit_of_work:
+                self.produto_repository.deletar(produto_id)
+                self.unit_of_work.commit()
+            self.catalogo_cache.invalidar()
         except Exception as e:
             logger.error(f"Erro ao deletar produto {produto_id}: {e}")
             raise
+
+    def _carregar_produtos(self) -> list[ProdutoResponse]:
+        produtos = self.produto_repository.listar()
+        return [ProdutoResponse(**p.__dict__) for p in produtos]
+
+    def _serializar_catalogo(self) -> CatalogoSerializado:
+        conteudo = _LISTA_PRODUTOS.dump_json(self.listar_produtos())
+        return CatalogoSerializado(
+            versao=hashlib.sha256(conteudo).hexdigest(),
+            json=conteudo,
+            # mtime fixo: mesmos bytes em todos os processos
+            json_gzip=gzip.compress(conteudo, compresslevel=9, mtime=0),
+        )
@@ -42,4 +42,10 @@ class Defaults:
     DEFAULT_PAGE_SIZE = 10
     MAX_PAGE_SIZE = 100
     MAX_NAME_LENGTH = 100
-    MAX_EMAIL_LENGTH = 255 
\ No newline at end of file
+    MAX_EMAIL_LENGTH = 255
+    FILA_RESERVA_SEGUNDOS = 300
+    MAX_FILA_RESERVA_SEGUNDOS = 3600
+    MAX_FILA_RESERVA_QUANTIDADE = 20
+    IDEMPOTENCIA_VALIDADE_HORAS = 24
+    MAX_IDEMPOTENCY_KEY_LENGTH = 255
+    PEDIDOS_REMOVIDOS_RETENCAO_HORAS = 168
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class ChaveIdempotencia:
+    """Requisição já processada: repetições com a mesma chave recebem ``resposta``.
+
+    A validade conta de ``criado_em`` (UTC), também para cópias em cache.
+    """
+    chave: str
+    hash_requisicao: str
+    criado_em: datetime
+    resposta: str | None = None
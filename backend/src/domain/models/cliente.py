@@ -17,7 +17,7 @@ class Cliente:
         self.id = id
         self.nome = nome
         self.email = email
-        self.cpf = cpf
+        self.cpf = self.normalizar_cpf(cpf)
         self.data_criacao = data_criacao or datetime.now(UTC)
         self.ativo = ativo
         
@@ -51,7 +51,7 @@ class Cliente:
             id=uuid4(),
             nome=nome.strip(),
             email=email.strip() if email else None,
-            cpf=cls._formatar_cpf(cpf) if cpf else None,
+            cpf=cpf,
             data_criacao=datetime.now(UTC),
             ativo=True,
         )
@@ -148,6 +148,17 @@ class Cliente:
         
         return True
 
+    @staticmethod
+    def normalizar_cpf(cpf: Optional[str]) -> Optional[str]:
+        """CPF como gravado e consultado: só os dígitos ("12345678900").
+
+        None só para CPF ausente ou em branco; qualquer outro valor (ex.:
+        "abc", que vira "") segue para a validação e é recusado.
+        """
+        if cpf is None or not cpf.strip():
+            return None
+        return re.sub(r'[^0-9]', '', cpf)
+
     @staticmethod
     def _formatar_cpf(cpf: str) -> str:
         """Formata CPF no padrão XXX.XXX.XXX-XX"""
@@ -162,7 +173,7 @@ class Cliente:
         if self.email and not self._validar_email(self.email):
             raise ValueError("Email inválido")
         
-        if self.cpf and not self._validar_cpf(self.cpf):
+        if self.cpf is not None and not self._validar_cpf(self.cpf):
             raise ValueError("CPF inválido")
 
     def __str__(self) -> str:
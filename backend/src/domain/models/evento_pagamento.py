@@ -0,0 +1,11 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class EventoPagamento:
+    """Mudança de status do pagamento de um pedido, publicada no commit."""
+    pedido_id: UUID
+    status: str
+    ocorrido_em: datetime = field(default_factory=lambda: datetime.now(UTC))
@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from uuid import UUID
+
+from src.domain.models.status_pedido import StatusPedido
+
+
+@dataclass(frozen=True)
+class EventoPedido:
+    """Mudança de um pedido (criação, status ou remoção), publicada no commit."""
+    pedido_id: UUID
+    status: StatusPedido
+    ocorrido_em: datetime = field(default_factory=lambda: datetime.now(UTC))
+    removido: bool = False
@@ -1,10 +1,22 @@
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.models.status_pedido import StatusPedido
 
 
 class FilaPedidos:
-    def __init__(self, id: UUID, status: StatusPedido = StatusPedido.RECEBIDO, payload=None):
+    def __init__(
+        self,
+        id: UUID,
+        status: StatusPedido = StatusPedido.RECEBIDO,
+        payload=None,
+        estacao: str | None = None,
+        reservado_ate: datetime | None = None,
+        tentativas: int = 0,
+    ):
         self.id = id
         self.status = status
         self.payload = payload
+        self.estacao = estacao
+        self.reservado_ate = reservado_ate
+        self.tentativas = tentativas
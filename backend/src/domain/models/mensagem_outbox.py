@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.models.evento_pagamento import EventoPagamento
+from src.domain.models.evento_pedido import EventoPedido
+
+AGREGADO_PEDIDO = "pedido"
+AGREGADO_PAGAMENTO = "pagamento"
+
+TIPO_PEDIDO_STATUS = "pedido.status"
+TIPO_PEDIDO_REMOVIDO = "pedido.removido"
+TIPO_PAGAMENTO_STATUS = "pagamento.status"
+
+
+@dataclass(frozen=True)
+class MensagemOutbox:
+    """Evento confirmado, na ordem do fluxo de mudanças (``id`` crescente).
+
+    ``id`` e ``criado_em`` são atribuídos pelo banco; consumidores usam o
+    ``id`` para descartar reentregas (a entrega é "pelo menos uma vez").
+    """
+    agregado: str
+    agregado_id: UUID
+    tipo: str
+    dados: dict
+    id: int | None = None
+    criado_em: datetime | None = None
+
+    @classmethod
+    def de_evento(cls, evento: EventoPedido | EventoPagamento) -> "MensagemOutbox":
+        if isinstance(evento, EventoPagamento):
+            return cls(
+                agregado=AGREGADO_PAGAMENTO,
+                agregado_id=evento.pedido_id,
+                tipo=TIPO_PAGAMENTO_STATUS,
+                dados={"status": evento.status, "ocorrido_em": evento.ocorrido_em.isoformat()},
+            )
+        return cls(
+            agregado=AGREGADO_PEDIDO,
+            agregado_id=evento.pedido_id,
+            tipo=TIPO_PEDIDO_REMOVIDO if evento.removido else TIPO_PEDIDO_STATUS,
+            dados={"status": evento.status.value, "ocorrido_em": evento.ocorrido_em.isoformat()},
+        )
+
+    def para_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "agregado": self.agregado,
+            "agregado_id": str(self.agregado_id),
+            "tipo": self.tipo,
+            "dados": self.dados,
+            "criado_em": self.criado_em.isoformat() if self.criado_em else None,
+        }
@@ -1,6 +1,9 @@
 from datetime import UTC, datetime
 from uuid import UUID, uuid4
 
+# Status final: notificações posteriores (reentregas fora de ordem) não o alteram
+STATUS_APROVADO = "approved"
+
 
 class Pagamento:
     def __init__(
@@ -6,6 +6,19 @@ from src.domain.models.item_pedido import ItemPedido
 from src.domain.models.status_pedido import StatusPedido
 
 
+# Transições de status permitidas: status atual -> próximos status válidos
+TRANSICOES_VALIDAS = {
+    StatusPedido.RECEBIDO: [StatusPedido.PAGO, StatusPedido.PREPARANDO],
+    StatusPedido.PAGO: [StatusPedido.PREPARANDO],
+    StatusPedido.PREPARANDO: [StatusPedido.PRONTO],
+    StatusPedido.PRONTO: [StatusPedido.FINALIZADO],
+    StatusPedido.FINALIZADO: []
+}
+
+# Status em que o pedido ainda pode ser cancelado
+STATUS_CANCELAVEIS = [StatusPedido.RECEBIDO, StatusPedido.PAGO]
+
+
 class Pedido:
     def __init__(
         self,
@@ -15,6 +28,7 @@ class Pedido:
         data_criacao: datetime | None = None,
         itens: list[ItemPedido] | None = None,
         observacoes: str | None = None,
+        versao: int | None = None,
     ):
         self.id = id
         self.cliente_id = cliente_id
@@ -22,6 +36,8 @@ class Pedido:
         self.data_criacao = data_criacao or datetime.now(UTC)
         self.itens = itens or []
         self.observacoes = observacoes
+        # Versão de persistência (cresce a cada alteração); None se não carregada
+        self.versao = versao
         
         # Validações de domínio
         self._validar_pedido()
@@ -79,19 +95,19 @@ class Pedido:
 
     def atualizar_status(self, novo_status: StatusPedido) -> None:
         """Atualiza o status do pedido com validações de transição"""
-        transicoes_validas = {
-            StatusPedido.RECEBIDO: [StatusPedido.PAGO, StatusPedido.PREPARANDO],
-            StatusPedido.PAGO: [StatusPedido.PREPARANDO],
-            StatusPedido.PREPARANDO: [StatusPedido.PRONTO],
-            StatusPedido.PRONTO: [StatusPedido.FINALIZADO],
-            StatusPedido.FINALIZADO: []
-        }
-        
-        if novo_status not in transicoes_validas.get(self.status, []):
+        if novo_status not in TRANSICOES_VALIDAS.get(self.status, []):
             raise ValueError(f"Transição de status inválida: {self.status} -> {novo_status}")
         
         self.status = novo_status
 
+    @staticmethod
+    def status_de_origem(novo_status: StatusPedido) -> list[StatusPedido]:
+        """Status a partir dos quais a transição para novo_status é permitida"""
+        return [
+            origem for origem, destinos in TRANSICOES_VALIDAS.items()
+            if novo_status in destinos
+        ]
+
     def calcular_total(self) -> float:
         """Calcula o total do pedido"""
         # Esta implementação seria expandida com os preços dos produtos
@@ -99,7 +115,7 @@ class Pedido:
 
     def pode_ser_cancelado(self) -> bool:
         """Verifica se o pedido pode ser cancelado"""
-        return self.status in [StatusPedido.RECEBIDO, StatusPedido.PAGO]
+        return self.status in STATUS_CANCELAVEIS
 
     def cancelar(self) -> None:
         """Cancela o pedido"""
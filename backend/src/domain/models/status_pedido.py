@@ -7,3 +7,13 @@ class StatusPedido(str, Enum):
     PREPARANDO = "Em preparação"
     PRONTO = "Pronto"
     FINALIZADO = "Finalizado"
+
+
+# Prioridade de exibição no painel da cozinha (menor valor aparece primeiro).
+# Pedidos finalizados não aparecem no painel e por isso não têm prioridade.
+PRIORIDADE_STATUS = {
+    StatusPedido.PRONTO: 1,
+    StatusPedido.PREPARANDO: 2,
+    StatusPedido.RECEBIDO: 3,
+    StatusPedido.PAGO: 4,
+}
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+
+# Estados de uma notificação na caixa de entrada
+ESTADO_PENDENTE = "pendente"
+ESTADO_PROCESSADO = "processado"
+ESTADO_FALHOU = "falhou"  # esgotou as tentativas; exige intervenção
+
+
+@dataclass(frozen=True)
+class WebhookPagamento:
+    """Notificação de pagamento recebida e ainda a processar."""
+    chave: str
+    status: str
+    payload: str
+    tentativas: int = 0
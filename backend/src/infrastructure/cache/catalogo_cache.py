@@ -0,0 +1,54 @@
+import logging
+import threading
+import time
+from typing import Callable, TypeVar
+
+from src.config import settings
+from src.ports.cache.catalogo_cache_port import CatalogoCachePort
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Canal do LISTEN/NOTIFY usado para avisar os demais processos que o
+# catálogo mudou; o NOTIFY é emitido na mesma transação da alteração.
+CANAL_CATALOGO = "catalogo_produtos"
+
+
+class CatalogoCache(CatalogoCachePort):
+    """Cache em memória do processo, com TTL e invalidação por versão.
+
+    Cada ``invalidar`` incrementa a versão. Um valor carregado só é guardado se
+    a versão não mudou durante o carregamento, para que uma leitura iniciada
+    antes de uma alteração não repovoe o cache com o catálogo antigo.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._versao = 0
+        self._entradas: dict[str, tuple[float, object]] = {}
+
+    def obter_ou_carregar(self, chave: str, carregar: Callable[[], T]) -> T:
+        agora = time.monotonic()
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is not None and entrada[0] > agora:
+                return entrada[1]
+            versao = self._versao
+
+        valor = carregar()
+
+        with self._lock:
+            if versao == self._versao and self.ttl > 0:
+                self._entradas[chave] = (agora + self.ttl, valor)
+        return valor
+
+    def invalidar(self) -> None:
+        with self._lock:
+            self._versao += 1
+            self._entradas.clear()
+        logger.debug("Cache do catálogo invalidado")
+
+
+catalogo_cache = CatalogoCache(settings.CATALOGO_CACHE_TTL)
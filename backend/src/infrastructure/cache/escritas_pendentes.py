@@ -0,0 +1,37 @@
+import threading
+from collections import Counter
+from typing import Hashable, Iterable
+
+
+class EscritasPendentes:
+    """Chaves com escrita ainda não confirmada neste processo (thread-safe).
+
+    Quem carrega do banco para um cache lê ``geracao()`` antes da consulta e
+    só guarda o resultado com ``pode_guardar``: se alguma escrita começou ou
+    terminou no meio, ou ainda há uma em andamento para a chave, o que foi
+    lido pode ser o estado anterior a ela.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pendentes: Counter[Hashable] = Counter()
+        self._geracao = 0
+
+    def geracao(self) -> int:
+        with self._lock:
+            return self._geracao
+
+    def iniciar(self, chaves: Iterable[Hashable]) -> None:
+        with self._lock:
+            self._pendentes.update(chaves)
+            self._geracao += 1
+
+    def encerrar(self, chaves: Iterable[Hashable]) -> None:
+        with self._lock:
+            self._pendentes.subtract(chaves)
+            self._pendentes += Counter()  # remove as chaves zeradas
+            self._geracao += 1
+
+    def pode_guardar(self, chaves: Iterable[Hashable], geracao: int) -> bool:
+        with self._lock:
+            return self._geracao == geracao and not any(self._pendentes[chave] for chave in chaves)
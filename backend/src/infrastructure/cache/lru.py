@@ -0,0 +1,46 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Hashable, TypeVar
+
+from src.ports.cache.cache_lru_port import CacheLRUPort
+
+V = TypeVar("V")
+
+
+class CacheLRU(CacheLRUPort[V]):
+    """LRU do processo com TTL por entrada (thread-safe).
+
+    ``OrderedDict`` mantém a ordem de uso: cada acerto move a entrada para o
+    fim, e ao passar de ``capacidade`` sai a do início.
+    """
+
+    def __init__(self, capacidade: int, ttl: float):
+        self.capacidade = capacidade
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entradas: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+
+    def obter(self, chave: Hashable) -> V | None:
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is None:
+                return None
+            if entrada[0] <= time.monotonic():
+                del self._entradas[chave]
+                return None
+            self._entradas.move_to_end(chave)
+            return entrada[1]
+
+    def guardar(self, chave: Hashable, valor: V) -> None:
+        if self.capacidade <= 0:
+            return
+        with self._lock:
+            self._entradas[chave] = (time.monotonic() + self.ttl, valor)
+            self._entradas.move_to_end(chave)
+            while len(self._entradas) > self.capacidade:
+                self._entradas.popitem(last=False)
+
+    def descartar(self, chave: Hashable) -> None:
+        with self._lock:
+            self._entradas.pop(chave, None)
@@ -0,0 +1,38 @@
+import threading
+
+
+class MetricasCache:
+    """Contadores de acerto e falta de um cache (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.acertos = 0
+        self.acertos_negativos = 0
+        self.faltas = 0
+        self.invalidacoes = 0
+
+    def registrar_acerto(self, negativo: bool = False) -> None:
+        with self._lock:
+            if negativo:
+                self.acertos_negativos += 1
+            else:
+                self.acertos += 1
+
+    def registrar_falta(self) -> None:
+        with self._lock:
+            self.faltas += 1
+
+    def registrar_invalidacao(self) -> None:
+        with self._lock:
+            self.invalidacoes += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            consultas = self.acertos + self.acertos_negativos + self.faltas
+            return {
+                "hits": self.acertos,
+                "negative_hits": self.acertos_negativos,
+                "misses": self.faltas,
+                "invalidations": self.invalidacoes,
+                "hit_ratio": round((self.acertos + self.acertos_negativos) / consultas, 4) if consultas else 0.0,
+            }
@@ -0,0 +1,196 @@
+import bisect
+import copy
+import logging
+import threading
+from datetime import datetime
+from typing import Callable
+from uuid import UUID
+
+from src.config import settings
+from src.domain.models.evento_pedido import EventoPedido
+from src.domain.models.pedido import Pedido
+from src.domain.models.status_pedido import PRIORIDADE_STATUS
+from src.ports.cache.painel_pedidos_port import PainelPedidosPort
+
+logger = logging.getLogger(__name__)
+
+Chave = tuple[int, datetime, UUID]
+
+
+def _chave(pedido: Pedido) -> Chave:
+    # NULL vem por último no ORDER BY ... ASC do Postgres
+    return (PRIORIDADE_STATUS[pedido.status], pedido.data_criacao or datetime.max, pedido.id)
+
+
+def _itens(pedido: Pedido) -> list[tuple[UUID, int]]:
+    # Os itens não têm ordem definida no banco
+    return sorted((item.produto_id, item.quantidade) for item in pedido.itens)
+
+
+class PainelPedidos(PainelPedidosPort):
+    """Pedidos em aberto deste processo, mantidos em ordem pelos eventos.
+
+    As chaves ficam numa lista ordenada (``bisect``): uma página custa
+    O(log n + k) e nenhuma consulta. Eventos de status reposicionam o pedido
+    na hora; pedidos novos ou com itens alterados são recarregados do banco em
+    lote por uma thread própria, que também refaz a carga completa a cada
+    ``intervalo_verificacao`` segundos e registra as divergências encontradas.
+
+    Cada evento recebe um número de sequência. Uma carga iniciada antes do
+    último evento de um pedido não sobrescreve esse pedido: o evento é mais
+    novo que a leitura, e o pedido já está na fila de recarga.
+    """
+
+    def __init__(self, intervalo_verificacao: float):
+        self.intervalo_verificacao = intervalo_verificacao
+        self._lock = threading.Lock()
+        self._chaves: list[Chave] = []
+        self._pedidos: dict[UUID, Pedido] = {}
+        self._pronto = False
+        self._sequencia = 0
+        self._ultimo_evento: dict[UUID, int] = {}
+        self._pendentes: set[UUID] = set()
+        self._recarregar_tudo = True
+        self._acordar = threading.Event()
+        self._parar = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._carregar_em_aberto: Callable[[], list[Pedido]] | None = None
+        self._carregar_por_ids: Callable[[list[UUID]], list[Pedido]] | None = None
+
+    def iniciar(
+        self,
+        carregar_em_aberto: Callable[[], list[Pedido]],
+        carregar_por_ids: Callable[[list[UUID]], list[Pedido]],
+    ) -> None:
+        self._carregar_em_aberto = carregar_em_aberto
+        self._carregar_por_ids = carregar_por_ids
+        self._parar.clear()
+        self._acordar.set()  # carga inicial
+        self._thread = threading.Thread(target=self._executar, name="painel-pedidos", daemon=True)
+        self._thread.start()
+
+    def parar(self) -> None:
+        self._parar.set()
+        self._acordar.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        with self._lock:
+            self._pronto = False
+            self._recarregar_tudo = True
+
+    def listar(
+        self,
+        limite: int | None = None,
+        apos: Chave | None = None,
+    ) -> list[Pedido] | None:
+        with self._lock:
+            if not self._pronto:
+                return None
+            inicio = bisect.bisect_right(self._chaves, apos) if apos is not None else 0
+            fim = len(self._chaves) if limite is None else inicio + limite
+            return [self._pedidos[chave[2]] for chave in self._chaves[inicio:fim]]
+
+    def aplicar(self, evento: EventoPedido) -> None:
+        with self._lock:
+            self._sequencia += 1
+            self._ultimo_evento[evento.pedido_id] = self._sequencia
+            if evento.removido or evento.status not in PRIORIDADE_STATUS:
+                self._remover(evento.pedido_id)
+                self._pendentes.discard(evento.pedido_id)
+                return
+            atual = self._pedidos.get(evento.pedido_id)
+            if atual is not None and atual.status != evento.status:
+                # Cópia: a versão anterior pode estar sendo serializada
+                novo = copy.copy(atual)
+                novo.status = evento.status
+                self._substituir(novo)
+            # Pedido novo ou itens alterados: só o banco tem o estado completo
+            self._pendentes.add(evento.pedido_id)
+        self._acordar.set()
+
+    def invalidar(self) -> None:
+        with self._lock:
+            self._pronto = False
+            self._recarregar_tudo = True
+        self._acordar.set()
+
+    def _executar(self) -> None:
+        while not self._parar.is_set():
+            expirou = not self._acordar.wait(self.intervalo_verificacao)
+            self._acordar.clear()
+            if self._parar.is_set():
+                break
+            try:
+                with self._lock:
+                    completa = self._recarregar_tudo or expirou
+                if completa:
+                    self._recarregar()
+                else:
+                    self._recarregar_pendentes()
+            except Exception:
+                logger.exception("Falha ao atualizar o painel de pedidos; nova tentativa em breve")
+                with self._lock:
+                    self._recarregar_tudo = True
+                self._parar.wait(1)
+                self._acordar.set()
+
+    def _recarregar(self) -> None:
+        with self._lock:
+            inicio = self._sequencia
+            self._pendentes.clear()
+            verificar = self._pronto
+        pedidos = {p.id: p for p in self._carregar_em_aberto() if p.status in PRIORIDADE_STATUS}
+        with self._lock:
+            divergentes = self._instalar(pedidos, set(self._pedidos) | set(pedidos), inicio)
+            # Sequências até ``inicio`` já estão refletidas na carga completa
+            self._ultimo_evento = {
+                pedido_id: seq for pedido_id, seq in self._ultimo_evento.items() if seq > inicio
+            }
+            self._recarregar_tudo = False
+            self._pronto = True
+        if verificar and divergentes:
+            logger.warning("Painel de pedidos divergia do banco em %d pedido(s); corrigido", divergentes)
+
+    def _recarregar_pendentes(self) -> None:
+        with self._lock:
+            if not self._pendentes:
+                return
+            ids = list(self._pendentes)
+            self._pendentes.clear()
+            inicio = self._sequencia
+        pedidos = {p.id: p for p in self._carregar_por_ids(ids) if p.status in PRIORIDADE_STATUS}
+        with self._lock:
+            self._instalar(pedidos, ids, inicio)
+
+    def _instalar(self, carregados: dict[UUID, Pedido], ids, inicio: int) -> int:
+        """Aplica a leitura do banco a ``ids``; devolve quantos mudaram."""
+        divergentes = 0
+        for pedido_id in ids:
+            if self._ultimo_evento.get(pedido_id, 0) > inicio:
+                continue
+            atual = self._pedidos.get(pedido_id)
+            novo = carregados.get(pedido_id)
+            if novo is None:
+                if atual is not None:
+                    self._remover(pedido_id)
+                    divergentes += 1
+            else:
+                if atual is None or _chave(atual) != _chave(novo) or _itens(atual) != _itens(novo):
+                    divergentes += 1
+                self._substituir(novo)
+        return divergentes
+
+    def _substituir(self, pedido: Pedido) -> None:
+        self._remover(pedido.id)
+        self._pedidos[pedido.id] = pedido
+        bisect.insort(self._chaves, _chave(pedido))
+
+    def _remover(self, pedido_id: UUID) -> None:
+        atual = self._pedidos.pop(pedido_id, None)
+        if atual is not None:
+            chave = _chave(atual)
+            del self._chaves[bisect.bisect_left(self._chaves, chave)]
+
+
+painel_pedidos = PainelPedidos(settings.PAINEL_PEDIDOS_VERIFICACAO)
@@ -0,0 +1,86 @@
+import logging
+import select
+import threading
+from typing import Callable
+
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+
+logger = logging.getLogger(__name__)
+
+
+class PgListener:
+    """Thread que recebe LISTEN/NOTIFY do Postgres e repassa aos callbacks.
+
+    Usa uma conexão própria, destacada do pool do ``engine`` (mesmas opções
+    de conexão, sem ocupar uma vaga do pool). Notificações enviadas enquanto
+    a conexão estava caída se perdem; por isso, a cada (re)conexão os
+    callbacks são chamados com ``payload=None`` para que descartem o estado
+    que possa ter ficado desatualizado.
+    """
+
+    def __init__(self, engine, intervalo_reconexao: float = 5.0):
+        self.engine = engine
+        self.intervalo_reconexao = intervalo_reconexao
+        self._callbacks: dict[str, list[Callable[[str | None], None]]] = {}
+        self._parar = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def registrar(self, canal: str, callback: Callable[[str | None], None]) -> None:
+        self._callbacks.setdefault(canal, []).append(callback)
+
+    def iniciar(self) -> None:
+        if self._thread is not None or not self._callbacks:
+            return
+        self._parar.clear()
+        self._thread = threading.Thread(target=self._executar, name="pg-listener", daemon=True)
+        self._thread.start()
+
+    def parar(self) -> None:
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.intervalo_reconexao + 1)
+            self._thread = None
+
+    def _executar(self) -> None:
+        while not self._parar.is_set():
+            conexao = None
+            try:
+                conexao = self._conectar()
+                self._despachar_todos(None)
+                while not self._parar.is_set():
+                    if select.select([conexao], [], [], 1.0) == ([], [], []):
+                        continue
+                    conexao.poll()
+                    while conexao.notifies:
+                        notificacao = conexao.notifies.pop(0)
+                        self._despachar(notificacao.channel, notificacao.payload)
+            except Exception as e:
+                logger.warning(f"Listener do Postgres desconectado: {e}")
+                self._parar.wait(self.intervalo_reconexao)
+            finally:
+                if conexao is not None:
+                    try:
+                        conexao.close()
+                    except Exception:
+                        pass
+
+    def _conectar(self):
+        conexao_pool = self.engine.raw_connection()
+        conexao = conexao_pool.driver_connection
+        conexao_pool.detach()
+        conexao.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        with conexao.cursor() as cursor:
+            for canal in self._callbacks:
+                cursor.execute(f'LISTEN "{canal}"')
+        return conexao
+
+    def _despachar_todos(self, payload: str | None) -> None:
+        for canal in self._callbacks:
+            self._despachar(canal, payload)
+
+    def _despachar(self, canal: str, payload: str | None) -> None:
+        for callback in self._callbacks.get(canal, []):
+            try:
+                callback(payload)
+            except Exception as e:
+                logger.error(f"Erro ao processar notificação do canal {canal}: {e}")
@@ -1,17 +1,25 @@
 from .categoria_model import CategoriaModel
+from .chave_idempotencia_model import ChaveIdempotenciaModel
 from .cliente_model import ClienteModel
 from .fila_pedidos_model import FilaPedidosModel
 from .item_pedido_model import ItemPedidoModel
+from .outbox_model import OutboxModel
 from .pagamento_model import PagamentoModel
 from .pedido_model import PedidoModel
+from .pedido_removido_model import PedidoRemovidoModel
 from .produto_model import ProdutoModel
+from .webhook_pagamento_model import WebhookPagamentoModel
 
 __all__ = [
+    "ChaveIdempotenciaModel",
     "ClienteModel",
     "FilaPedidosModel",
     "ItemPedidoModel",
+    "OutboxModel",
     "PedidoModel",
+    "PedidoRemovidoModel",
     "ProdutoModel",
     "CategoriaModel",
     "PagamentoModel",
+    "WebhookPagamentoModel",
 ]
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Index, String, Text, text
+
+from src.infrastructure.db.session import Base
+from src.infrastructure.db.types import NaiveUTCDateTime
+
+
+class ChaveIdempotenciaModel(Base):
+    """Resposta já entregue para um ``Idempotency-Key`` (expira por TTL)."""
+    __tablename__ = "tb_chaves_idempotencia"
+    __table_args__ = (Index("ix_chaves_idempotencia_criado_em", "criado_em"),)
+    chave = Column(String(255), primary_key=True)
+    hash_requisicao = Column(String(64), nullable=False)
+    resposta = Column(Text, nullable=True)
+    criado_em = Column(NaiveUTCDateTime, nullable=False, server_default=text("timezone('UTC', now())"))
@@ -1,13 +1,20 @@
 import uuid
 
-from sqlalchemy import Column, String
+from sqlalchemy import CHAR, CheckConstraint, Column, String
 from sqlalchemy.dialects.postgresql import UUID
 
 from src.infrastructure.db.session import Base
 
 
+# CPF gravado só com os dígitos (ver Cliente.normalizar_cpf)
+CPF_DIGITOS = 11
+
+
 class ClienteModel(Base):
     __tablename__ = "tb_clientes"
+    __table_args__ = (
+        CheckConstraint(f"cpf ~ '^[0-9]{{{CPF_DIGITOS}}}$'", name="ck_clientes_cpf_digitos"),
+    )
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
@@ -16,6 +23,6 @@ class ClienteModel(Base):
         nullable=False,
     )
     nome = Column(String, nullable=True)
-    cpf = Column(String, unique=True, nullable=True)
+    cpf = Column(CHAR(CPF_DIGITOS), unique=True, nullable=True)
     email = Column(String, unique=True, nullable=True)
 
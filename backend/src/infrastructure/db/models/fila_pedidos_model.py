@@ -1,13 +1,41 @@
 import uuid
 
-from sqlalchemy import Column, String
+from sqlalchemy import Column, Index, Integer, String, literal_column, text
 from sqlalchemy.dialects.postgresql import UUID
 
+from src.domain.models.status_pedido import PRIORIDADE_STATUS, StatusPedido
 from src.infrastructure.db.session import Base
+from src.infrastructure.db.types import NaiveUTCDateTime
+
+# Status em que o pedido é trabalho da cozinha (pode ser reservado por uma estação)
+STATUS_RESERVAVEIS = [StatusPedido.RECEBIDO, StatusPedido.PAGO, StatusPedido.PREPARANDO]
+
+# Mesma prioridade do painel, escrita como SQL literal: o índice de expressão
+# abaixo só é usado se a consulta trouxer exatamente esta expressão, sem
+# parâmetros (o asyncpg envia parâmetros ao servidor).
+PRIORIDADE_FILA = literal_column(
+    "(CASE status "
+    + " ".join(f"WHEN '{status.value}' THEN {p}" for status, p in PRIORIDADE_STATUS.items())
+    + f" ELSE {len(PRIORIDADE_STATUS) + 1} END)"
+)
 
 
 class FilaPedidosModel(Base):
     __tablename__ = "tb_fila_pedidos"
+    __table_args__ = (
+        # Ordem de reserva da cozinha (prioridade, idade) só sobre o que ainda é
+        # trabalho: a varredura com LIMIT ... FOR UPDATE SKIP LOCKED para cedo.
+        Index(
+            "ix_fila_pedidos_reservaveis",
+            PRIORIDADE_FILA,
+            "data_criacao",
+            postgresql_where=text(
+                "concluido_em IS NULL AND status IN ("
+                + ", ".join(f"'{s.value}'" for s in STATUS_RESERVAVEIS)
+                + ")"
+            ),
+        ),
+    )
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
@@ -17,3 +45,9 @@ class FilaPedidosModel(Base):
     )
     status = Column(String, default="pendente", nullable=False)
     payload = Column(String, nullable=True)
+    data_criacao = Column(NaiveUTCDateTime, nullable=False, server_default=text("timezone('UTC', now())"))
+    # Reserva (lease) da estação que está preparando o pedido
+    estacao = Column(String, nullable=True)
+    reservado_ate = Column(NaiveUTCDateTime, nullable=True)
+    tentativas = Column(Integer, nullable=False, server_default=text("0"))
+    concluido_em = Column(NaiveUTCDateTime, nullable=True)
@@ -0,0 +1,31 @@
+from sqlalchemy import BigInteger, Column, Identity, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.infrastructure.db.session import Base
+from src.infrastructure.db.types import XID_ATUAL_DDL, NaiveUTCDateTime
+
+
+class OutboxModel(Base):
+    """Eventos de pedido e pagamento gravados na transação que os produziu.
+
+    Só cresce: o relay marca ``publicado_em`` depois de entregar a linha a
+    todos os destinos, e linhas publicadas antigas são removidas por
+    retenção. ``versao`` é o xid da transação que publicou a linha (ver
+    types.XID_ATUAL): consumidores do NOTIFY recuperam o que perderam por
+    ela, não pelo id, que é atribuído antes do commit e fora de ordem.
+    """
+    __tablename__ = "tb_outbox"
+    __table_args__ = (
+        # O relay lê só o que falta publicar, em ordem de id
+        Index("ix_outbox_nao_publicados", "id", postgresql_where=text("publicado_em IS NULL")),
+        Index("ix_outbox_publicado_em", "publicado_em"),
+        Index("ix_outbox_versao", "versao", "id", postgresql_where=text("publicado_em IS NOT NULL")),
+    )
+    id = Column(BigInteger, Identity(always=True), primary_key=True)
+    agregado = Column(String(32), nullable=False)
+    agregado_id = Column(UUID(as_uuid=True), nullable=False)
+    tipo = Column(String(64), nullable=False)
+    dados = Column(Text, nullable=False)
+    criado_em = Column(NaiveUTCDateTime, nullable=False, server_default=text("timezone('UTC', now())"))
+    publicado_em = Column(NaiveUTCDateTime, nullable=True)
+    versao = Column(BigInteger, nullable=False, server_default=XID_ATUAL_DDL)
@@ -1,11 +1,12 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import Column, ForeignKey, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.db.session import Base
+from src.infrastructure.db.types import NaiveUTCDateTime
 
 
 class PagamentoModel(Base):
@@ -19,8 +20,8 @@ class PagamentoModel(Base):
     )
     pedido_id = Column(UUID(as_uuid=True), ForeignKey("tb_pedidos.id"), nullable=False)
     status = Column(String, default="pendente", nullable=False)
-    data_criacao = Column(DateTime, default=datetime.now(UTC))
-    data_confirmacao = Column(DateTime, nullable=True)
+    data_criacao = Column(NaiveUTCDateTime, default=datetime.now(UTC))
+    data_confirmacao = Column(NaiveUTCDateTime, nullable=True)
     pedido = relationship("PedidoModel", back_populates="pagamento")
 
 
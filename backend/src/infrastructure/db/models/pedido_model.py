@@ -1,15 +1,49 @@
 import uuid
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy import BigInteger, Column, ForeignKey, Index, String, literal_column, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
+from src.domain.models.status_pedido import PRIORIDADE_STATUS
 from src.infrastructure.db.session import Base
+from src.infrastructure.db.types import XID_ATUAL, XID_ATUAL_DDL, NaiveUTCDateTime
+
+# Pedidos do painel da cozinha, como SQL literal: com parâmetro (asyncpg) o
+# planejador não provaria o predicado do índice parcial abaixo
+PEDIDO_EM_ABERTO = text("status <> 'Finalizado'")
+
+# Prioridade do painel escrita como SQL literal, como PRIORIDADE_FILA: o índice
+# de expressão abaixo só é usado se a consulta trouxer exatamente esta expressão
+PRIORIDADE_PEDIDO = literal_column(
+    "(CASE status "
+    + " ".join(f"WHEN '{status.value}' THEN {p}" for status, p in PRIORIDADE_STATUS.items())
+    + f" ELSE {len(PRIORIDADE_STATUS) + 1} END)"
+)
 
 
 class PedidoModel(Base):
     __tablename__ = "tb_pedidos"
+    __table_args__ = (
+        # Índice parcial do painel da cozinha: cobre apenas pedidos em aberto,
+        # então não cresce com o histórico de pedidos finalizados.
+        Index(
+            "ix_pedidos_em_aberto_status_data",
+            "status",
+            "data_criacao",
+            postgresql_where=text("status <> 'Finalizado'"),
+        ),
+        # Ordem e keyset do painel (listar_ordenados): cada página é uma
+        # varredura de intervalo no índice, sem ordenar todos os em aberto
+        Index(
+            "ix_pedidos_em_aberto_prioridade",
+            PRIORIDADE_PEDIDO,
+            "data_criacao",
+            "id",
+            postgresql_where=PEDIDO_EM_ABERTO,
+        ),
+        Index("ix_pedidos_versao", "versao", "id"),
+    )
     id = Column(
         UUID(as_uuid=True),
         primary_key=True,
@@ -19,8 +53,15 @@ class PedidoModel(Base):
     )
     cliente_id = Column(UUID(as_uuid=True), ForeignKey("tb_clientes.id"), nullable=False)
     status = Column(String, default="pendente", nullable=False)
-    data_criacao = Column(DateTime, default=datetime.now(UTC))
-    itens = relationship("ItemPedidoModel", back_populates="pedido")
+    data_criacao = Column(NaiveUTCDateTime, default=datetime.now(UTC))
+    # xid da última transação que alterou o pedido (ver types.XID_ATUAL)
+    versao = Column(
+        BigInteger,
+        nullable=False,
+        server_default=XID_ATUAL_DDL,
+        onupdate=XID_ATUAL,
+    )
+    itens = relationship("ItemPedidoModel", back_populates="pedido", cascade="all, delete-orphan")
     pagamento = relationship("PagamentoModel", back_populates="pedido", uselist=False)
 
 
@@ -0,0 +1,14 @@
+from sqlalchemy import BigInteger, Column, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.infrastructure.db.session import Base
+from src.infrastructure.db.types import XID_ATUAL_DDL, NaiveUTCDateTime
+
+
+class PedidoRemovidoModel(Base):
+    """Marca de remoção de um pedido, para que o delta de /changes a informe."""
+    __tablename__ = "tb_pedidos_removidos"
+    __table_args__ = (Index("ix_pedidos_removidos_versao", "versao"),)
+    pedido_id = Column(UUID(as_uuid=True), primary_key=True)
+    versao = Column(BigInteger, nullable=False, server_default=XID_ATUAL_DDL)
+    removido_em = Column(NaiveUTCDateTime, nullable=False)
@@ -0,0 +1,42 @@
+from sqlalchemy import Column, Index, Integer, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.domain.models.webhook_pagamento import ESTADO_PENDENTE, ESTADO_PROCESSADO
+from src.infrastructure.db.session import Base
+from src.infrastructure.db.types import NaiveUTCDateTime
+
+
+class WebhookPagamentoModel(Base):
+    """Caixa de entrada das notificações de pagamento.
+
+    A chave é o ``payment_id`` do provedor (ou ``external_reference``, ou o
+    pedido) e o status: a mesma cobrança notifica "pending" e depois
+    "approved", e cada mudança deve ser processada uma vez. Reentregas
+    encontram a chave e são descartadas enquanto a notificação processada
+    estiver retida (``WEBHOOK_RETENCAO_HORAS``).
+    """
+    __tablename__ = "tb_webhooks_pagamento"
+    __table_args__ = (
+        # Só o que falta processar, na ordem em que fica disponível
+        Index(
+            "ix_webhooks_pagamento_pendentes",
+            "proxima_tentativa",
+            postgresql_where=text(f"estado = '{ESTADO_PENDENTE}'"),
+        ),
+        # Remoção dos processados além da retenção
+        Index(
+            "ix_webhooks_pagamento_processados",
+            "processado_em",
+            postgresql_where=text(f"estado = '{ESTADO_PROCESSADO}'"),
+        ),
+    )
+    chave = Column(String(255), primary_key=True)
+    status = Column(String(32), primary_key=True)
+    pedido_id = Column(UUID(as_uuid=True), nullable=False)
+    recebido_em = Column(NaiveUTCDateTime, nullable=False, server_default=text("timezone('UTC', now())"))
+    payload = Column(Text, nullable=True)
+    estado = Column(String(16), nullable=False, server_default=ESTADO_PENDENTE)
+    tentativas = Column(Integer, nullable=False, server_default=text("0"))
+    proxima_tentativa = Column(NaiveUTCDateTime, nullable=False, server_default=text("timezone('UTC', now())"))
+    erro = Column(Text, nullable=True)
+    processado_em = Column(NaiveUTCDateTime, nullable=True)
@@ -0,0 +1,92 @@
+import threading
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """Contadores de espera por conexão de um pool (thread-safe)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def registrar(self, espera: float, timeout: bool = False):
+        with self._lock:
+            if timeout:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.wait_total += espera
+            self.wait_max = max(self.wait_max, espera)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_total_ms": round(self.wait_total * 1000, 3),
+                "wait_avg_ms": round(self.wait_total * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+            }
+
+
+class _InstrumentedPoolMixin:
+    """Mede quanto tempo cada checkout espera por uma conexão livre.
+
+    ``_do_get`` é o ponto em que o QueuePool bloqueia quando ``pool_size`` e
+    ``max_overflow`` estão esgotados; o tempo gasto ali é a espera na fila.
+    """
+
+    metrics: PoolMetrics
+
+    def __init__(self, *args, metrics: PoolMetrics | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = metrics or PoolMetrics()
+
+    def recreate(self):
+        novo = super().recreate()
+        # dispose()/recreate() não devem zerar os contadores expostos
+        novo.metrics = self.metrics
+        return novo
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            conexao = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.registrar(time.perf_counter() - inicio, timeout=True)
+            raise
+        self.metrics.registrar(time.perf_counter() - inicio)
+        return conexao
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_status(engine) -> dict | None:
+    """Ocupação atual e histórico de espera do pool de ``engine``."""
+    if engine is None:
+        return None
+    pool = engine.pool
+    status = {
+        "size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": pool._max_overflow,
+        "timeout_s": pool.timeout(),
+    }
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status.update(metrics.snapshot())
+    return status
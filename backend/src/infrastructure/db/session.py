@@ -1,47 +1,103 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy import create_engine, make_url
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from starlette.concurrency import run_in_threadpool
 from src.config import settings
+from src.infrastructure.db.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
 import os
 
 # Use the centralized settings
 DATABASE_URL = settings.DATABASE_URL
 
+
+def _pool_options() -> dict:
+    """Pool settings shared by the sync and async engines (see Settings.DB_*)"""
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
 # Configure engine with better error handling and SSL
 def create_database_engine():
     """Create database engine with proper configuration"""
     try:
+        connect_args = {}
+
         # Check if we're on Render
-        is_render = "render.com" in DATABASE_URL
-        
-        if is_render:
+        if "render.com" in DATABASE_URL:
             # Render-specific configuration
-            engine = create_engine(
-                DATABASE_URL,
-                pool_pre_ping=True,
-                pool_recycle=300,
-                pool_size=10,
-                max_overflow=20,
-                connect_args={
-                    "sslmode": "require",
-                    "connect_timeout": 10
-                }
-            )
-        else:
-            # Local development configuration
-            engine = create_engine(
-                DATABASE_URL,
-                pool_pre_ping=True,
-                pool_recycle=300
-            )
-        
-        return engine
+            connect_args.update({
+                "sslmode": "require",
+                "connect_timeout": 10
+            })
+
+        if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["options"] = f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"
+
+        return create_engine(
+            DATABASE_URL,
+            poolclass=InstrumentedQueuePool,
+            connect_args=connect_args,
+            **_pool_options()
+        )
     except Exception as e:
         print(f"Error creating database engine: {e}")
         raise
 
+
+def create_async_database_engine():
+    """Create the asyncpg engine used when DATABASE_ASYNC is enabled"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    try:
+        url = make_url(DATABASE_URL)
+        # libpq-only query parameters are not accepted by asyncpg.connect:
+        # sslmode becomes ssl (same values) and connect_timeout becomes timeout
+        query = dict(url.query)
+        connect_args = {}
+        sslmode = query.pop("sslmode", None)
+        if sslmode:
+            connect_args["ssl"] = sslmode
+        connect_timeout = query.pop("connect_timeout", None)
+        if connect_timeout:
+            connect_args["timeout"] = float(connect_timeout)
+        async_url = url.set(drivername="postgresql+asyncpg", query=query)
+
+        if "render.com" in DATABASE_URL:
+            # Render-specific configuration, unless the URL already sets it
+            connect_args.setdefault("ssl", "require")
+            connect_args.setdefault("timeout", 10)
+
+        if settings.DB_STATEMENT_TIMEOUT_MS > 0:
+            connect_args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+
+        return create_async_engine(
+            async_url,
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            connect_args=connect_args,
+            **_pool_options()
+        )
+    except Exception as e:
+        print(f"Error creating async database engine: {e}")
+        raise
+
+
+# The sync engine always exists: background jobs and scripts use it, and it
+# only opens connections on first use.
 engine = create_database_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+async_engine = None
+AsyncSessionLocal = None
+if settings.DATABASE_ASYNC:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    async_engine = create_async_database_engine()
+    AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
 Base = declarative_base()
 
 def get_db():
@@ -50,3 +106,27 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as async_db:
+        yield async_db
+
+
+class DatabaseExecutor:
+    """Runs the (synchronous) use cases of a request against its session.
+
+    Sync mode: the call goes to the threadpool, exactly as a plain ``def``
+    endpoint would. Async mode: the same repositories run over the
+    ``AsyncEngine`` through ``AsyncSession.run_sync``, so while the request
+    waits on Postgres it holds a coroutine, not a thread.
+    """
+
+    def __init__(self, session: Session, async_session=None):
+        self.session = session
+        self._async_session = async_session
+
+    async def run(self, fn, *args, **kwargs):
+        if self._async_session is not None:
+            return await self._async_session.run_sync(lambda _session: fn(*args, **kwargs))
+        return await run_in_threadpool(fn, *args, **kwargs)
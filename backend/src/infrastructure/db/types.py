@@ -0,0 +1,33 @@
+from datetime import UTC
+
+from sqlalchemy import BigInteger, DateTime, Text, cast, func, text
+from sqlalchemy.types import TypeDecorator
+
+# Id da transação corrente (xid8, Postgres 13+) como BIGINT. Usado como versão
+# das linhas: ``pg_snapshot_xmin`` dá o menor xid ainda em andamento, de modo
+# que uma leitura "versao >= xmin" nunca perde uma transação que commitou
+# depois de uma leitura anterior, ao contrário de uma sequence ou timestamp.
+XID_ATUAL = cast(cast(func.pg_current_xact_id(), Text), BigInteger)
+XID_ATUAL_DDL = text("(pg_current_xact_id()::text::bigint)")
+MENOR_XID_EM_ANDAMENTO = cast(cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger)
+
+# Horário do banco em UTC sem fuso, no mesmo formato das colunas NaiveUTCDateTime
+AGORA_UTC = func.timezone("UTC", func.now())
+
+
+class NaiveUTCDateTime(TypeDecorator):
+    """``TIMESTAMP WITHOUT TIME ZONE`` que aceita datetimes com fuso.
+
+    O domínio cria datas com ``datetime.now(UTC)``; o psycopg2 grava o horário
+    UTC descartando o fuso, mas o asyncpg recusa datetimes com fuso nessas
+    colunas. Converter para UTC sem fuso antes do envio mantém o mesmo valor
+    gravado nos dois drivers.
+    """
+
+    impl = DateTime
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(UTC).replace(tzinfo=None)
+        return value
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import threading
+from uuid import UUID
+
+from src.domain.models.evento_pedido import EventoPedido
+from src.ports.eventos.publicador_eventos_port import PublicadorEventosPort
+
+logger = logging.getLogger(__name__)
+
+
+class Assinatura:
+    """Fila de eventos de um cliente conectado (um stream SSE).
+
+    Pertence ao event loop que a criou; ``publicar`` pode ser chamado de
+    qualquer thread. Se o cliente não consumir a tempo e a fila encher, os
+    eventos seguintes são descartados e ``atrasada`` fica verdadeiro, para que
+    o cliente seja avisado de que precisa recarregar o estado completo.
+    """
+
+    def __init__(self, pedido_id: UUID | None, tamanho_maximo: int = 256):
+        self.pedido_id = pedido_id
+        self.atrasada = False
+        self._loop = asyncio.get_running_loop()
+        # ``None`` na fila só acorda o consumidor (ver ``sinalizar_atraso``)
+        self._fila: asyncio.Queue[EventoPedido | None] = asyncio.Queue(maxsize=tamanho_maximo)
+
+    def interessa(self, evento: EventoPedido) -> bool:
+        return self.pedido_id is None or self.pedido_id == evento.pedido_id
+
+    def entregar(self, evento: EventoPedido) -> None:
+        self._loop.call_soon_threadsafe(self._enfileirar, evento)
+
+    def sinalizar_atraso(self) -> None:
+        self._loop.call_soon_threadsafe(self._marcar_atrasada)
+
+    def _enfileirar(self, evento: EventoPedido) -> None:
+        try:
+            self._fila.put_nowait(evento)
+        except asyncio.QueueFull:
+            self.atrasada = True
+
+    def _marcar_atrasada(self) -> None:
+        self.atrasada = True
+        try:
+            self._fila.put_nowait(None)
+        except asyncio.QueueFull:
+            pass
+
+    async def proximo(self, timeout: float) -> EventoPedido | None:
+        try:
+            return await asyncio.wait_for(self._fila.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def descartar_pendentes(self) -> None:
+        while not self._fila.empty():
+            self._fila.get_nowait()
+        self.atrasada = False
+
+
+class BarramentoEventos(PublicadorEventosPort):
+    """Distribui eventos de pedido às assinaturas abertas neste processo."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._assinaturas: set[Assinatura] = set()
+
+    def assinar(self, pedido_id: UUID | None = None) -> Assinatura:
+        assinatura = Assinatura(pedido_id)
+        with self._lock:
+            self._assinaturas.add(assinatura)
+        return assinatura
+
+    def cancelar(self, assinatura: Assinatura) -> None:
+        with self._lock:
+            self._assinaturas.discard(assinatura)
+
+    def publicar(self, evento: EventoPedido) -> None:
+        for assinatura in self._abertas():
+            if assinatura.interessa(evento):
+                self._notificar(assinatura, assinatura.entregar, evento)
+
+    def sinalizar_resync(self) -> None:
+        """Eventos podem ter sido perdidos (ex.: listener reconectou)."""
+        for assinatura in self._abertas():
+            self._notificar(assinatura, assinatura.sinalizar_atraso)
+
+    def _abertas(self) -> list[Assinatura]:
+        with self._lock:
+            return list(self._assinaturas)
+
+    def _notificar(self, assinatura: Assinatura, acao, *args) -> None:
+        try:
+            acao(*args)
+        except RuntimeError:
+            # Event loop já encerrado: a conexão caiu sem cancelar
+            self.cancelar(assinatura)
+
+
+barramento_eventos = BarramentoEventos()
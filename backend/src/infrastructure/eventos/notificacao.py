@@ -0,0 +1,56 @@
+import json
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Text, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+
+from src.domain.models.evento_pedido import EventoPedido
+from src.domain.models.status_pedido import StatusPedido
+from src.ports.eventos.publicador_eventos_port import PublicadorEventosPort
+
+# Canal do LISTEN/NOTIFY com os eventos de pedido de todos os processos
+CANAL_PEDIDOS = "pedidos_eventos"
+
+
+def codificar(evento: EventoPedido) -> str:
+    """Payload compacto (o NOTIFY aceita até 8000 bytes)."""
+    dados = {"p": str(evento.pedido_id), "s": evento.status.value, "t": evento.ocorrido_em.isoformat()}
+    if evento.removido:
+        dados["r"] = 1
+    return json.dumps(dados, separators=(",", ":"))
+
+
+def decodificar(payload: str) -> EventoPedido:
+    dados = json.loads(payload)
+    return EventoPedido(
+        pedido_id=UUID(dados["p"]),
+        status=StatusPedido(dados["s"]),
+        ocorrido_em=datetime.fromisoformat(dados["t"]),
+        removido=bool(dados.get("r")),
+    )
+
+
+class PgNotifyPublicador(PublicadorEventosPort):
+    """Publica eventos com ``pg_notify`` na transação da sessão.
+
+    O Postgres só entrega a notificação no commit (e a descarta no rollback);
+    cada processo a recebe pelo seu PgListener e repassa ao barramento local,
+    inclusive o processo que fez a alteração.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def publicar(self, evento: EventoPedido) -> None:
+        self.db.execute(select(func.pg_notify(CANAL_PEDIDOS, codificar(evento))))
+
+    def publicar_lote(self, eventos: list[EventoPedido]) -> None:
+        """Um aviso por evento, todos num único comando e na ordem dada."""
+        if not eventos:
+            return
+        payloads = func.unnest(
+            bindparam("payloads", [codificar(evento) for evento in eventos], type_=ARRAY(Text))
+        ).table_valued("payload", with_ordinality="ordem").render_derived()
+        self.db.execute(select(func.pg_notify(CANAL_PEDIDOS, payloads.c.payload)).order_by(payloads.c.ordem))
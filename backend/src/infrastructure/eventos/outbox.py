@@ -0,0 +1,127 @@
+import json
+import logging
+import os
+import threading
+import urllib.request
+from typing import Callable
+
+from sqlalchemy import Text, bindparam, func, select
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from src.domain.models.mensagem_outbox import MensagemOutbox
+from src.ports.eventos.destino_outbox_port import DestinoOutboxPort
+
+logger = logging.getLogger(__name__)
+
+# Canal do LISTEN/NOTIFY com as mensagens publicadas pelo relay (uma por aviso)
+CANAL_OUTBOX_EVENTOS = "outbox_eventos"
+
+
+def _json(mensagem: MensagemOutbox) -> str:
+    return json.dumps(mensagem.para_dict(), separators=(",", ":"))
+
+
+class BarramentoOutbox(DestinoOutboxPort):
+    """Entrega os lotes a consumidores registrados neste processo.
+
+    Só recebe mensagens o processo cujo relay as publicou; consumidores em
+    outros processos usam o NOTIFY, o arquivo ou o HTTP.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._consumidores: list[Callable[[list[MensagemOutbox]], None]] = []
+
+    def assinar(self, consumidor: Callable[[list[MensagemOutbox]], None]) -> None:
+        with self._lock:
+            self._consumidores.append(consumidor)
+
+    def cancelar(self, consumidor: Callable[[list[MensagemOutbox]], None]) -> None:
+        with self._lock:
+            if consumidor in self._consumidores:
+                self._consumidores.remove(consumidor)
+
+    def publicar(self, mensagens: list[MensagemOutbox]) -> None:
+        with self._lock:
+            consumidores = list(self._consumidores)
+        for consumidor in consumidores:
+            consumidor(mensagens)
+
+
+class PgNotifyDestino(DestinoOutboxPort):
+    """Um aviso por mensagem em ``CANAL_OUTBOX_EVENTOS``, num único comando.
+
+    Quem faz LISTEN recebe as mensagens enquanto estiver conectado. Para
+    recuperar o que perdeu, não basta ler ``tb_outbox`` a partir do último
+    id: ids são atribuídos antes do commit, e um menor pode ser publicado
+    depois. O consumidor guarda ``pg_snapshot_xmin(pg_current_snapshot())``
+    lido junto com cada recuperação e, na seguinte, lê as linhas com
+    ``publicado_em IS NOT NULL AND versao >= `` esse valor, em ordem de
+    (versao, id), ignorando ids já vistos.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def publicar(self, mensagens: list[MensagemOutbox]) -> None:
+        corpos = func.unnest(
+            bindparam("corpos", [_json(mensagem) for mensagem in mensagens], type_=ARRAY(Text))
+        ).table_valued("corpo", with_ordinality="ordem").render_derived()
+        with self.engine.begin() as conexao:
+            conexao.execute(
+                select(func.pg_notify(CANAL_OUTBOX_EVENTOS, corpos.c.corpo)).order_by(corpos.c.ordem)
+            )
+
+
+class ArquivoDestino(DestinoOutboxPort):
+    """Acrescenta uma linha JSON por mensagem e força a gravação em disco."""
+
+    def __init__(self, caminho: str):
+        self.caminho = caminho
+
+    def publicar(self, mensagens: list[MensagemOutbox]) -> None:
+        with open(self.caminho, "a", encoding="utf-8") as arquivo:
+            arquivo.writelines(_json(mensagem) + "\n" for mensagem in mensagens)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+
+
+class HttpDestino(DestinoOutboxPort):
+    """POST do lote em JSON (``{"mensagens": [...]}``); falha se não for 2xx."""
+
+    def __init__(self, url: str, timeout: float = 10.0):
+        self.url = url
+        self.timeout = timeout
+
+    def publicar(self, mensagens: list[MensagemOutbox]) -> None:
+        corpo = json.dumps({"mensagens": [mensagem.para_dict() for mensagem in mensagens]}).encode()
+        requisicao = urllib.request.Request(
+            self.url, data=corpo, method="POST", headers={"Content-Type": "application/json"}
+        )
+        # urlopen levanta HTTPError para respostas 4xx/5xx
+        with urllib.request.urlopen(requisicao, timeout=self.timeout):
+            pass
+
+
+def criar_destinos(nomes: list[str], engine, arquivo: str, http_url: str) -> list[DestinoOutboxPort]:
+    """Destinos configurados em ``OUTBOX_DESTINOS``, na ordem dada."""
+    destinos: list[DestinoOutboxPort] = []
+    for nome in nomes:
+        if nome == "barramento":
+            destinos.append(barramento_outbox)
+        elif nome == "notify":
+            destinos.append(PgNotifyDestino(engine))
+        elif nome == "arquivo":
+            if not arquivo:
+                raise ValueError("OUTBOX_DESTINOS inclui 'arquivo', mas OUTBOX_ARQUIVO está vazio")
+            destinos.append(ArquivoDestino(arquivo))
+        elif nome == "http":
+            if not http_url:
+                raise ValueError("OUTBOX_DESTINOS inclui 'http', mas OUTBOX_HTTP_URL está vazio")
+            destinos.append(HttpDestino(http_url))
+        else:
+            raise ValueError(f"Destino de outbox desconhecido: {nome}")
+    return destinos
+
+
+barramento_outbox = BarramentoOutbox()
@@ -1,7 +1,21 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config import settings
+from src.constants import Defaults
+from src.infrastructure.cache.catalogo_cache import CANAL_CATALOGO, catalogo_cache
+from src.infrastructure.cache.painel_pedidos import painel_pedidos
+from src.infrastructure.db import session as db_session
+from src.infrastructure.db.listener import PgListener
+from src.infrastructure.eventos.barramento import barramento_eventos
+from src.infrastructure.eventos.notificacao import CANAL_PEDIDOS, decodificar
+from src.infrastructure.eventos.outbox import criar_destinos
 
 # Imports dos routers
 from src.adapters.input.api.public import (
@@ -14,14 +28,123 @@ from src.adapters.input.api.public import (
 
 from src.adapters.input.api.admin import (
     cliente_controller as admin_cliente_controller,
+    diagnostico_controller as admin_diagnostico_controller,
+    fila_controller as admin_fila_controller,
     pedido_controller as admin_pedido_controller,
     produto_controller as admin_produto_controller,
 )
+from src.adapters.input.workers.processador_webhooks import ProcessadorWebhooks
+from src.adapters.input.workers.relay_outbox import RelayOutbox
+from src.adapters.output.repositories.chave_idempotencia_repository import ChaveIdempotenciaRepository
+from src.adapters.output.repositories.outbox_repository import CANAL_OUTBOX
+from src.adapters.output.repositories.pedido_repository import PedidoRepository
+from src.adapters.output.repositories.webhook_pagamento_repository import CANAL_WEBHOOKS_PAGAMENTO
+
+logger = logging.getLogger(__name__)
+
+# Intervalo, em segundos, da remoção de chaves de idempotência vencidas e de
+# marcas de pedidos removidos além da retenção
+INTERVALO_LIMPEZA = 3600
+
+
+def _repassar_evento_pedido(payload: str | None) -> None:
+    if payload is None:
+        # (Re)conexão do listener: avisos enviados nesse intervalo se perderam
+        barramento_eventos.sinalizar_resync()
+        painel_pedidos.invalidar()
+    else:
+        evento = decodificar(payload)
+        painel_pedidos.aplicar(evento)
+        barramento_eventos.publicar(evento)
+
+
+def _consultar_pedidos(consulta):
+    with db_session.SessionLocal() as db:
+        return consulta(PedidoRepository(db))
+
+
+def _remover_chaves_idempotencia_expiradas() -> int:
+    limite = datetime.now(UTC) - timedelta(hours=Defaults.IDEMPOTENCIA_VALIDADE_HORAS)
+    with db_session.SessionLocal() as db:
+        removidas = ChaveIdempotenciaRepository(db).remover_expiradas(limite)
+        db.commit()
+    return removidas
+
+
+def _remover_marcas_de_remocao_expiradas() -> int:
+    limite = datetime.now(UTC) - timedelta(hours=Defaults.PEDIDOS_REMOVIDOS_RETENCAO_HORAS)
+    with db_session.SessionLocal() as db:
+        removidas = PedidoRepository(db).remover_marcas_de_remocao(limite)
+        db.commit()
+    return removidas
+
+
+async def _limpar_registros_expirados():
+    while True:
+        try:
+            removidas = await run_in_threadpool(_remover_chaves_idempotencia_expiradas)
+            if removidas:
+                logger.info("%d chave(s) de idempotência expirada(s) removida(s)", removidas)
+        except Exception:
+            logger.exception("Falha ao remover chaves de idempotência expiradas")
+        try:
+            removidas = await run_in_threadpool(_remover_marcas_de_remocao_expiradas)
+            if removidas:
+                logger.info("%d marca(s) de pedido removido expirada(s) apagada(s)", removidas)
+        except Exception:
+            logger.exception("Falha ao apagar marcas de pedidos removidos expiradas")
+        await asyncio.sleep(INTERVALO_LIMPEZA)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Um listener por processo (worker/pod) recebe as alterações de todos
+    listener = PgListener(db_session.engine)
+    listener.registrar(CANAL_CATALOGO, lambda _payload: catalogo_cache.invalidar())
+    listener.registrar(CANAL_PEDIDOS, _repassar_evento_pedido)
+    processador_webhooks = ProcessadorWebhooks(
+        db_session.SessionLocal,
+        settings.WEBHOOK_WORKERS,
+        settings.WEBHOOK_LOTE,
+        settings.WEBHOOK_MAX_TENTATIVAS,
+        timedelta(hours=settings.WEBHOOK_RETENCAO_HORAS),
+    )
+    if settings.WEBHOOK_WORKERS > 0:
+        listener.registrar(CANAL_WEBHOOKS_PAGAMENTO, lambda _payload: processador_webhooks.acordar())
+    relay_outbox = RelayOutbox(
+        db_session.SessionLocal,
+        criar_destinos(
+            settings.OUTBOX_DESTINOS, db_session.engine, settings.OUTBOX_ARQUIVO, settings.OUTBOX_HTTP_URL
+        ),
+        settings.OUTBOX_LOTE,
+        timedelta(hours=settings.OUTBOX_RETENCAO_HORAS),
+    )
+    if settings.OUTBOX_DESTINOS:
+        listener.registrar(CANAL_OUTBOX, lambda _payload: relay_outbox.acordar())
+    listener.iniciar()
+    processador_webhooks.iniciar()
+    relay_outbox.iniciar()
+    if settings.PAINEL_PEDIDOS_VERIFICACAO > 0:
+        painel_pedidos.iniciar(
+            lambda: _consultar_pedidos(lambda repo: repo.listar_em_aberto()),
+            lambda ids: _consultar_pedidos(lambda repo: repo.buscar_por_ids(ids)),
+        )
+    limpeza = asyncio.create_task(_limpar_registros_expirados())
+    try:
+        yield
+    finally:
+        limpeza.cancel()
+        relay_outbox.parar()
+        processador_webhooks.parar()
+        painel_pedidos.parar()
+        listener.parar()
+
 
 app = FastAPI(
     title=settings.API_TITLE,
     description=settings.API_DESCRIPTION,
     version=settings.API_VERSION,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -62,6 +185,8 @@ app.include_router(pagamento_controller.router)
 
 # Rotas administrativas
 app.include_router(admin_cliente_controller.router)
+app.include_router(admin_fila_controller.router)
 app.include_router(admin_pedido_controller.router)
 app.include_router(admin_produto_controller.router)
+app.include_router(admin_diagnostico_controller.router)
 
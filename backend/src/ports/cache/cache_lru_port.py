@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Generic, Hashable, TypeVar
+
+V = TypeVar("V")
+
+
+class CacheLRUPort(ABC, Generic[V]):
+    """Cache em memória de tamanho limitado: descarta o menos usado e o expirado."""
+
+    @abstractmethod
+    def obter(self, chave: Hashable) -> V | None:
+        pass
+
+    @abstractmethod
+    def guardar(self, chave: Hashable, valor: V) -> None:
+        pass
+
+    @abstractmethod
+    def descartar(self, chave: Hashable) -> None:
+        pass
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class CatalogoCachePort(ABC):
+    """Cache de leitura do catálogo de produtos.
+
+    Entradas expiram por TTL e são descartadas de uma vez por ``invalidar``,
+    chamado sempre que o catálogo muda (neste ou em outro processo).
+    """
+
+    @abstractmethod
+    def obter_ou_carregar(self, chave: str, carregar: Callable[[], T]) -> T:
+        pass
+
+    @abstractmethod
+    def invalidar(self) -> None:
+        pass
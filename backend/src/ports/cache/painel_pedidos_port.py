@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.models.evento_pedido import EventoPedido
+from src.domain.models.pedido import Pedido
+
+
+class PainelPedidosPort(ABC):
+    """Projeção em memória dos pedidos em aberto, na ordem do painel.
+
+    A posição de cada pedido é (prioridade do status, data_criacao, id), a
+    mesma ordem e o mesmo cursor da listagem ordenada do repositório.
+    """
+
+    @abstractmethod
+    def listar(
+        self,
+        limite: int | None = None,
+        apos: tuple[int, datetime, UUID] | None = None,
+    ) -> list[Pedido] | None:
+        """Pedidos após a posição ``apos``; None se a projeção não está pronta."""
+        pass
+
+    @abstractmethod
+    def aplicar(self, evento: EventoPedido) -> None:
+        pass
+
+    @abstractmethod
+    def invalidar(self) -> None:
+        """Eventos podem ter sido perdidos: recarrega tudo do banco."""
+        pass
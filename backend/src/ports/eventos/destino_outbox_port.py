@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+from src.domain.models.mensagem_outbox import MensagemOutbox
+
+
+class DestinoOutboxPort(ABC):
+    """Para onde o relay do outbox entrega as mensagens confirmadas.
+
+    ``publicar`` recebe um lote em ordem de id e deve levantar exceção se
+    não o entregou por completo: o lote inteiro é reenviado depois (a todos
+    os destinos), então os consumidores descartam ids já vistos.
+    """
+
+    @abstractmethod
+    def publicar(self, mensagens: list[MensagemOutbox]) -> None:
+        pass
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from src.domain.models.evento_pedido import EventoPedido
+
+
+class PublicadorEventosPort(ABC):
+    @abstractmethod
+    def publicar(self, evento: EventoPedido) -> None:
+        pass
+
+    def publicar_lote(self, eventos: list[EventoPedido]) -> None:
+        """Publica os eventos na ordem dada; adaptadores podem agrupá-los."""
+        for evento in eventos:
+            self.publicar(evento)
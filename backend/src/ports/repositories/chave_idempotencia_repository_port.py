@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.domain.models.chave_idempotencia import ChaveIdempotencia
+
+
+class ChaveIdempotenciaRepositoryPort(ABC):
+    @abstractmethod
+    def buscar(self, chave: str, criada_desde: datetime) -> ChaveIdempotencia | None:
+        pass
+
+    @abstractmethod
+    def reservar(self, chave: str, hash_requisicao: str, criada_desde: datetime) -> bool:
+        pass
+
+    @abstractmethod
+    def registrar_resposta(self, chave: str, resposta: str) -> None:
+        pass
+
+    @abstractmethod
+    def remover_expiradas(self, criadas_antes: datetime) -> int:
+        pass
@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
+from uuid import UUID
 
 from src.domain.models.cliente import Cliente
 
 
 class ClienteRepositoryPort(ABC):
+    @abstractmethod
+    def buscar_por_id(self, cliente_id: UUID) -> Cliente | None:
+        pass
+
     @abstractmethod
     def buscar_por_cpf(self, cpf: str) -> Cliente | None:
         pass
@@ -12,6 +17,10 @@ class ClienteRepositoryPort(ABC):
     def buscar_por_email(self, email: str) -> Cliente | None:
         pass
 
+    @abstractmethod
+    def obter_ou_criar(self, cpf: str | None, email: str | None, novo: Cliente | None) -> Cliente | None:
+        pass
+
     @abstractmethod
     def salvar(self, cliente: Cliente) -> Cliente:
         pass
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
 from uuid import UUID
 
 from src.domain.models.fila_pedidos import FilaPedidos
+from src.domain.models.status_pedido import StatusPedido
 
 
 class FilaPedidosRepositoryPort(ABC):
@@ -16,3 +18,26 @@ class FilaPedidosRepositoryPort(ABC):
     @abstractmethod
     def listar_em_aberto(self) -> list[FilaPedidos]:
         pass
+
+    @abstractmethod
+    def reservar(
+        self,
+        estacao: str,
+        quantidade: int,
+        duracao: timedelta,
+        status_preparo: StatusPedido,
+        status_origem: list[StatusPedido],
+    ) -> list[tuple[FilaPedidos, bool]]:
+        pass
+
+    @abstractmethod
+    def renovar_reserva(self, pedido_id: UUID, estacao: str, duracao: timedelta) -> datetime | None:
+        pass
+
+    @abstractmethod
+    def liberar(self, pedido_id: UUID, estacao: str) -> bool:
+        pass
+
+    @abstractmethod
+    def concluir(self, pedido_id: UUID, estacao: str) -> bool:
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from src.domain.models.mensagem_outbox import MensagemOutbox
+
+
+class OutboxRepositoryPort(ABC):
+    @abstractmethod
+    def adicionar(self, mensagens: list[MensagemOutbox]) -> None:
+        pass
+
+    @abstractmethod
+    def reservar_nao_publicadas(self, quantidade: int) -> list[MensagemOutbox]:
+        pass
+
+    @abstractmethod
+    def marcar_publicadas(self, ids: list[int]) -> None:
+        pass
+
+    @abstractmethod
+    def remover_publicadas(self, publicadas_antes: datetime) -> int:
+        pass
@@ -13,6 +13,14 @@ class PagamentoRepositoryPort(ABC):
     def buscar_por_pedido_id(self, pedido_id: UUID) -> Pagamento | None:
         pass
 
+    @abstractmethod
+    def buscar_status_por_pedido_id(self, pedido_id: UUID) -> str | None:
+        pass
+
+    @abstractmethod
+    def atualizar_status_por_pedido_id(self, pedido_id: UUID, status: str) -> bool:
+        pass
+
     @abstractmethod
     def buscar_por_id(self, pagamento_id: UUID) -> Pagamento | None:
         pass
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.models.pedido import Pedido
+from src.domain.models.status_pedido import StatusPedido
 
 
 class PedidoRepositoryPort(ABC):
@@ -14,17 +16,49 @@ class PedidoRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    def listar_ordenados(self) -> list[Pedido]:
+    def listar_ordenados(
+        self,
+        limite: int | None = None,
+        apos: tuple[int, datetime, UUID] | None = None,
+    ) -> list[Pedido]:
+        pass
+
+    @abstractmethod
+    def listar_em_aberto(self) -> list[Pedido]:
         pass
 
     @abstractmethod
     def buscar_por_id(self, pedido_id: UUID) -> Pedido | None:
         pass
 
+    @abstractmethod
+    def buscar_por_ids(self, pedido_ids: list[UUID]) -> list[Pedido]:
+        pass
+
+    @abstractmethod
+    def buscar_versao(self, pedido_id: UUID) -> int | None:
+        pass
+
     @abstractmethod
     def deletar(self, pedido_id: UUID) -> None:
         pass
 
+    @abstractmethod
+    def menor_versao_em_andamento(self) -> int:
+        pass
+
+    @abstractmethod
+    def listar_alterados(self, desde: int, apos_id: UUID | None, limite: int) -> list[Pedido]:
+        pass
+
+    @abstractmethod
+    def listar_removidos(self, desde: int, apos_id: UUID | None, limite: int) -> list[tuple[int, UUID]]:
+        pass
+
+    @abstractmethod
+    def remover_marcas_de_remocao(self, removidos_antes: datetime) -> int:
+        pass
+
     @abstractmethod
     def buscar_por_cliente(self, cliente_id: UUID) -> list[Pedido]:
         pass
@@ -32,3 +66,12 @@ class PedidoRepositoryPort(ABC):
     @abstractmethod
     def atualizar_status(self, pedido_id: UUID, status: str) -> Pedido:
         pass
+
+    @abstractmethod
+    def transicionar_status(
+        self,
+        pedido_id: UUID,
+        novo_status: StatusPedido,
+        status_origem: list[StatusPedido],
+    ) -> Pedido | None:
+        pass
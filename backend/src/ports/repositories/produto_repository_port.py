@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from uuid import UUID
 
 from src.domain.models.produto import Produto
 
@@ -16,6 +17,10 @@ class ProdutoRepositoryPort(ABC):
     def buscar_por_id(self, produto_id: str) -> Produto | None:
         pass
 
+    @abstractmethod
+    def buscar_por_ids(self, produto_ids: list[UUID]) -> list[Produto]:
+        pass
+
     @abstractmethod
     def deletar(self, produto_id: str) -> None:
         pass
@@ -0,0 +1,40 @@
+from abc import ABC, abstractmethod
+from typing import Callable
+
+from src.domain.models.evento_pagamento import EventoPagamento
+from src.domain.models.evento_pedido import EventoPedido
+
+
+class UnitOfWorkPort(ABC):
+    """Transação compartilhada pelos repositórios de uma mesma requisição.
+
+    Os repositórios apenas enviam suas alterações ao banco; quem confirma é o
+    caso de uso, chamando ``commit`` uma única vez ao final. Usado como
+    context manager, desfaz a transação se o bloco terminar com exceção.
+    Eventos registrados durante a transação só são publicados se ela for
+    confirmada, e entram no outbox na mesma transação. Ações registradas
+    com ``ao_encerrar`` rodam depois do commit ou do rollback.
+    """
+
+    def __enter__(self) -> "UnitOfWorkPort":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.rollback()
+
+    @abstractmethod
+    def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    def rollback(self) -> None:
+        pass
+
+    @abstractmethod
+    def registrar_evento(self, evento: EventoPedido | EventoPagamento) -> None:
+        pass
+
+    @abstractmethod
+    def ao_encerrar(self, acao: Callable[[], None]) -> None:
+        pass
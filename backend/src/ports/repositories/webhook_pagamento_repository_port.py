@@ -0,0 +1,27 @@
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from src.domain.models.webhook_pagamento import WebhookPagamento
+
+
+class WebhookPagamentoRepositoryPort(ABC):
+    @abstractmethod
+    def registrar(self, chave: str, status: str, pedido_id: UUID, payload: str) -> bool:
+        pass
+
+    @abstractmethod
+    def reservar_proxima(self, duracao: timedelta) -> WebhookPagamento | None:
+        pass
+
+    @abstractmethod
+    def marcar_processado(self, chave: str, status: str) -> bool:
+        pass
+
+    @abstractmethod
+    def registrar_falha(self, chave: str, status: str, erro: str, nova_tentativa_em: timedelta | None) -> None:
+        pass
+
+    @abstractmethod
+    def remover_processados(self, processados_antes: datetime) -> int:
+        pass
@@ -13,6 +13,14 @@ class PagamentoServicePort(ABC):
     def consultar_status_pagamento(self, pedido_id: UUID) -> StatusPagamentoResponse:
         pass
 
+    @abstractmethod
+    def buscar_status_pagamento(self, pedido_id: UUID) -> str | None:
+        pass
+
+    @abstractmethod
+    def receber_webhook(self, webhook_data: WebhookPagamentoDTO) -> dict:
+        pass
+
     @abstractmethod
     def processar_webhook(self, webhook_data: WebhookPagamentoDTO) -> dict:
         pass
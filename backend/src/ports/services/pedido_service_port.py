@@ -1,19 +1,30 @@
 from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
 from uuid import UUID
 
-from src.adapters.input.dto.pedido_dto import PedidoCreate, PedidoResponse, ItemPedidoDTO
+from src.adapters.input.dto.pedido_dto import AlteracoesPedidosResponse, PaginaPedidosResponse, PedidoCreate, PedidoReservadoResponse, PedidoResponse, ItemPedidoDTO
 from src.domain.models.pedido import StatusPedido
 
 
 class PedidoServicePort(ABC):
     @abstractmethod
-    def criar_pedido(self, pedido_create: PedidoCreate) -> PedidoResponse:
+    def criar_pedido(
+        self, pedido_create: PedidoCreate, chave_idempotencia: str | None = None
+    ) -> PedidoResponse:
         pass
 
     @abstractmethod
     def buscar_pedido_por_id(self, pedido_id: UUID) -> PedidoResponse | None:
         pass
 
+    @abstractmethod
+    def buscar_pedido_versionado(self, pedido_id: UUID) -> tuple[PedidoResponse, int | None]:
+        pass
+
+    @abstractmethod
+    def buscar_versao_pedido(self, pedido_id: UUID) -> int | None:
+        pass
+
     @abstractmethod
     def listar_pedidos(self) -> list[PedidoResponse]:
         pass
@@ -22,6 +33,20 @@ class PedidoServicePort(ABC):
     def listar_pedidos_ordenados(self) -> list[PedidoResponse]:
         pass
 
+    @abstractmethod
+    def listar_pedidos_ordenados_paginado(
+        self, limite: int, cursor: str | None = None
+    ) -> PaginaPedidosResponse:
+        pass
+
+    @abstractmethod
+    def listar_pedidos_em_aberto(self) -> list[PedidoResponse]:
+        pass
+
+    @abstractmethod
+    def listar_alteracoes(self, limite: int, cursor: str | None = None) -> AlteracoesPedidosResponse:
+        pass
+
     @abstractmethod
     def deletar_pedido(self, pedido_id: UUID) -> None:
         pass
@@ -41,3 +66,19 @@ class PedidoServicePort(ABC):
     @abstractmethod
     def adicionar_item_ao_pedido(self, pedido_id: UUID, item: ItemPedidoDTO) -> PedidoResponse:
         pass
+
+    @abstractmethod
+    def reservar_pedidos(self, estacao: str, quantidade: int, duracao: timedelta) -> list[PedidoReservadoResponse]:
+        pass
+
+    @abstractmethod
+    def renovar_reserva(self, pedido_id: UUID, estacao: str, duracao: timedelta) -> datetime:
+        pass
+
+    @abstractmethod
+    def liberar_reserva(self, pedido_id: UUID, estacao: str) -> None:
+        pass
+
+    @abstractmethod
+    def concluir_pedido_reservado(self, pedido_id: UUID, estacao: str) -> PedidoResponse:
+        pass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 
-from src.adapters.input.dto.produto_dto import ProdutoCreate, ProdutoResponse
+from src.adapters.input.dto.produto_dto import CatalogoSerializado, ProdutoCreate, ProdutoResponse
 
 
 class ProdutoServicePort(ABC):
@@ -12,6 +12,10 @@ class ProdutoServicePort(ABC):
     def listar_produtos(self) -> list[ProdutoResponse]:
         pass
 
+    @abstractmethod
+    def catalogo_serializado(self) -> CatalogoSerializado:
+        pass
+
     @abstractmethod
     def buscar_produto(self, produto_id: str) -> ProdutoResponse | None:
         pass
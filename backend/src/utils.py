@@ -5,6 +5,8 @@ Este módulo contém funções auxiliares e utilitários utilizados
 em diferentes partes da aplicação.
 """
 
+import base64
+import json
 import re
 from typing import List
 from datetime import datetime
@@ -91,4 +93,40 @@ def generate_order_number() -> str:
         String com o número do pedido
     """
     timestamp = get_current_timestamp()
-    return f"PED{timestamp.strftime('%Y%m%d%H%M%S')}" 
\ No newline at end of file
+    return f"PED{timestamp.strftime('%Y%m%d%H%M%S')}" 
+
+def encode_cursor(data: dict) -> str:
+    """
+    Codifica a posição de uma paginação em um cursor opaco.
+    
+    Args:
+        data: Valores serializáveis em JSON que identificam a posição
+        
+    Returns:
+        Cursor em base64 seguro para URL
+    """
+    raw = json.dumps(data, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str) -> dict:
+    """
+    Decodifica um cursor gerado por encode_cursor.
+    
+    Args:
+        cursor: Cursor recebido do cliente
+        
+    Returns:
+        Valores da posição
+        
+    Raises:
+        ValueError: Se o cursor estiver malformado
+    """
+    try:
+        padding = '=' * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Cursor inválido") from e
+    if not isinstance(data, dict):
+        raise ValueError("Cursor inválido")
+    return data
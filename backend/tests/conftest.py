@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Os testes importam o pacote ``src`` como a aplicação (a partir de backend/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,89 @@
+"""Quantidade de comandos SQL das listagens do PedidoRepository.
+
+Usa o banco de DATABASE_URL (com as migrations aplicadas); tudo roda numa
+transação desfeita ao final. Sem banco acessível, os testes são pulados.
+"""
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from src.adapters.output.repositories.pedido_repository import PedidoRepository
+from src.infrastructure.db.session import engine
+
+
+@pytest.fixture
+def db():
+    try:
+        conexao = engine.connect()
+    except OperationalError as e:
+        pytest.skip(f"Banco indisponível: {e}")
+    transacao = conexao.begin()
+    sessao = Session(bind=conexao, join_transaction_mode="create_savepoint")
+    try:
+        yield sessao
+    finally:
+        sessao.close()
+        transacao.rollback()
+        conexao.close()
+
+
+def _criar_pedidos(db: Session, quantidade: int) -> uuid.UUID:
+    cliente_id = uuid.uuid4()
+    db.execute(text("INSERT INTO tb_clientes (id, nome) VALUES (:id, 'Cliente')"), {"id": cliente_id})
+    produtos = [uuid.uuid4() for _ in range(3)]
+    for numero, produto_id in enumerate(produtos):
+        db.execute(
+            text("INSERT INTO tb_produtos (id, nome, categoria, preco) VALUES (:id, :nome, 'lanche', 10)"),
+            {"id": produto_id, "nome": f"Produto teste {numero} {produto_id}"},
+        )
+    inicio = datetime(2025, 1, 1)
+    for numero in range(quantidade):
+        pedido_id = uuid.uuid4()
+        db.execute(
+            text("INSERT INTO tb_pedidos (id, cliente_id, status, data_criacao) VALUES (:id, :cliente, 'Recebido', :data)"),
+            {"id": pedido_id, "cliente": cliente_id, "data": inicio + timedelta(minutes=numero)},
+        )
+        for produto_id in produtos[: numero % len(produtos) + 1]:
+            db.execute(
+                text("INSERT INTO tb_itens_pedido (pedido_id, produto_id, quantidade) VALUES (:pedido, :produto, 1)"),
+                {"pedido": pedido_id, "produto": produto_id},
+            )
+    return cliente_id
+
+
+def _contar_comandos(db: Session, consulta) -> int:
+    comandos = []
+
+    def registrar(conn, cursor, statement, parameters, context, executemany):
+        comandos.append(statement)
+
+    event.listen(engine, "before_cursor_execute", registrar)
+    try:
+        consulta(PedidoRepository(db))
+    finally:
+        event.remove(engine, "before_cursor_execute", registrar)
+    return len(comandos)
+
+
+@pytest.mark.parametrize(
+    "listagem",
+    [
+        pytest.param(lambda repo, cliente_id: repo.listar(), id="listar"),
+        pytest.param(lambda repo, cliente_id: repo.listar_ordenados(), id="listar_ordenados"),
+        pytest.param(lambda repo, cliente_id: repo.buscar_por_cliente(cliente_id), id="buscar_por_cliente"),
+    ],
+)
+def test_listagem_usa_numero_fixo_de_comandos(db, listagem):
+    comandos = {}
+    for quantidade in (1, 50):
+        savepoint = db.begin_nested()
+        cliente_id = _criar_pedidos(db, quantidade)
+        db.expunge_all()
+        comandos[quantidade] = _contar_comandos(db, lambda repo: listagem(repo, cliente_id))
+        savepoint.rollback()
+
+    assert comandos[1] == comandos[50]
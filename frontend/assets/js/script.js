@@ -152,11 +152,24 @@ const API = {
         return await this.request(CONFIG.ENDPOINTS.PRODUCTS);
     },
 
-    async createOrder(orderData) {
-        return await this.request(CONFIG.ENDPOINTS.ORDERS, {
+    async createOrder(orderData, idempotencyKey = crypto.randomUUID()) {
+        // Mesma chave em todas as tentativas: o backend devolve o pedido já
+        // criado em vez de duplicá-lo se a primeira resposta se perdeu
+        const options = {
             method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+                'Idempotency-Key': idempotencyKey
+            },
             body: JSON.stringify(orderData)
-        });
+        };
+        try {
+            return await this.request(CONFIG.ENDPOINTS.ORDERS, options);
+        } catch (error) {
+            if (!error.message.includes('Erro de conexão')) throw error;
+            console.log('🔁 Reenviando pedido com a mesma Idempotency-Key');
+            return await this.request(CONFIG.ENDPOINTS.ORDERS, options);
+        }
     },
 
     async createCustomer(customerData) {
@@ -166,12 +179,26 @@ const API = {
         });
     },
 
+    // Percorre a listagem paginada por cursor e devolve todos os pedidos
+    async requestAllPages(endpoint) {
+        const orders = [];
+        let cursor = null;
+        do {
+            const params = new URLSearchParams({ limite: 100 });
+            if (cursor) params.set('cursor', cursor);
+            const page = await this.request(`${endpoint}?${params}`);
+            orders.push(...page.itens);
+            cursor = page.proximo_cursor;
+        } while (cursor);
+        return orders;
+    },
+
     async getOrders() {
-        return await this.request(CONFIG.ENDPOINTS.ADMIN_ORDERS);
+        return await this.requestAllPages(CONFIG.ENDPOINTS.ADMIN_ORDERS);
     },
 
     async getPublicOrders() {
-        return await this.request(CONFIG.ENDPOINTS.ORDERS);
+        return await this.requestAllPages(CONFIG.ENDPOINTS.ORDERS);
     },
 
     async getCustomerByCPF(cpf) {
@@ -1514,18 +1541,47 @@ const OrdersPanel = {
     },
 
     startAutoRefresh() {
-        // Atualizar painel a cada 20 segundos
+        // Mudanças chegam por SSE; com o stream fora do ar o polling é de 20s,
+        // e com ele conectado uma recarga a cada 2 min cobre o que não gera evento
+        this.connectStream();
         setInterval(() => {
-            if (window.location.hash === '#orders-panel') {
+            if (window.location.hash !== '#orders-panel') return;
+            const intervalo = this.streamConnected ? 120000 : 20000;
+            if (!this.lastLoad || Date.now() - this.lastLoad >= intervalo) {
                 this.loadOrdersPanel();
             }
         }, 20000); // 20 segundos
     },
 
+    connectStream() {
+        if (!window.EventSource) return;
+
+        const reload = Utils.debounce(() => {
+            if (window.location.hash === '#orders-panel') {
+                this.loadOrdersPanel();
+            }
+        }, 500);
+
+        const source = new EventSource(`${CONFIG.API_BASE_URL}${CONFIG.ENDPOINTS.ORDERS}stream`);
+        // 'pronto' também chega após cada reconexão: recarrega o que pode ter mudado
+        source.addEventListener('pronto', () => {
+            this.streamConnected = true;
+            reload();
+        });
+        source.addEventListener('status', reload);
+        source.addEventListener('removido', reload);
+        source.addEventListener('resync', reload);
+        source.onerror = () => {
+            // O EventSource reconecta sozinho; até lá, volta o polling
+            this.streamConnected = false;
+        };
+    },
+
     async loadOrdersPanel() {
         try {
             console.log('📊 Carregando painel de pedidos...');
             console.log('📊 Hash atual:', window.location.hash);
+            this.lastLoad = Date.now();
             const orders = await API.getPublicOrders();
             console.log('📊 Pedidos recebidos:', orders);
             this.updateStats(orders);